@@ -25,20 +25,39 @@ if TYPE_CHECKING:
 class ShowPartial(Animation, ABC):
     """
     Abstract class for ShowCreation and ShowPassingFlash
+
+    With gpu_partial set to True, VMobjects keep their full points
+    throughout, and only the shaders restrict what is drawn, which
+    avoids recomputing and re-uploading the points every frame.
+    This is always the case for dashed VMobjects, since their dashes
+    are laid out along the full path.
     """
-    def __init__(self, mobject: Mobject, should_match_start: bool = False, **kwargs):
+    def __init__(
+        self,
+        mobject: Mobject,
+        should_match_start: bool = False,
+        gpu_partial: bool = False,
+        **kwargs
+    ):
         self.should_match_start = should_match_start
+        self.gpu_partial = gpu_partial
         super().__init__(mobject, **kwargs)
 
+    def uses_gpu_partial(self, submob: Mobject) -> bool:
+        return isinstance(submob, VMobject) and (self.gpu_partial or submob.is_dashed())
+
     def interpolate_submobject(
         self,
         submob: VMobject,
         start_submob: VMobject,
         alpha: float
     ) -> None:
-        submob.pointwise_become_partial(
-            start_submob, *self.get_bounds(alpha)
-        )
+        if self.uses_gpu_partial(submob):
+            submob.set_partial_bounds(*self.get_bounds(alpha))
+        else:
+            submob.pointwise_become_partial(
+                start_submob, *self.get_bounds(alpha)
+            )
 
     @abstractmethod
     def get_bounds(self, alpha: float) -> tuple[float, float]:
@@ -81,12 +100,15 @@ class DrawBorderThenFill(Animation):
         stroke_color: ManimColor = None,
         draw_border_animation_config: dict = {},
         fill_animation_config: dict = {},
+        # See ShowPartial
+        gpu_partial: bool = False,
         **kwargs
     ):
         assert isinstance(vmobject, VMobject)
         self.sm_to_index = {hash(sm): 0 for sm in vmobject.get_family()}
         self.stroke_width = stroke_width
         self.stroke_color = stroke_color
+        self.gpu_partial = gpu_partial
         self.draw_border_animation_config = draw_border_animation_config
         self.fill_animation_config = fill_animation_config
         super().__init__(
@@ -107,6 +129,10 @@ class DrawBorderThenFill(Animation):
         super().finish()
         self.mobject.refresh_joint_angles()
 
+    def uses_gpu_partial(self, submob: VMobject) -> bool:
+        # See ShowPartial
+        return self.gpu_partial or submob.is_dashed()
+
     def get_outline(self) -> VMobject:
         outline = self.mobject.copy()
         outline.set_fill(opacity=0)
@@ -132,11 +158,16 @@ class DrawBorderThenFill(Animation):
 
         if index == 1 and self.sm_to_index[hash(submob)] == 0:
             # First time crossing over
-            submob.set_data(outline.data)
+            submob.set_data(outline._data)
+            if self.uses_gpu_partial(submob):
+                submob.set_partial_bounds(0, 1)
             self.sm_to_index[hash(submob)] = 1
 
         if index == 0:
-            submob.pointwise_become_partial(outline, 0, subalpha)
+            if self.uses_gpu_partial(submob):
+                submob.set_partial_bounds(0, subalpha)
+            else:
+                submob.pointwise_become_partial(outline, 0, subalpha)
         else:
             submob.interpolate(outline, start, subalpha)
 
@@ -38,7 +38,7 @@ class FadeIn(Fade):
 
     def create_starting_mobject(self) -> Mobject:
         start = super().create_starting_mobject()
-        start.set_opacity(0)
+        start.set_opacity_multiplier(0)
         start.scale(1.0 / self.scale_factor)
         start.shift(-self.shift_vect)
         return start
@@ -62,7 +62,7 @@ class FadeOut(Fade):
 
     def create_target(self) -> Mobject:
         result = self.mobject.copy()
-        result.set_opacity(0)
+        result.set_opacity_multiplier(0)
         result.shift(self.shift_vect)
         result.scale(self.scale_factor)
         return result
@@ -149,7 +149,8 @@ class FadeTransformPieces(FadeTransform):
 
 class VFadeIn(Animation):
     """
-    VFadeIn and VFadeOut only work for VMobjects,
+    Unlike FadeIn, VFadeIn and VFadeOut leave the points of a mobject
+    alone, so they can be used on mobjects being changed by updaters
     """
     def __init__(self, vmobject: VMobject, suspend_mobject_updating: bool = False, **kwargs):
         super().__init__(
@@ -164,11 +165,8 @@ class VFadeIn(Animation):
         start: VMobject,
         alpha: float
     ) -> None:
-        submob.set_stroke(
-            opacity=interpolate(0, start.get_stroke_opacity(), alpha)
-        )
-        submob.set_fill(
-            opacity=interpolate(0, start.get_fill_opacity(), alpha)
+        submob.uniforms["opacity_multiplier"] = interpolate(
+            0, start.get_opacity_multiplier(), alpha
         )
 
 
@@ -188,7 +188,10 @@ class ShowPassingFlash(ShowPartial):
     def finish(self) -> None:
         super().finish()
         for submob, start in self.get_all_families_zipped():
-            submob.pointwise_become_partial(start, 0, 1)
+            if self.uses_gpu_partial(submob):
+                submob.set_partial_bounds(0, 1)
+            else:
+                submob.pointwise_become_partial(start, 0, 1)
 
 
 class VShowPassingFlash(Animation):
@@ -217,7 +220,7 @@ class VShowPassingFlash(Animation):
         # which tapers out at either end
         self.submob_to_widths = dict()
         for sm in self.mobject.get_family():
-            widths = sm.get_stroke_widths()
+            widths = sm._data["stroke_width"][:, 0]
             self.submob_to_widths[hash(sm)] = np.array([
                 width * self.taper_kernel(x)
                 for width, x in zip(widths, np.linspace(0, 1, len(widths)))
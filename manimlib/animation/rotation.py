@@ -46,7 +46,8 @@ class Rotating(Animation):
         )
         for sm1, sm2 in pairs:
             for key in sm1.pointlike_data_keys:
-                sm1.data[key][:] = sm2.data[key]
+                sm1.data[key][:] = sm2._data[key]
+            sm1.set_uniforms({"model_matrix": sm2.uniforms["model_matrix"]})
         self.mobject.rotate(
             self.rate_func(self.time_spanned_alpha(alpha)) * self.angle,
             axis=self.axis,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-import itertools as it
 from difflib import SequenceMatcher
+import heapq
+import itertools as it
+
+import numpy as np
 
 from manimlib.animation.composition import AnimationGroup
 from manimlib.animation.fading import FadeInFromPoint
@@ -38,34 +41,40 @@ class TransformMatchingParts(AnimationGroup):
 
         # We will progressively build up a list of transforms
         # from pieces in source to those in target. These
-        # two lists keep track of which pieces are accounted
-        # for so far
-        self.source_pieces = source.family_members_with_points()
-        self.target_pieces = target.family_members_with_points()
+        # two dicts, used as ordered sets, keep track of which
+        # pieces are not yet accounted for
+        self.source_pieces = dict.fromkeys(source.family_members_with_points())
+        self.target_pieces = dict.fromkeys(target.family_members_with_points())
         self.anims = []
 
         for pair in matched_pairs:
             self.add_transform(*pair)
 
         # Match any pairs with the same shape
-        for pair in self.find_pairs_with_matching_shapes(self.source_pieces, self.target_pieces):
+        shape_pairs = self.find_pairs_with_matching_shapes(
+            list(self.source_pieces), list(self.target_pieces)
+        )
+        for pair in shape_pairs:
             self.add_transform(*pair)
 
         # Finally, account for mismatches
-        for source_piece in self.source_pieces:
-            if any([source_piece in anim.mobject.get_family() for anim in self.anims]):
+        animated = set(it.chain(*(anim.mobject.get_family() for anim in self.anims)))
+        for source_piece in list(self.source_pieces):
+            if source_piece in animated:
                 continue
             self.anims.append(FadeOutToPoint(
                 source_piece, target.get_center(),
                 **self.anim_config
             ))
-        for target_piece in self.target_pieces:
-            if any([target_piece in anim.mobject.get_family() for anim in self.anims]):
+            animated.update(self.anims[-1].mobject.get_family())
+        for target_piece in list(self.target_pieces):
+            if target_piece in animated:
                 continue
             self.anims.append(FadeInFromPoint(
                 target_piece, source.get_center(),
                 **self.anim_config
             ))
+            animated.update(self.anims[-1].mobject.get_family())
 
         super().__init__(
             *self.anims,
@@ -94,19 +103,64 @@ class TransformMatchingParts(AnimationGroup):
 
         self.anims.append(transform_type(source, target, **self.anim_config))
         for char in new_source_pieces:
-            self.source_pieces.remove(char)
+            self.source_pieces.pop(char)
         for char in new_target_pieces:
-            self.target_pieces.remove(char)
+            self.target_pieces.pop(char)
 
     def find_pairs_with_matching_shapes(
         self,
         chars1: list[Mobject],
         chars2: list[Mobject]
     ) -> list[tuple[Mobject, Mobject]]:
+        """
+        Pairs each of chars1 in turn with the first of chars2 which has the
+        same shape and isn't already paired, see Mobject.has_same_shape_as
+        """
+        # Pieces with the same shape have the same number of points, and
+        # normalized points within the tolerance of has_same_shape_as, so
+        # also nearby means.  Rounding those means to a grid at least as
+        # coarse as that tolerance, any match for a piece lies in its own
+        # cell or a neighboring one, and only those need checking
+        def get_normalized_points(char):
+            return (char.get_all_points() - char.get_center()) / char.get_height()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            points1 = list(map(get_normalized_points, chars1))
+            points2 = list(map(get_normalized_points, chars2))
+        max_norm = max((np.abs(p).max(initial=0) for p in points2 if np.isfinite(p).all()), default=0)
+        max_atol = max((char.get_width() * 1e-2 for char in chars1), default=0)
+        # Doubled to leave room for rounding
+        grid_size = max(2 * (max_atol + 1e-5 * max_norm), 1e-8)
+
+        def get_signature(points):
+            center = points[:, :2].mean(0) if len(points) > 0 else np.zeros(2)
+            if not np.isfinite(center).all():
+                # Such pieces only ever match each other
+                return (len(points), None)
+            return (len(points), tuple((center // grid_size).astype(int)))
+
+        buckets = dict()
+        signatures2 = list(map(get_signature, points2))
+        for index, signature in enumerate(signatures2):
+            buckets.setdefault(signature, []).append(index)
+
         result = []
-        for char1, char2 in it.product(chars1, chars2):
-            if char1.has_same_shape_as(char2):
-                result.append((char1, char2))
+        for char1, signature in zip(chars1, map(get_signature, points1)):
+            n_points, cell = signature
+            if cell is None:
+                nearby = [signature]
+            else:
+                nearby = [
+                    (n_points, (cell[0] + dx, cell[1] + dy))
+                    for dx in (-1, 0, 1)
+                    for dy in (-1, 0, 1)
+                ]
+            candidates = heapq.merge(*(buckets[sig] for sig in nearby if sig in buckets))
+            for index in candidates:
+                if char1.has_same_shape_as(chars2[index]):
+                    result.append((char1, chars2[index]))
+                    buckets[signatures2[index]].remove(index)
+                    break
         return result
 
     def clean_up_from_scene(self, scene: Scene) -> None:
@@ -232,14 +232,14 @@ class CameraFrame(Mobject):
 
     def get_center(self) -> np.ndarray:
         # Assumes first point is at the center
-        return self.get_points()[0]
+        return self._read_points()[0]
 
     def get_width(self) -> float:
-        points = self.get_points()
+        points = self._read_points()
         return points[2, 0] - points[1, 0]
 
     def get_height(self) -> float:
-        points = self.get_points()
+        points = self._read_points()
         return points[4, 1] - points[3, 1]
 
     def get_focal_distance(self) -> float:
@@ -22,9 +22,9 @@ from manimlib.mobject.types.dot_cloud import DotCloud
 from manimlib.mobject.types.surface import ParametricSurface
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import interpolate
 from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.dict_ops import merge_dicts_recursively
-from manimlib.utils.simple_functions import binary_search
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotate_vector
@@ -230,19 +230,20 @@ class CoordinateSystem(ABC):
     ) -> Vect3 | None:
         if hasattr(graph, "underlying_function"):
             return self.coords_to_point(x, graph.underlying_function(x))
-        else:
-            alpha = binary_search(
-                function=lambda a: self.point_to_coords(
-                    graph.quick_point_from_proportion(a)
-                )[0],
-                target=x,
-                lower_bound=self.x_range[0],
-                upper_bound=self.x_range[1],
-            )
-            if alpha is not None:
-                return graph.quick_point_from_proportion(alpha)
-            else:
+        # Sample the graph, then resample within the first interval
+        # where its x coordinate crosses x
+        lower, upper = 0.0, 1.0
+        for n in range(2):
+            alphas = np.linspace(lower, upper, 101)
+            xs = self.point_to_coords(graph.points_from_proportions(alphas))[0]
+            crossings = np.flatnonzero((xs[:-1] - x) * (xs[1:] - x) <= 0)
+            if len(crossings) == 0:
                 return None
+            index = crossings[0]
+            lower, upper = alphas[index:index + 2]
+        x0, x1 = xs[index:index + 2]
+        sub_alpha = inverse_interpolate(x0, x1, x) if x0 != x1 else 0
+        return graph.point_from_proportion(interpolate(lower, upper, sub_alpha))
 
     def i2gp(self, x: float, graph: ParametricCurve) -> Vect3 | None:
         """
@@ -261,7 +262,7 @@ class CoordinateSystem(ABC):
         Use for graphing functions which might change over time, or change with
         conditions
         """
-        x_values = np.array([self.x_axis.p2n(p) for p in graph.get_points()])
+        x_values = np.array([self.x_axis.p2n(p) for p in graph._read_points()])
 
         def get_graph_points():
             xs = x_values
@@ -9,7 +9,6 @@ from manimlib.constants import RED, BLACK, DEFAULT_MOBJECT_COLOR, DEFAULT_LIGHT_
 from manimlib.constants import MED_SMALL_BUFF, SMALL_BUFF
 from manimlib.constants import DEG, PI, TAU
 from manimlib.mobject.mobject import Mobject
-from manimlib.mobject.types.vectorized_mobject import DashedVMobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
@@ -180,10 +179,10 @@ class TipableVMobject(VMobject):
         return self.tip_length
 
     def get_first_handle(self) -> Vect3:
-        return self.get_points()[1]
+        return self._read_points()[1].copy()
 
     def get_last_handle(self) -> Vect3:
-        return self.get_points()[-2]
+        return self._read_points()[-2].copy()
 
     def get_end(self) -> Vect3:
         if self.has_tip():
@@ -250,7 +249,7 @@ class Arc(TipableVMobject):
         anchors, and finds their intersection points
         """
         # First two anchors and handles
-        a1, h, a2 = self.get_points()[:3]
+        a1, h, a2 = self._read_points()[:3]
         # Tangent vectors
         t1 = h - a1
         t2 = h - a2
@@ -817,15 +816,10 @@ class DashedLine(Line):
         **kwargs
     ):
         super().__init__(start, end, **kwargs)
-
+        # Dashes are drawn by the shaders, see VMobject.set_dashes, until
+        # something treats the line as a group of dashes, see DashedVMobject
         num_dashes = self.calculate_num_dashes(dash_length, positive_space_ratio)
-        dashes = DashedVMobject(
-            self,
-            num_dashes=num_dashes,
-            positive_space_ratio=positive_space_ratio
-        )
-        self.clear_points()
-        self.add(*dashes)
+        self.set_dashes(num_dashes, positive_space_ratio)
 
     def calculate_num_dashes(self, dash_length: float, positive_space_ratio: float) -> int:
         try:
@@ -834,6 +828,14 @@ class DashedLine(Line):
         except ZeroDivisionError:
             return 1
 
+    def split(self) -> list[VMobject]:
+        self.break_into_dashes()
+        return super().split()
+
+    def __len__(self) -> int:
+        # As with DashedVMobject, this doesn't break out the dashes
+        return len(self.submobjects)
+
     def get_start(self) -> Vect3:
         if len(self.submobjects) > 0:
             return self.submobjects[0].get_start()
@@ -850,10 +852,16 @@ class DashedLine(Line):
         return self.get_start(), self.get_end()
 
     def get_first_handle(self) -> Vect3:
-        return self.submobjects[0].get_points()[1]
+        if len(self.submobjects) > 0:
+            return self.submobjects[0]._read_points()[1].copy()
+        else:
+            return self.get_dashes()[0]._read_points()[1]
 
     def get_last_handle(self) -> Vect3:
-        return self.submobjects[-1].get_points()[-2]
+        if len(self.submobjects) > 0:
+            return self.submobjects[-1]._read_points()[-2].copy()
+        else:
+            return self.get_dashes()[-1]._read_points()[-2]
 
 
 class TangentLine(Line):
@@ -887,7 +895,7 @@ class TangentLine(Line):
     ):
         a1 = clip(alpha - d_alpha, 0, 1)
         a2 = clip(alpha + d_alpha, 0, 1)
-        super().__init__(vmob.pfp(a1), vmob.pfp(a2), **kwargs)
+        super().__init__(*vmob.points_from_proportions([a1, a2]), **kwargs)
         self.scale(length / self.get_length())
 
 
@@ -1180,11 +1188,11 @@ class Arrow(Line):
         return self
 
     def get_start(self) -> Vect3:
-        points = self.get_points()
+        points = self._read_points()
         return 0.5 * (points[0] + points[-3])
 
     def get_end(self) -> Vect3:
-        return self.get_points()[self.tip_index]
+        return self._read_points()[self.tip_index].copy()
 
     def get_start_and_end(self):
         return (self.get_start(), self.get_end())
@@ -1441,7 +1449,7 @@ class ArrowTip(Triangle):
         return self.point_from_proportion(0.5)
 
     def get_tip_point(self) -> Vect3:
-        return self.get_points()[0]
+        return self._read_points()[0].copy()
 
     def get_vector(self) -> Vect3:
         return self.get_tip_point() - self.get_base()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import copy
+from functools import lru_cache
 from functools import wraps
+import hashlib
 import itertools as it
 import os
 import pickle
@@ -39,8 +41,11 @@ from manimlib.utils.iterables import resize_with_interpolation
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.paths import straight_path
+from manimlib.utils import serialization
 from manimlib.utils.shaders import get_colormap_code
+from manimlib.utils.shaders import pack_vertex_data
 from manimlib.utils.space_ops import angle_of_vector
+from manimlib.utils.space_ops import get_affine_matrix
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotation_matrix_transpose
 
@@ -61,10 +66,16 @@ if TYPE_CHECKING:
     Updater = Union[TimeBasedUpdater, NonTimeUpdater]
 
 
+# Source of the values of Mobject._data_version, see Mobject._note_data_written
+DATA_VERSIONS = it.count()
+
 class Mobject(object):
     """
     Mathematical Object
     """
+    # Bumped on any change to parent/child relations, which
+    # invalidates all cached lists of ancestors
+    _hierarchy_version: int = 0
     dim: int = 3
     shader_folder: str = ""
     render_primitive: int = moderngl.TRIANGLE_STRIP
@@ -73,6 +84,9 @@ class Mobject(object):
         ('point', np.float32, (3,)),
         ('rgba', np.float32, (4,)),
     ])
+    # Optional more compact layout for the data sent to the gpu, where
+    # uint8 fields hold normalized values, see use_packed_vertex_data
+    packed_data_dtype: Optional[np.dtype] = None
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
 
@@ -99,16 +113,32 @@ class Mobject(object):
         self.submobjects: list[Mobject] = []
         self.parents: list[Mobject] = []
         self.family: list[Mobject] | None = [self]
+        self._family_with_points: list[Mobject] | None = None
+        self._ancestor_lists: dict[bool, list[Mobject]] = dict()
+        self._ancestors_version: int = -1
         self.locked_data_keys: set[str] = set()
         self.const_data_keys: set[str] = set()
+        self._unlocked_data_keys: tuple[tuple[str, ...], list[str]] | None = None
+        self._locked_data_matches: bool = True
         self.locked_uniform_keys: set[str] = set()
         self.saved_state = None
         self.target = None
         self.bounding_box: Vect3Array = np.zeros((3, 3))
         self.shader_wrapper: Optional[ShaderWrapper] = None
+        # Data versions of the batch whose data shader_wrapper last read in
+        self._shader_data_versions: list[int] = []
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
+        self._bounding_box_is_empty: bool = True
         self._data_has_changed: bool = True
+        self._model_root: Optional[Mobject] = None
+        self._has_model_transform: bool = False
+        self._use_packed_data: bool = False
+        self._use_family_arena: bool = False
+        self._arena: Optional[np.ndarray] = None
+        self._arena_boxes: Optional[np.ndarray] = None
+        self._arena_members: list[Mobject] = []
+        self._arena_root: Optional[Mobject] = None
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -126,6 +156,16 @@ class Mobject(object):
     def __str__(self):
         return self.__class__.__name__
 
+    def __getstate__(self):
+        # Gpu resources can't be copied or pickled, and are rebuilt
+        # the next time this gets rendered
+        state = self.__dict__.copy()
+        state["shader_wrapper"] = None
+        state["shader_wrappers"] = []
+        state["_shader_data_versions"] = []
+        state["_data_has_changed"] = True
+        return state
+
     def __add__(self, other: Mobject) -> Mobject:
         assert isinstance(other, Mobject)
         return self.get_group_class()(self, other)
@@ -135,14 +175,88 @@ class Mobject(object):
         return self.replicate(other)
 
     def init_data(self, length: int = 0):
-        self.data = np.zeros(length, dtype=self.data_dtype)
-        self._data_defaults = np.ones(1, dtype=self.data.dtype)
+        self._data = np.zeros(length, dtype=self.data_dtype)
+        # Number of mobjects sharing self._data, see Mobject.copy
+        self._data_refs = [1]
+        self._data_digest: Optional[bytes] = None
+        self._data_version: int = next(DATA_VERSIONS)
+        self._data_defaults = np.ones(1, dtype=self.data_dtype)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The data, for writing to.  Data shared with copies is read-only, and
+        only duplicated once something asks for it here.  Since anything
+        accessing it this way may write to it, this invalidates whatever is
+        cached on the data, so code which only reads should use self._data,
+        or _read_points, instead.
+        """
+        if not self._data.flags.writeable:
+            self._own_data()
+        self._note_data_written()
+        return self._data
+
+    @data.setter
+    def data(self, data: np.ndarray):
+        if data is self._data:
+            return
+        if (len(data) == 0) != (len(self._data) == 0):
+            self._refresh_family_with_points()
+        self._data_refs[0] -= 1
+        self._data = data
+        self._data_refs = [1]
+        self._note_data_written()
+
+    def _note_data_written(self) -> None:
+        # Each write gives data a new version, which is distinct across all
+        # mobjects, so that rendering can tell whose data must be sent again
+        self._data_digest = None
+        self._data_version = next(DATA_VERSIONS)
+
+    def _own_data(self) -> Self:
+        if self._data_refs[0] > 1:
+            self._data_refs[0] -= 1
+            self._data = self._data.copy()
+            self._data_refs = [1]
+            return self
+        try:
+            self._data.flags.writeable = True
+        except ValueError:
+            # Read-only views of other arrays can't be made writeable
+            self._data = self._data.copy()
+        return self
+
+    def _write_data_if_changed(self, key: str, values: np.ndarray, index=slice(None)) -> Self:
+        # For derived data refreshed on render, skip writes which change
+        # nothing so that data shared with a copy stays shared
+        current = self._data[key][index]
+        if not (current == np.asarray(values).astype(current.dtype)).all():
+            self.data[key][index] = values
+        return self
+
+    def _share_data(self, mobject: Mobject) -> Self:
+        # Make self point to the same (read-only) data as mobject
+        # until either one of them writes to it
+        if (len(mobject._data) == 0) != (len(self._data) == 0):
+            self._refresh_family_with_points()
+        self._data_refs[0] -= 1
+        mobject._data_refs[0] += 1
+        mobject._data.flags.writeable = False
+        self._data = mobject._data
+        self._data_refs = mobject._data_refs
+        self._data_digest = mobject._data_digest
+        self._data_version = mobject._data_version
+        return self
 
     def init_uniforms(self):
         self.uniforms: UniformDict = {
             "is_fixed_in_frame": 0.0,
             "shading": np.array(self.shading, dtype=float),
             "clip_plane": np.zeros(4),
+            # Stored transposed, matching the column-major layout expected by glsl
+            "model_matrix": np.identity(4),
+            "opacity_multiplier": 1.0,
+            "tint": np.zeros(4),
         }
 
     def init_colors(self):
@@ -157,6 +271,10 @@ class Mobject(object):
             if isinstance(value, np.ndarray):
                 value = value.copy()
             self.uniforms[key] = value
+        if "model_matrix" in uniforms:
+            self._has_model_transform = not np.array_equal(
+                self.uniforms["model_matrix"], np.identity(4)
+            )
         return self
 
     @property
@@ -204,6 +322,7 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._note_data_written()
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
@@ -231,7 +350,7 @@ class Mobject(object):
     # Only these methods should directly affect points
     @affects_data
     def set_data(self, data: np.ndarray) -> Self:
-        assert data.dtype == self.data.dtype
+        assert data.dtype == self._data.dtype
         self.resize_points(len(data))
         self.data[:] = data
         return self
@@ -242,13 +361,15 @@ class Mobject(object):
         new_length: int,
         resize_func: Callable[[np.ndarray, int], np.ndarray] = resize_array
     ) -> Self:
+        self.fold_model_matrix()
         if new_length == 0:
-            if len(self.data) > 0:
-                self._data_defaults[:1] = self.data[:1]
+            if len(self._data) > 0:
+                self._data_defaults[:1] = self._data[:1]
         elif self.get_num_points() == 0:
             self.data = self._data_defaults.copy()
 
-        self.data = resize_func(self.data, new_length)
+        if new_length != len(self._data):
+            self.data = resize_func(self._data, new_length)
         self.refresh_bounding_box()
         return self
 
@@ -275,21 +396,70 @@ class Mobject(object):
             mob.data[:] = mob.data[::-1]
         return self
 
-    @affects_family_data
     def apply_points_function(
         self,
         func: Callable[[np.ndarray], np.ndarray],
         about_point: Vect3 | None = None,
         about_edge: Vect3 = ORIGIN,
-        works_on_bounding_box: bool = False
+        works_on_bounding_box: bool = False,
+        affine_matrix: np.ndarray | None = None,
     ) -> Self:
+        """
+        If func is a similarity transform, its 4x4 matrix can be passed in
+        as affine_matrix, so that mobjects using a model matrix accumulate
+        it there rather than rewriting their points.
+        """
+        if affine_matrix is not None and (affine_matrix == np.identity(4)).all():
+            # Nothing would change, and leaving the data untouched keeps it
+            # shared with any copies
+            return self
         if about_point is None and about_edge is not None:
             about_point = self.get_bounding_box_point(about_edge)
 
-        for mob in self.get_family():
-            arrs = [mob.data[key] for key in mob.pointlike_data_keys if mob.has_points()]
+        family = self.get_family()
+        arena = self.get_family_arena()
+        if arena is not None:
+            # Points of the whole family are transformed in one go
+            arrs = [arena[key] for key in self._arena_members[0].pointlike_data_keys]
             if works_on_bounding_box:
-                arrs.append(mob.get_bounding_box())
+                arrs.append(self._arena_boxes.reshape(-1, 3))
+            for arr in arrs:
+                if about_point is None:
+                    arr[:] = func(arr)
+                else:
+                    arr[:] = func(arr - about_point) + about_point
+            for mob in self._arena_members:
+                mob._data_has_changed = True
+                mob._note_data_written()
+            self.note_changed_data()
+            if not works_on_bounding_box:
+                self.refresh_bounding_box(recurse_down=True)
+            else:
+                for parent in self.parents:
+                    parent.refresh_bounding_box()
+            return self
+
+        deferring_members = set()
+        if affine_matrix is not None:
+            if about_point is not None:
+                affine_matrix = np.linalg.multi_dot([
+                    get_affine_matrix(translation=about_point),
+                    affine_matrix,
+                    get_affine_matrix(translation=-np.array(about_point)),
+                ])
+            deferring_members = set(family)
+
+        for mob in family:
+            # Bounding boxes which are due to be recomputed from the
+            # points anyway needn't be transformed
+            arrs = [mob.bounding_box] if works_on_bounding_box and not mob._needs_new_bounding_box else []
+            if mob._model_root in deferring_members:
+                mob.uniforms["model_matrix"] = mob.uniforms["model_matrix"] @ affine_matrix.T
+                mob._has_model_transform = True
+            elif mob.has_points():
+                mob.fold_model_matrix()
+                arrs.extend(mob.data[key] for key in mob.pointlike_data_keys)
+                mob.note_changed_data()
 
             for arr in arrs:
                 if about_point is None:
@@ -306,31 +476,42 @@ class Mobject(object):
 
     @affects_data
     def match_points(self, mobject: Mobject) -> Self:
-        self.resize_points(len(mobject.data), resize_func=resize_preserving_order)
+        mobject.fold_model_matrix()
+        self.resize_points(len(mobject._data), resize_func=resize_preserving_order)
         for key in self.pointlike_data_keys:
-            self.data[key][:] = mobject.data[key]
+            self.data[key][:] = mobject._data[key]
         return self
 
     # Others related to points
 
     def get_points(self) -> Vect3Array:
+        if self._has_model_transform:
+            self.fold_model_matrix()
+        # Callers may write to this, so it counts as a write, see data
         return self.data["point"]
 
+    def _read_points(self) -> Vect3Array:
+        # Like get_points, but for internal use where nothing is written,
+        # so that data shared with a copy stays shared, and caches stay valid
+        if self._has_model_transform:
+            self.fold_model_matrix()
+        return self._data["point"]
+
     def clear_points(self) -> Self:
         self.resize_points(0)
         return self
 
     def get_num_points(self) -> int:
-        return len(self.get_points())
+        return len(self._data)
 
     def get_all_points(self) -> Vect3Array:
         if self.submobjects:
-            return np.vstack([sm.get_points() for sm in self.get_family()])
+            return np.vstack([sm._read_points() for sm in self.get_family()])
         else:
             return self.get_points()
 
     def has_points(self) -> bool:
-        return len(self.get_points()) > 0
+        return len(self._data) > 0
 
     def get_bounding_box(self) -> Vect3Array:
         if self._needs_new_bounding_box:
@@ -339,14 +520,19 @@ class Mobject(object):
         return self.bounding_box
 
     def compute_bounding_box(self) -> Vect3Array:
-        all_points = np.vstack([
-            self.get_points(),
-            *(
-                mob.get_bounding_box()
-                for mob in self.get_family()[1:]
-                if mob.has_points()
-            )
-        ])
+        points = self._data["point"]
+        if self._has_model_transform:
+            # Find world coordinates without folding the model matrix into the data
+            matrix = self.get_model_matrix()
+            points = np.dot(points, matrix[:3, :3].T) + matrix[:3, 3]
+        # Each submobject's bounding box already covers its whole family
+        sub_boxes = []
+        for submob in self.submobjects:
+            box = submob.get_bounding_box()
+            if not submob._bounding_box_is_empty:
+                sub_boxes.append(box)
+        all_points = np.vstack([points, *sub_boxes])
+        self._bounding_box_is_empty = len(all_points) == 0
         if len(all_points) == 0:
             return np.zeros((3, self.dim))
         else:
@@ -365,7 +551,10 @@ class Mobject(object):
             mob._needs_new_bounding_box = True
         if recurse_up:
             for parent in self.parents:
-                parent.refresh_bounding_box()
+                # Ancestors of a mobject needing a new bounding box
+                # always need one as well, so there's no need to go further
+                if not parent._needs_new_bounding_box:
+                    parent.refresh_bounding_box()
         return self
 
     def are_points_touching(
@@ -413,6 +602,9 @@ class Mobject(object):
     @affects_data
     def note_changed_family(self, only_changed_order=False) -> Self:
         self.family = None
+        self._family_with_points = None
+        self._arena = None
+        Mobject._hierarchy_version += 1
         if not only_changed_order:
             self.refresh_has_updater_status()
             self.refresh_bounding_box()
@@ -430,7 +622,16 @@ class Mobject(object):
         return self.family
 
     def family_members_with_points(self) -> list[Mobject]:
-        return [m for m in self.get_family() if len(m.data) > 0]
+        if self._family_with_points is None:
+            self._family_with_points = [m for m in self.get_family() if len(m._data) > 0]
+        return list(self._family_with_points)
+
+    def _refresh_family_with_points(self) -> None:
+        # Called when a mobject goes from having no points to
+        # having some, or vice versa
+        self._family_with_points = None
+        for parent in self.parents:
+            parent._refresh_family_with_points()
 
     def get_ancestors(self, extended: bool = False) -> list[Mobject]:
         """
@@ -440,6 +641,14 @@ class Mobject(object):
         If extended is set to true, it includes the ancestors of all family members,
         e.g. any other parents of a submobject
         """
+        if self._ancestors_version != Mobject._hierarchy_version:
+            self._ancestor_lists = dict()
+            self._ancestors_version = Mobject._hierarchy_version
+        if extended not in self._ancestor_lists:
+            self._ancestor_lists[extended] = self._find_ancestors(extended)
+        return list(self._ancestor_lists[extended])
+
+    def _find_ancestors(self, extended: bool) -> list[Mobject]:
         ancestors = []
         to_process = list(self.get_family(recurse=extended))
         excluded = set(to_process)
@@ -470,6 +679,7 @@ class Mobject(object):
         reassemble: bool = True,
         recurse: bool = True
     ) -> Self:
+        Mobject._hierarchy_version += 1
         for parent in self.get_family(recurse):
             for child in to_remove:
                 if child in parent.submobjects:
@@ -478,6 +688,8 @@ class Mobject(object):
                     child.parents.remove(parent)
             if reassemble:
                 parent.note_changed_family()
+        for child in to_remove:
+            child._reset_model_root()
         return self
 
     def clear(self) -> Self:
@@ -495,6 +707,7 @@ class Mobject(object):
         self.submobjects[index] = new_submob
         new_submob.parents.append(self)
         self.note_changed_family()
+        old_submob._reset_model_root()
         return self
 
     def insert_submobject(self, index: int, new_submob: Mobject) -> Self:
@@ -633,13 +846,13 @@ class Mobject(object):
     def stash_mobject_pointers(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            uncopied_attrs = ["parents", "target", "saved_state"]
+            uncopied_attrs = ["parents", "target", "saved_state", "_ancestor_lists", "_arena_root"]
             stash = dict()
             for attr in uncopied_attrs:
                 if hasattr(self, attr):
                     value = getattr(self, attr)
                     stash[attr] = value
-                    null_value = [] if isinstance(value, list) else None
+                    null_value = type(value)() if isinstance(value, (list, dict)) else None
                     setattr(self, attr, null_value)
             result = func(self, *args, **kwargs)
             self.__dict__.update(stash)
@@ -648,12 +861,32 @@ class Mobject(object):
 
     @stash_mobject_pointers
     def serialize(self) -> bytes:
-        return pickle.dumps(self)
+        return serialization.dumps(self)
 
     def deserialize(self, data: bytes) -> Self:
-        self.become(pickle.loads(data))
+        if serialization.is_serialized(data):
+            self.become(serialization.loads(data))
+        else:
+            self.become(pickle.loads(data))
         return self
 
+    @stash_mobject_pointers
+    def save_to_file(self, file_path: str) -> Self:
+        serialization.dump(self, file_path)
+        log.info(f"Saved mobject to {file_path}")
+        return self
+
+    @staticmethod
+    def load(file_path: str) -> Mobject:
+        """
+        Reads a mobject written with save_to_file, memory mapping its data
+        so that it's only read from disk as it's needed
+        """
+        if not os.path.exists(file_path):
+            log.error(f"No file found at {file_path}")
+            sys.exit(2)
+        return serialization.load(file_path)
+
     @stash_mobject_pointers
     def deepcopy(self) -> Self:
         return copy.deepcopy(self)
@@ -665,6 +898,8 @@ class Mobject(object):
         result = copy.copy(self)
 
         result.parents = []
+        result._family_with_points = None
+        result._ancestor_lists = dict()
         result.target = None
         result.saved_state = None
 
@@ -695,8 +930,24 @@ class Mobject(object):
             if isinstance(value, Mobject) and value is not self:
                 if value in family:
                     setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
+            elif isinstance(value, np.ndarray) and attr not in ("_data", "_arena", "_arena_boxes"):
                 setattr(result, attr, value.copy())
+        # Copies are packed into an arena of their own when next needed
+        result._arena = None
+        result._arena_boxes = None
+        result._arena_members = []
+        result._arena_root = None
+
+        # Rather than copying the data, share it until either side writes to it
+        self._data_refs[0] += 1
+        self._data.flags.writeable = False
+
+        # Copies should not share a model root with the original
+        if self._model_root is not None:
+            copy_map = dict(zip(family, result.family))
+            for sm, sm_copy in copy_map.items():
+                if sm._model_root is not None:
+                    sm_copy._model_root = copy_map.get(sm._model_root, result)
         return result
 
     def generate_target(self, use_deepcopy: bool = False) -> Self:
@@ -724,7 +975,14 @@ class Mobject(object):
         family1 = self.get_family()
         family2 = mobject.get_family()
         for sm1, sm2 in zip(family1, family2):
-            sm1.set_data(sm2.data)
+            sm2.fold_model_matrix()
+            if sm1._data.dtype == sm2._data.dtype:
+                sm1.fold_model_matrix()
+                sm1._share_data(sm2)
+                sm1.refresh_bounding_box()
+                sm1.note_changed_data()
+            else:
+                sm1.set_data(sm2._data)
             sm1.set_uniforms(sm2.uniforms)
             sm1.bounding_box[:] = sm2.bounding_box
             sm1.shader_folder = sm2.shader_folder
@@ -732,6 +990,7 @@ class Mobject(object):
             sm1.depth_test = sm2.depth_test
             sm1.render_primitive = sm2.render_primitive
             sm1._needs_new_bounding_box = sm2._needs_new_bounding_box
+            sm1._bounding_box_is_empty = sm2._bounding_box_is_empty
         # Make sure named family members carry over
         for attr, value in list(mobject.__dict__.items()):
             if isinstance(value, Mobject) and value in family2:
@@ -740,21 +999,42 @@ class Mobject(object):
             self.match_updaters(mobject)
         return self
 
+    def get_fingerprint(self) -> bytes:
+        """
+        Digest of this mobject's data and uniforms (not those of its family).
+        The part for the data is cached until the data is next written, so
+        equal fingerprints are a cheap way to see mobjects look the same.
+        """
+        if self._data_digest is None:
+            data = np.ascontiguousarray(self._data)
+            digest = hashlib.blake2b(str(data.dtype).encode(), digest_size=16)
+            digest.update(data)
+            self._data_digest = digest.digest()
+        digest = hashlib.blake2b(self._data_digest, digest_size=16)
+        for key, value in self.uniforms.items():
+            digest.update(key.encode())
+            digest.update(np.asarray(value, dtype=float).tobytes())
+        return digest.digest()
+
     def looks_identical(self, mobject: Mobject) -> bool:
         fam1 = self.family_members_with_points()
         fam2 = mobject.family_members_with_points()
         if len(fam1) != len(fam2):
             return False
         for m1, m2 in zip(fam1, fam2):
+            # Cheap checks first, before anything needs hashing
             if m1.get_num_points() != m2.get_num_points():
                 return False
-            if not m1.data.dtype == m2.data.dtype:
+            if m1._data.dtype != m2._data.dtype:
                 return False
-            for key in m1.data.dtype.names:
-                if not np.isclose(m1.data[key], m2.data[key]).all():
-                    return False
-            if set(m1.uniforms).difference(m2.uniforms):
+            if set(m1.uniforms).symmetric_difference(m2.uniforms):
                 return False
+            if m1.get_fingerprint() == m2.get_fingerprint():
+                continue
+            # Otherwise, they may still agree up to floating point error
+            for key in m1._data.dtype.names:
+                if not np.isclose(m1._data[key], m2._data[key]).all():
+                    return False
             for key in m1.uniforms:
                 value1 = m1.uniforms[key]
                 value2 = m2.uniforms[key]
@@ -918,6 +1198,7 @@ class Mobject(object):
             lambda points: points + vector,
             about_edge=None,
             works_on_bounding_box=True,
+            affine_matrix=get_affine_matrix(translation=vector),
         )
         return self
 
@@ -939,13 +1220,16 @@ class Mobject(object):
         """
         if isinstance(scale_factor, numbers.Number):
             scale_factor = max(scale_factor, min_scale_factor)
+            affine_matrix = get_affine_matrix(scale_factor * np.identity(3))
         else:
             scale_factor = np.array(scale_factor).clip(min=min_scale_factor)
+            affine_matrix = None
         self.apply_points_function(
             lambda points: scale_factor * points,
             about_point=about_point,
             about_edge=about_edge,
             works_on_bounding_box=True,
+            affine_matrix=affine_matrix,
         )
         for mob in self.get_family():
             mob._handle_scale_side_effects(scale_factor)
@@ -977,6 +1261,7 @@ class Mobject(object):
         self.apply_points_function(
             lambda points: np.dot(points, rot_matrix_T),
             about_point,
+            affine_matrix=get_affine_matrix(rot_matrix_T.T),
             **kwargs
         )
         return self
@@ -1037,11 +1322,11 @@ class Mobject(object):
         wag_factor: float = 1.0
     ) -> Self:
         for mob in self.family_members_with_points():
-            alphas = np.dot(mob.get_points(), np.transpose(axis))
+            alphas = np.dot(mob._read_points(), np.transpose(axis))
             alphas -= min(alphas)
             alphas /= max(alphas)
             alphas = alphas**wag_factor
-            mob.set_points(mob.get_points() + np.dot(
+            mob.set_points(mob._read_points() + np.dot(
                 alphas.reshape((len(alphas), 1)),
                 np.array(direction).reshape((1, mob.dim))
             ))
@@ -1336,7 +1621,7 @@ class Mobject(object):
         Func should take in a point in R3 and output an rgba value
         """
         for mob in self.get_family(recurse):
-            mob.set_rgba_array(func(mob.get_points()))
+            mob.set_rgba_array(func(mob._read_points()))
         return self
 
     def set_color_by_rgb_func(
@@ -1349,7 +1634,7 @@ class Mobject(object):
         Func should take in a point in R3 and output an rgb value
         """
         for mob in self.get_family(recurse):
-            points = mob.get_points()
+            points = mob._read_points()
             opacity = np.ones((points.shape[0], 1)) * opacity
             mob.set_rgba_array(np.hstack((func(points), opacity)))
         return self
@@ -1401,10 +1686,10 @@ class Mobject(object):
         return self
 
     def get_color(self) -> str:
-        return rgb_to_hex(self.data["rgba"][0, :3])
+        return rgb_to_hex(self._data["rgba"][0, :3])
 
     def get_opacity(self) -> float:
-        return float(self.data["rgba"][0, 3])
+        return float(self._data["rgba"][0, 3])
 
     def get_opacities(self) -> float:
         return self.data["rgba"][:, 3]
@@ -1433,6 +1718,35 @@ class Mobject(object):
     def fade(self, darkness: float = 0.5, recurse: bool = True) -> Self:
         self.set_opacity(1.0 - darkness, recurse=recurse)
 
+    def set_opacity_multiplier(self, multiplier: float, recurse: bool = True) -> Self:
+        """
+        Scales the opacity of everything drawn for this mobject,
+        without touching the color data itself
+        """
+        self.set_uniform(recurse, opacity_multiplier=float(multiplier))
+        return self
+
+    def get_opacity_multiplier(self) -> float:
+        return self.uniforms["opacity_multiplier"]
+
+    def set_tint(
+        self,
+        color: ManimColor,
+        strength: float = 0.5,
+        recurse: bool = True
+    ) -> Self:
+        """
+        Mixes all colors of the mobject towards the given one,
+        without touching the color data itself
+        """
+        tint = np.array([*color_to_rgb(color), strength])
+        self.set_uniform(recurse, tint=tint)
+        return self
+
+    def clear_tint(self, recurse: bool = True) -> Self:
+        self.set_uniform(recurse, tint=np.zeros(4))
+        return self
+
     def get_shading(self) -> np.ndarray:
         return self.uniforms["shading"]
 
@@ -1601,19 +1915,19 @@ class Mobject(object):
 
     def get_start(self) -> Vect3:
         self.throw_error_if_no_points()
-        return self.get_points()[0].copy()
+        return self._read_points()[0].copy()
 
     def get_end(self) -> Vect3:
         self.throw_error_if_no_points()
-        return self.get_points()[-1].copy()
+        return self._read_points()[-1].copy()
 
     def get_start_and_end(self) -> tuple[Vect3, Vect3]:
         self.throw_error_if_no_points()
-        points = self.get_points()
+        points = self._read_points()
         return (points[0].copy(), points[-1].copy())
 
     def point_from_proportion(self, alpha: float) -> Vect3:
-        points = self.get_points()
+        points = self._read_points()
         i, subalpha = integer_interpolate(0, len(points) - 1, alpha)
         return interpolate(points[i], points[i + 1], subalpha)
 
@@ -1621,6 +1935,12 @@ class Mobject(object):
         """Abbreviation for point_from_proportion"""
         return self.point_from_proportion(alpha)
 
+    def points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        points = self._read_points()
+        scaled = np.clip(np.array(alphas, dtype=float), 0, 1) * (len(points) - 1)
+        indices = np.minimum(scaled.astype(int), len(points) - 2)
+        return interpolate(points[indices], points[indices + 1], (scaled - indices)[:, np.newaxis])
+
     def get_pieces(self, n_pieces: int) -> Group:
         template = self.copy()
         template.set_submobjects([])
@@ -1726,7 +2046,7 @@ class Mobject(object):
     # Alignment
 
     def is_aligned_with(self, mobject: Mobject) -> bool:
-        if len(self.data) != len(mobject.data):
+        if len(self._data) != len(mobject._data):
             return False
         if len(self.submobjects) != len(mobject.submobjects):
             return False
@@ -1787,15 +2107,14 @@ class Mobject(object):
             return self
         target = curr + n
         repeat_indices = (np.arange(target) * curr) // target
-        split_factors = [
-            (repeat_indices == i).sum()
-            for i in range(curr)
-        ]
+        split_factors = np.bincount(repeat_indices, minlength=curr)
         new_submobs = []
         for submob, sf in zip(self.submobjects, split_factors):
             new_submobs.append(submob)
-            for k in range(1, sf):
-                new_submobs.append(submob.invisible_copy())
+            if sf > 1:
+                invisible = submob.invisible_copy()
+                new_submobs.append(invisible)
+                new_submobs.extend(invisible.copy() for k in range(2, sf))
         self.set_submobjects(new_submobs)
         return self
 
@@ -1811,19 +2130,15 @@ class Mobject(object):
         alpha: float,
         path_func: Callable[[np.ndarray, np.ndarray, float], np.ndarray] = straight_path
     ) -> Self:
-        keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
+        for mob in (self, mobject1, mobject2):
+            mob.fold_model_matrix()
+        keys = self.get_unlocked_data_keys()
+        if mobject1._data is self._data and mobject2._data is self._data:
+            # All three share the same data, so there's nothing to write
+            keys = []
         if keys:
             self.note_changed_data()
-        for key in keys:
-            md1 = mobject1.data[key]
-            md2 = mobject2.data[key]
-            if key in self.const_data_keys:
-                md1 = md1[0]
-                md2 = md2[0]
-            if key in self.pointlike_data_keys:
-                self.data[key] = path_func(md1, md2, alpha)
-            else:
-                self.data[key] = (1 - alpha) * md1 + alpha * md2
+            self._interpolate_data(mobject1._data, mobject2._data, keys, alpha, path_func)
 
         for key in self.uniforms:
             if key in self.locked_uniform_keys:
@@ -1831,9 +2146,48 @@ class Mobject(object):
             if key not in mobject1.uniforms or key not in mobject2.uniforms:
                 continue
             self.uniforms[key] = (1 - alpha) * mobject1.uniforms[key] + alpha * mobject2.uniforms[key]
-        self.bounding_box[:] = path_func(mobject1.bounding_box, mobject2.bounding_box, alpha)
+        if getattr(path_func, "accepts_out", False):
+            path_func(mobject1.bounding_box, mobject2.bounding_box, alpha, out=self.bounding_box)
+        else:
+            self.bounding_box[:] = path_func(mobject1.bounding_box, mobject2.bounding_box, alpha)
         return self
 
+    def _interpolate_data(
+        self,
+        data1: np.ndarray,
+        data2: np.ndarray,
+        keys: list[str],
+        alpha: float,
+        path_func: Callable[[np.ndarray, np.ndarray, float], np.ndarray]
+    ) -> None:
+        data = self.data
+        path_accepts_out = getattr(path_func, "accepts_out", False)
+        if self._locked_data_matches and _can_interpolate_as_floats(data, data1, data2):
+            # Interpolate whole records at once, writing straight into data.
+            # Locked keys are unchanged by this, as they match across all three
+            interpolate(
+                data1.view(np.float32),
+                data2.view(np.float32),
+                alpha,
+                out=data.view(np.float32)
+            )
+            if path_func is straight_path:
+                return
+            keys = [key for key in keys if key in self.pointlike_data_keys]
+
+        for key in keys:
+            md1 = data1[key]
+            md2 = data2[key]
+            if key in self.const_data_keys:
+                md1 = md1[0]
+                md2 = md2[0]
+            if key not in self.pointlike_data_keys:
+                data[key] = interpolate(md1, md2, alpha)
+            elif path_accepts_out and md1.shape == data[key].shape:
+                path_func(md1, md2, alpha, out=data[key])
+            else:
+                data[key] = path_func(md1, md2, alpha)
+
     def pointwise_become_partial(self, mobject, a, b) -> Self:
         """
         Set points in such a way as to become only
@@ -1857,8 +2211,22 @@ class Mobject(object):
         if self.has_updaters():
             return self
         self.locked_data_keys = set(keys)
+        self._locked_data_matches = False
+        self._unlocked_data_keys = None
+        self.get_unlocked_data_keys()
         return self
 
+    def get_unlocked_data_keys(self) -> list[str]:
+        """
+        Keys of data which interpolate will write to, computed once
+        when data is locked, e.g. as a Transform begins
+        """
+        names = self._data.dtype.names
+        if self._unlocked_data_keys is None or self._unlocked_data_keys[0] is not names:
+            keys = [key for key in names if key not in self.locked_data_keys]
+            self._unlocked_data_keys = (names, keys)
+        return self._unlocked_data_keys[1]
+
     def lock_uniforms(self, keys: Iterable[str]) -> Self:
         if self.has_updaters():
             return self
@@ -1872,30 +2240,38 @@ class Mobject(object):
             mobject2.get_family(),
         )
         for sm, sm1, sm2 in tuples:
-            if not sm.data.dtype == sm1.data.dtype == sm2.data.dtype:
+            if not sm._data.dtype == sm1._data.dtype == sm2._data.dtype:
                 continue
             sm.lock_data(
-                key for key in sm.data.dtype.names
-                if arrays_match(sm1.data[key], sm2.data[key])
+                key for key in sm._data.dtype.names
+                if arrays_match(sm1._data[key], sm2._data[key])
             )
             sm.lock_uniforms(
                 key for key in self.uniforms
-                if all(listify(mobject1.uniforms.get(key, 0) == mobject2.uniforms.get(key, 0)))
+                if np.array_equal(mobject1.uniforms.get(key, 0), mobject2.uniforms.get(key, 0))
             )
             sm.const_data_keys = set(
-                key for key in sm.data.dtype.names
+                key for key in sm._data.dtype.names
                 if key not in sm.locked_data_keys
                 if all(
-                    array_is_constant(mob.data[key])
+                    array_is_constant(mob._data[key])
                     for mob in (sm, sm1, sm2)
                 )
             )
+            # Whether sm also matches on its locked keys, in which case
+            # interpolate can safely write all its data at once
+            sm._locked_data_matches = sm._data is sm1._data or all(
+                arrays_match(sm._data[key], sm1._data[key])
+                for key in sm.locked_data_keys
+            )
 
         return self
 
     def unlock_data(self) -> Self:
         for mob in self.get_family():
             mob.locked_data_keys = set()
+            mob._locked_data_matches = True
+            mob._unlocked_data_keys = None
             mob.const_data_keys = set()
             mob.locked_uniform_keys = set()
         return self
@@ -1959,6 +2335,131 @@ class Mobject(object):
         self.uniforms["clip_plane"][:] = 0
         return self
 
+    # Model matrix
+
+    def use_model_matrix(self, value: bool = True, recurse: bool = True) -> Self:
+        """
+        When on, shifts, rotations and uniform rescalings of this mobject
+        are accumulated into a model matrix which the shaders apply, rather
+        than rewriting (and re-uploading) all point data.  Points are only
+        brought back to world coordinates when something asks for them,
+        e.g. with a call to get_points.
+        """
+        for mob in self.get_family(recurse):
+            mob.fold_model_matrix()
+            mob._model_root = self if value else None
+        self.refresh_shader_wrapper_id()
+        return self
+
+    def uses_model_matrix(self) -> bool:
+        return self._model_root is not None
+
+    def get_model_matrix(self) -> np.ndarray:
+        return self.uniforms["model_matrix"].T
+
+    def fold_model_matrix(self) -> Self:
+        """
+        Apply any transformation accumulated in the model matrix to the
+        data itself, and reset the matrix to the identity.  This happens
+        for all mobjects under the same model root, so that those sharing
+        a render batch always agree on their matrix.
+        """
+        if not self._has_model_transform:
+            return self
+        root = self._model_root or self
+        for mob in [self, *root.get_family()]:
+            if not mob._has_model_transform:
+                continue
+            matrix = mob.get_model_matrix()
+            mob._has_model_transform = False
+            mob.uniforms["model_matrix"] = np.identity(4)
+            if mob.has_points():
+                mob._fold_matrix_into_data(matrix)
+                mob.note_changed_data()
+        return self
+
+    def _fold_matrix_into_data(self, matrix: np.ndarray):
+        for key in self.pointlike_data_keys:
+            self.data[key][:] = np.dot(self.data[key], matrix[:3, :3].T) + matrix[:3, 3]
+
+    def _reset_model_root(self) -> Self:
+        # Called after self is removed from a parent.  If that parent's family
+        # held the model root, self takes over as the root for its own family
+        root = self._model_root
+        if root is None or root is self or self in root.get_family():
+            return self
+        family = self.get_family()
+        for mob in family:
+            if mob._model_root is root:
+                mob._model_root = self
+        self.refresh_shader_wrapper_id()
+        return self
+
+    # Family arena
+
+    def use_family_arena(self, value: bool = True) -> Self:
+        """
+        When on, the data of all family members with points are stored as
+        views into one contiguous array, as are their bounding boxes, so that
+        point functions applied to the whole family, like shift, scale or
+        apply_function, run as single numpy operations rather than once per
+        submobject.  The same array is read into the shaders when the family
+        renders as one batch.
+
+        Members fall out of the arena whenever their data is replaced, resized
+        or shared with a copy, and the arena is rebuilt the next time it's
+        needed.  This assumes the functions passed to apply_points_function
+        act on points independently, and it's not used while family members
+        use a model matrix.
+        """
+        self._use_family_arena = value
+        self._arena = None
+        if value:
+            self.get_family_arena()
+        return self
+
+    def get_family_arena(self) -> Optional[np.ndarray]:
+        if not self._use_family_arena:
+            return None
+        arena = self._arena
+        members = self.family_members_with_points()
+        if arena is None or members != self._arena_members or not all(
+            mob._data.base is arena and mob._data.flags.writeable and mob._model_root is None
+            for mob in members
+        ):
+            arena = self._build_family_arena(members)
+        return arena
+
+    def _build_family_arena(self, members: list[Mobject]) -> Optional[np.ndarray]:
+        self._arena = None
+        self._arena_boxes = None
+        self._arena_members = []
+        if not members:
+            return None
+        dtype = members[0]._data.dtype
+        keys = members[0].pointlike_data_keys
+        if any(
+            mob._data.dtype != dtype or mob.pointlike_data_keys != keys or mob._model_root is not None
+            for mob in members
+        ):
+            return None
+
+        arena = np.concatenate([mob._data for mob in members])
+        lengths = [len(mob._data) for mob in members]
+        for mob, end, length in zip(members, np.cumsum(lengths), lengths):
+            mob.data = arena[end - length:end]
+            mob._arena_root = self
+
+        family = self.get_family()
+        boxes = np.array([mob.bounding_box for mob in family])
+        for mob, box in zip(family, boxes):
+            mob.bounding_box = box
+
+        self._arena = arena
+        self._arena_boxes = boxes
+        self._arena_members = members
+        return arena
+
     # Shader code manipulation
 
     @affects_data
@@ -2009,10 +2510,30 @@ class Mobject(object):
 
     # For shader data
 
+    @affects_family_data
+    def use_packed_vertex_data(self, value: bool = True, recurse: bool = True) -> Self:
+        """
+        Send data to the gpu in the layout given by packed_data_dtype, e.g. with
+        colors as normalized bytes, which cuts down on gpu memory and upload bandwidth.
+        Data on the cpu side is unaffected.
+        """
+        for mob in self.get_family(recurse):
+            if mob.packed_data_dtype is None or mob._use_packed_data == value:
+                continue
+            mob._use_packed_data = value
+            # The vertex format of an existing wrapper no longer matches
+            mob.shader_wrapper = None
+        return self
+
+    def get_shader_dtype(self) -> np.dtype:
+        if self._use_packed_data:
+            return np.dtype(self.packed_data_dtype)
+        return self._data.dtype
+
     def init_shader_wrapper(self, ctx: Context):
         self.shader_wrapper = ShaderWrapper(
             ctx=ctx,
-            vert_data=self.data,
+            vert_data=np.zeros(0, dtype=self.get_shader_dtype()),
             shader_folder=self.shader_folder,
             mobject_uniforms=self.uniforms,
             texture_paths=self.texture_paths,
@@ -2037,22 +2558,83 @@ class Mobject(object):
 
     def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
         family = self.family_members_with_points()
-        batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
+        # Mobjects under distinct model roots can't share a batch, since
+        # their model matrices may change without the batches being reassembled
+        batches = batch_by_property(
+            family,
+            lambda sm: (
+                sm.get_shader_wrapper(ctx).get_id(),
+                id(sm._model_root),
+            )
+        )
 
         result = []
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
+            data_list = self.get_batch_shader_data(submobs)
             shader_wrapper.read_in(data_list)
+            if len(data_list) == len(submobs):
+                vert_counts = shader_wrapper.data_lengths
+            else:
+                vert_counts = [sm.get_num_shader_verts() for sm in submobs]
+            shader_wrapper.bind_to_member_uniforms([sm.uniforms for sm in submobs], vert_counts)
             result.append(shader_wrapper)
         return result
 
+    def get_batch_shader_data(self, submobs: list[Mobject]) -> list[np.ndarray]:
+        root = submobs[0]._arena_root
+        arena = root.get_family_arena() if root is not None else None
+        if arena is None or submobs != root._arena_members:
+            return self.get_changed_shader_data(submobs)
+
+        # Read straight out of the family arena, rather than
+        # concatenating the data of each member
+        submobs[0]._shader_data_versions = []
+        for sm in submobs:
+            sm.refresh_shader_data()
+        indices = [sm.get_shader_vert_indices() for sm in submobs]
+        if any(index is not None for index in indices):
+            lengths = [len(sm._data) for sm in submobs]
+            offsets = np.cumsum([0, *lengths[:-1]])
+            arena = arena[np.concatenate([
+                offset + (np.arange(length) if index is None else index)
+                for index, offset, length in zip(indices, offsets, lengths)
+            ])]
+        if submobs[0]._use_packed_data:
+            return [pack_vertex_data(arena, submobs[0].packed_data_dtype)]
+        return [arena]
+
+    def get_changed_shader_data(self, submobs: list[Mobject]) -> list[np.ndarray | None]:
+        """
+        Shader data of each of submobs, or None for those whose data is unchanged
+        since it was last read into the shader wrapper of the batch, which is
+        then only updated where needed
+        """
+        leader = submobs[0]
+        old_versions = leader._shader_data_versions
+        if len(old_versions) == len(submobs) == len(leader.shader_wrapper.data_lengths):
+            result = [
+                None if sm._data_version == version else sm.get_shader_data()
+                for sm, version in zip(submobs, old_versions)
+            ]
+        else:
+            result = [sm.get_shader_data() for sm in submobs]
+        # Taken after gathering, as refreshing derived data may write to it
+        leader._shader_data_versions = [sm._data_version for sm in submobs]
+        return result
+
+    def refresh_shader_data(self) -> None:
+        # To be implemented in subclasses whose data holds values
+        # derived from the points, which are updated before rendering
+        pass
+
     def get_shader_data(self) -> np.ndarray:
+        self.refresh_shader_data()
         indices = self.get_shader_vert_indices()
-        if indices is not None:
-            return self.data[indices]
-        else:
-            return self.data
+        data = self._data if indices is None else self._data[indices]
+        if self._use_packed_data:
+            return pack_vertex_data(data, self.packed_data_dtype)
+        return data
 
     def get_uniforms(self):
         return self.uniforms
@@ -2060,6 +2642,10 @@ class Mobject(object):
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return None
 
+    def get_num_shader_verts(self) -> int:
+        indices = self.get_shader_vert_indices()
+        return len(self._data) if indices is None else len(indices)
+
     def render(self, ctx: Context, camera_uniforms: dict):
         if self._data_has_changed:
             self.shader_wrappers = self.get_shader_wrapper_list(ctx)
@@ -2219,7 +2805,7 @@ class Point(Mobject):
         return self.artificial_height
 
     def get_location(self) -> Vect3:
-        return self.get_points()[0].copy()
+        return self._read_points()[0].copy()
 
     def get_bounding_box_point(self, *args, **kwargs) -> Vect3:
         return self.get_location()
@@ -2348,3 +2934,23 @@ class _FunctionalUpdaterBuilder:
             )
             return self
         return add_updater
+
+
+@lru_cache
+def _is_float_record(dtype: np.dtype) -> bool:
+    """
+    Whether arrays of this dtype can be viewed as flat float32 arrays,
+    i.e. whether all its fields are float32 and packed without gaps
+    """
+    if dtype.names is None:
+        return False
+    fields = [dtype.fields[name][0] for name in dtype.names]
+    return all(field.base == np.float32 for field in fields) and \
+        sum(field.itemsize for field in fields) == dtype.itemsize
+
+
+def _can_interpolate_as_floats(data: np.ndarray, data1: np.ndarray, data2: np.ndarray) -> bool:
+    return len(data) == len(data1) == len(data2) and \
+        data.dtype == data1.dtype == data2.dtype and \
+        _is_float_record(data.dtype) and \
+        all(arr.flags.c_contiguous for arr in (data, data1, data2))
@@ -164,7 +164,7 @@ class Speedometer(VMobject):
         return result
 
     def get_needle_tip(self):
-        return self.needle.get_anchors()[1]
+        return self.needle._read_points()[2].copy()
 
     def get_needle_angle(self):
         return angle_of_vector(
@@ -3,8 +3,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import itertools as it
 import re
-from scipy.optimize import linear_sum_assignment
-from scipy.spatial.distance import cdist
 
 from manimlib.constants import DEFAULT_MOBJECT_COLOR
 from manimlib.logger import log
@@ -14,6 +12,7 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import hex_to_int
 from manimlib.utils.color import int_to_hex
+from manimlib.utils.space_ops import match_points_by_position
 
 from typing import TYPE_CHECKING
 
@@ -157,11 +156,10 @@ class StringMobject(SVGMobject, ABC):
 
         labelled_svg = VGroup(*labelled_submobs)
         labelled_svg.replace(VGroup(*unlabelled_submobs))
-        distance_matrix = cdist(
+        indices = match_points_by_position(
             [submob.get_center() for submob in unlabelled_submobs],
             [submob.get_center() for submob in labelled_submobs]
         )
-        _, indices = linear_sum_assignment(distance_matrix)
         labelled_submobs[:] = [labelled_submobs[index] for index in indices]
 
     # Toolkits
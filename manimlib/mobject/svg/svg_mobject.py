@@ -323,24 +323,30 @@ class VMobjectFromSVGPath(VMobject):
             self.set_points(points)
 
     def handle_commands(self) -> None:
-        segment_class_to_func_map = {
-            se.Move: (self.start_new_path, ("end",)),
-            se.Close: (self.close_path, ()),
-            se.Line: (lambda p: self.add_line_to(p, allow_null_line=False), ("end",)),
-            se.QuadraticBezier: (lambda c, e: self.add_quadratic_bezier_curve_to(c, e, allow_null_curve=False), ("control", "end")),
-            se.CubicBezier: (self.add_cubic_bezier_curve_to, ("control1", "control2", "end"))
+        segment_class_to_command_map = {
+            se.Move: ("M", ("end",)),
+            se.Close: ("Z", ()),
+            se.Line: ("L", ("end",)),
+            se.QuadraticBezier: ("Q", ("control", "end")),
+            se.CubicBezier: ("C", ("control1", "control2", "end")),
         }
+        commands = []
+        points = []
         for segment in self.path_obj:
             segment_class = segment.__class__
             if segment_class is se.Arc:
+                # Arcs are added directly, after everything before them
+                self.add_path_segments(commands, points, allow_null_curves=False)
+                commands, points = [], []
                 self.handle_arc(segment)
             else:
-                func, attr_names = segment_class_to_func_map[segment_class]
-                points = [
-                    _convert_point_to_3d(*segment.__getattribute__(attr_name))
+                command, attr_names = segment_class_to_command_map[segment_class]
+                commands.append(command)
+                points.extend(
+                    (*segment.__getattribute__(attr_name), 0.0)
                     for attr_name in attr_names
-                ]
-                func(*points)
+                )
+        self.add_path_segments(commands, points, allow_null_curves=False)
 
         # Get rid of the side effect of trailing "Z M" commands.
         if self.has_new_path_started():
@@ -63,7 +63,7 @@ class SurfaceMesh(VGroup):
         u_indices = np.linspace(0, full_nu - 1, part_nu)
         v_indices = np.linspace(0, full_nv - 1, part_nv)
 
-        points = uv_surface.get_points()
+        points = uv_surface._read_points()
         normals = uv_surface.get_unit_normals()
         nudge = self.normal_nudge
         nudged_points = points + nudge * normals
@@ -400,7 +400,7 @@ class Prismify(VGroup3D):
         # At the moment, this assume stright edges
         vect = depth * direction
         pieces = [vmobject.copy()]
-        points = vmobject.get_anchors()
+        points = vmobject._read_points()[::2]
         for p1, p2 in adjacent_pairs(points):
             wall = VMobject()
             wall.match_style(vmobject)
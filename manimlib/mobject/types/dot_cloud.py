@@ -31,6 +31,11 @@ class DotCloud(PMobject):
         ('radius', np.float32, (1,)),
         ('rgba', np.float32, (4,)),
     ]
+    packed_data_dtype: np.dtype = np.dtype([
+        ('point', np.float32, (3,)),
+        ('radius', np.float32, (1,)),
+        ('rgba', np.uint8, (4,)),
+    ])
 
     def __init__(
         self,
@@ -115,10 +120,10 @@ class DotCloud(PMobject):
         return self
 
     def get_radius(self) -> float:
-        return self.get_radii().max()
+        return self._data["radius"].max()
 
     def scale_radii(self, scale_factor: float) -> Self:
-        self.set_radius(scale_factor * self.get_radii())
+        self.set_radius(scale_factor * self._data["radius"])
         return self
 
     def set_glow_factor(self, glow_factor: float) -> Self:
@@ -143,7 +148,7 @@ class DotCloud(PMobject):
     ) -> Self:
         super().scale(scale_factor, **kwargs)
         if scale_radii:
-            self.set_radii(scale_factor * self.get_radii())
+            self.set_radii(scale_factor * self._data["radius"])
         return self
 
     def make_3d(
@@ -36,7 +36,7 @@ class PMobject(Mobject):
         # rgbas array will have been resized with points
         if color is not None:
             if opacity is None:
-                opacity = self.data["rgba"][-1, 3]
+                opacity = self._data["rgba"][-1, 3]
             rgbas = np.repeat(
                 [color_to_rgba(color, opacity)],
                 len(points),
@@ -62,14 +62,14 @@ class PMobject(Mobject):
     @Mobject.affects_data
     def match_colors(self, pmobject: PMobject) -> Self:
         self.data["rgba"][:] = resize_with_interpolation(
-            pmobject.data["rgba"], self.get_num_points()
+            pmobject._data["rgba"], self.get_num_points()
         )
         return self
 
     @Mobject.affects_data
     def filter_out(self, condition: Callable[[np.ndarray], bool]) -> Self:
         for mob in self.family_members_with_points():
-            mob.data = mob.data[~np.apply_along_axis(condition, 1, mob.get_points())]
+            mob.data = mob._data[~np.apply_along_axis(condition, 1, mob._read_points())]
         return self
 
     @Mobject.affects_data
@@ -79,7 +79,7 @@ class PMobject(Mobject):
         """
         for mob in self.family_members_with_points():
             indices = np.argsort(
-                np.apply_along_axis(function, 1, mob.get_points())
+                np.apply_along_axis(function, 1, mob._read_points())
             )
             mob.data[:] = mob.data[indices]
         return self
@@ -87,19 +87,21 @@ class PMobject(Mobject):
     @Mobject.affects_data
     def ingest_submobjects(self) -> Self:
         self.data = np.vstack([
-            sm.data for sm in self.get_family()
+            sm._data for sm in self.get_family()
         ])
         return self
 
     def point_from_proportion(self, alpha: float) -> np.ndarray:
         index = alpha * (self.get_num_points() - 1)
-        return self.get_points()[int(index)]
+        return self._read_points()[int(index)].copy()
 
     @Mobject.affects_data
     def pointwise_become_partial(self, pmobject: PMobject, a: float, b: float) -> Self:
         lower_index = int(a * pmobject.get_num_points())
         upper_index = int(b * pmobject.get_num_points())
-        self.data = pmobject.data[lower_index:upper_index].copy()
+        for mob in (self, pmobject):
+            mob.fold_model_matrix()
+        self.data = pmobject._data[lower_index:upper_index].copy()
         return self
 
 
@@ -33,6 +33,11 @@ class Surface(Mobject):
         ('d_normal_point', np.float32, (3,)),
         ('rgba', np.float32, (4,)),
     ])
+    packed_data_dtype: np.dtype = np.dtype([
+        ('point', np.float32, (3,)),
+        ('d_normal_point', np.float32, (3,)),
+        ('rgba', np.uint8, (4,)),
+    ])
     pointlike_data_keys = ['point', 'd_normal_point']
 
     def __init__(
@@ -111,7 +116,7 @@ class Surface(Mobject):
 
     def uv_to_point(self, u, v):
         nu, nv = self.resolution
-        verts_by_uv = np.reshape(self.get_points(), (nu, nv, self.dim))
+        verts_by_uv = np.reshape(self._read_points(), (nu, nv, self.dim))
 
         alpha1 = clip(inverse_interpolate(*self.u_range[:2], u), 0, 1)
         alpha2 = clip(inverse_interpolate(*self.v_range[:2], v), 0, 1)
@@ -164,7 +169,8 @@ class Surface(Mobject):
 
     def get_unit_normals(self) -> Vect3Array:
         # TOOD, I could try a more resiliant way to compute this using the neighboring grid values
-        return normalize_along_axis(self.data['d_normal_point'] - self.data['point'], 1)
+        self.fold_model_matrix()
+        return normalize_along_axis(self._data['d_normal_point'] - self._data['point'], 1)
 
     @Mobject.affects_data
     def pointwise_become_partial(
@@ -182,8 +188,10 @@ class Surface(Mobject):
             return self
 
         nu, nv = smobject.resolution
+        for mob in (self, smobject):
+            mob.fold_model_matrix()
         self.data['point'][:] = self.get_partial_points_array(
-            smobject.data['point'], a, b,
+            smobject._data['point'], a, b,
             (nu, nv, 3),
             axis=axis
         )
@@ -232,7 +240,7 @@ class Surface(Mobject):
     @Mobject.affects_data
     def sort_faces_back_to_front(self, vect: Vect3 = OUT) -> Self:
         tri_is = self.triangle_indices
-        points = self.get_points()
+        points = self._read_points()
 
         dots = (points[tri_is[::3]] * vect).sum(1)
         indices = np.argsort(dots)
@@ -295,6 +303,7 @@ class TexturedSurface(Surface):
         ('im_coords', np.float32, (2,)),
         ('opacity', np.float32, (1,)),
     ]
+    packed_data_dtype = None
 
     def __init__(
         self,
@@ -331,12 +340,13 @@ class TexturedSurface(Surface):
     @Mobject.affects_data
     def init_points(self):
         surf = self.uv_surface
+        surf.fold_model_matrix()
         nu, nv = surf.resolution
         self.resize_points(surf.get_num_points())
         self.resolution = surf.resolution
-        self.data['point'][:] = surf.data['point']
-        self.data['d_normal_point'][:] = surf.data['d_normal_point']
-        self.data['opacity'][:, 0] = surf.data["rgba"][:, 3]
+        self.data['point'][:] = surf._data['point']
+        self.data['d_normal_point'][:] = surf._data['d_normal_point']
+        self.data['opacity'][:, 0] = surf._data["rgba"][:, 3]
         self.data["im_coords"] = np.array([
             [u, v]
             for u in np.linspace(0, 1, nu)
@@ -372,7 +382,7 @@ class TexturedSurface(Surface):
     ) -> Self:
         super().pointwise_become_partial(tsmobject, a, b, axis)
         im_coords = self.data["im_coords"]
-        im_coords[:] = tsmobject.data["im_coords"]
+        im_coords[:] = tsmobject._data["im_coords"]
         if a <= 0 and b >= 1:
             return self
         nu, nv = tsmobject.resolution
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from functools import wraps
+import hashlib
 
 import numpy as np
 
@@ -16,6 +18,7 @@ from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Point
 from manimlib.utils.bezier import bezier
+from manimlib.utils.bezier import distribute_subdivisions
 from manimlib.utils.bezier import get_quadratic_approximation_of_cubic
 from manimlib.utils.bezier import approx_smooth_quadratic_bezier_handles
 from manimlib.utils.bezier import smooth_quadratic_path
@@ -25,20 +28,25 @@ from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.bezier import find_intersection
 from manimlib.utils.bezier import outer_interpolate
 from manimlib.utils.bezier import partial_quadratic_bezier_points
+from manimlib.utils.bezier import quadratic_bezier_lengths
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.bezier import subdivide_quadratic_bezier_points
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import rgb_to_hex
 from manimlib.utils.iterables import make_even
 from manimlib.utils.iterables import resize_array
 from manimlib.utils.iterables import resize_with_interpolation
 from manimlib.utils.iterables import resize_preserving_order
+from manimlib.utils.paths import straight_path
 from manimlib.utils.space_ops import angle_between_vectors
 from manimlib.utils.space_ops import cross2d
 from manimlib.utils.space_ops import earclip_triangulation
+from manimlib.utils.space_ops import get_affine_matrix
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import get_unit_normal
 from manimlib.utils.space_ops import line_intersects_path
 from manimlib.utils.space_ops import midpoint
+from manimlib.utils.space_ops import normalize_along_axis
 from manimlib.utils.space_ops import rotation_between_vectors
 from manimlib.utils.space_ops import rotation_matrix_transpose
 from manimlib.utils.space_ops import poly_line_length
@@ -50,11 +58,72 @@ from typing import Generic, TypeVar, Iterable
 SubVmobjectType = TypeVar('SubVmobjectType', bound='VMobject')
 
 if TYPE_CHECKING:
-    from typing import Callable, Tuple, Any, Optional
+    from typing import Callable, Tuple, Any, Optional, Sequence
     from manimlib.typing import ManimColor, Vect3, Vect4, Vect3Array, Self
     from moderngl.context import Context
 
 
+class AlignedPointsCache(object):
+    """
+    Results of VMobject.align_points, keyed by digests of the points of
+    both mobjects beforehand.  Once these take up more than max_bytes,
+    the least recently used are dropped.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.entries: OrderedDict[tuple[bytes, bytes, float], tuple[Vect3Array, Vect3Array]] = OrderedDict()
+
+    def get(self, key: tuple[bytes, bytes, float]) -> tuple[Vect3Array, Vect3Array] | None:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        # Aligning is symmetric
+        reverse_key = (key[1], key[0], key[2])
+        if reverse_key in self.entries:
+            self.entries.move_to_end(reverse_key)
+            return self.entries[reverse_key][::-1]
+        return None
+
+    def add(self, key: tuple[bytes, bytes, float], aligned: tuple[Vect3Array, Vect3Array]) -> None:
+        self.entries[key] = aligned
+        self.nbytes += sum(points.nbytes for points in aligned)
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            _, dropped = self.entries.popitem(last=False)
+            self.nbytes -= sum(points.nbytes for points in dropped)
+
+
+ALIGNED_POINTS = AlignedPointsCache(max_bytes=64 * 2**20)
+
+
+class PathTopology(object):
+    """
+    How a list of quadratic bezier points breaks into subpaths, with the
+    indices of the points starting and ending each.  Its arrays are read-only.
+    """
+    def __init__(self, points: Vect3Array):
+        atol = 1e-4  # TODO, this is too unsystematic
+        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+        # An anchor point is considered the end of a path
+        # if its following handle is sitting on top of it.
+        # To disambiguate this from cases with many null
+        # curves in a row, we also check that the following
+        # anchor is genuinely distinct
+        is_end = (a0 == h).all(1) & (abs(h - a1) > atol).any(1)
+        self.end_indices = np.array([*(2 * np.flatnonzero(is_end)), len(points) - 1])
+        self.start_indices = np.array([0, *(self.end_indices[:-1] + 2)])
+        for array in (self.end_indices, self.start_indices):
+            array.flags.writeable = False
+
+    def get_subpaths(self, points: Vect3Array) -> list[Vect3Array]:
+        if len(points) == 0:
+            return []
+        return [
+            points[i1:i2 + 1]
+            for i1, i2 in zip(self.start_indices.tolist(), self.end_indices.tolist())
+        ]
+
+
 class VMobject(Mobject):
     data_dtype: np.dtype = np.dtype([
         ('point', np.float32, (3,)),
@@ -64,6 +133,21 @@ class VMobject(Mobject):
         ('fill_rgba', np.float32, (4,)),
         ('base_normal', np.float32, (3,)),  # Base points and unit normal vectors are interleaved in this array
         ('fill_border_width', np.float32, (1,)),
+        ('proportion', np.float32, (1,)),  # Proportion along the full path, for partial rendering in shaders
+        ('arc_proportion', np.float32, (1,)),  # Proportion of the full arc length, for dashes
+    ])
+    # Total of 52 bytes, rather than 100.  Every field starts on a 4-byte
+    # boundary, as some drivers reject or slow down unaligned vertex attributes
+    packed_data_dtype: np.dtype = np.dtype([
+        ('point', np.float32, (3,)),
+        ('stroke_rgba', np.uint8, (4,)),
+        ('stroke_width', np.float32, (1,)),
+        ('joint_angle', np.float32, (1,)),
+        ('fill_rgba', np.uint8, (4,)),
+        ('base_normal', np.float32, (3,)),
+        ('fill_border_width', np.float32, (1,)),
+        ('proportion', np.float32, (1,)),
+        ('arc_proportion', np.float32, (1,)),
     ])
     pre_function_handle_to_anchor_scale_factor: float = 0.01
     make_smooth_after_applying_functions: bool = False
@@ -114,11 +198,20 @@ class VMobject(Mobject):
 
         self.needs_new_joint_angles = True
         self.needs_new_unit_normal = True
-        self.subpath_end_indices = None
+        self._path_topology: PathTopology | None = None
         self.outer_vert_indices = np.zeros(0, dtype=int)
+        self._partial_curve_lengths: tuple[int, np.ndarray] | None = None
+        self._joint_angle_cache: tuple[Vect3, Vect3Array, np.ndarray] | None = None
 
         super().__init__(**kwargs)
 
+    def __getstate__(self):
+        # The joint angle cache holds a copy of the points, so is left
+        # behind rather than doubling what gets copied or pickled
+        state = super().__getstate__()
+        state["_joint_angle_cache"] = None
+        return state
+
     def get_group_class(self):
         return VGroup
 
@@ -128,7 +221,12 @@ class VMobject(Mobject):
             anti_alias_width=self.anti_alias_width,
             joint_type=self.joint_type_map[self.joint_type],
             flat_stroke=float(self.flat_stroke),
-            scale_stroke_with_zoom=float(self.scale_stroke_with_zoom)
+            scale_stroke_with_zoom=float(self.scale_stroke_with_zoom),
+            partial_start=0.0,
+            partial_end=1.0,
+            dash_length=0.0,
+            dash_ratio=0.5,
+            dash_phase=0.0,
         )
 
     def add(self, *vmobjects: VMobject) -> Self:
@@ -259,7 +357,7 @@ class VMobject(Mobject):
         return self
 
     def get_style(self) -> dict[str, Any]:
-        data = self.data if self.get_num_points() > 0 else self._data_defaults
+        data = self._data if self.get_num_points() > 0 else self._data_defaults
         return {
             "fill_rgba": data['fill_rgba'].copy(),
             "fill_border_width": data['fill_border_width'].copy(),
@@ -329,7 +427,7 @@ class VMobject(Mobject):
     def get_fill_colors(self) -> list[str]:
         return [
             rgb_to_hex(rgba[:3])
-            for rgba in self.data['fill_rgba']
+            for rgba in self._data['fill_rgba']
         ]
 
     def get_fill_opacities(self) -> np.ndarray:
@@ -338,7 +436,7 @@ class VMobject(Mobject):
     def get_stroke_colors(self) -> list[str]:
         return [
             rgb_to_hex(rgba[:3])
-            for rgba in self.data['stroke_rgba']
+            for rgba in self._data['stroke_rgba']
         ]
 
     def get_stroke_opacities(self) -> np.ndarray:
@@ -354,7 +452,7 @@ class VMobject(Mobject):
         If there are multiple colors (for gradient)
         this returns the first one
         """
-        data = self.data if self.has_points() else self._data_defaults
+        data = self._data if self.has_points() else self._data_defaults
         return rgb_to_hex(data["fill_rgba"][0, :3])
 
     def get_fill_opacity(self) -> float:
@@ -362,19 +460,19 @@ class VMobject(Mobject):
         If there are multiple opacities, this returns the
         first
         """
-        data = self.data if self.has_points() else self._data_defaults
+        data = self._data if self.has_points() else self._data_defaults
         return data["fill_rgba"][0, 3]
 
     def get_stroke_color(self) -> str:
-        data = self.data if self.has_points() else self._data_defaults
+        data = self._data if self.has_points() else self._data_defaults
         return rgb_to_hex(data["stroke_rgba"][0, :3])
 
     def get_stroke_width(self) -> float:
-        data = self.data if self.has_points() else self._data_defaults
+        data = self._data if self.has_points() else self._data_defaults
         return data["stroke_width"][0, 0]
 
     def get_stroke_opacity(self) -> float:
-        data = self.data if self.has_points() else self._data_defaults
+        data = self._data if self.has_points() else self._data_defaults
         return data["stroke_rgba"][0, 3]
 
     def get_color(self) -> str:
@@ -386,11 +484,11 @@ class VMobject(Mobject):
         return self.uniforms["anti_alias_width"]
 
     def has_stroke(self) -> bool:
-        data = self.data if len(self.data) > 0 else self._data_defaults
+        data = self._data if len(self._data) > 0 else self._data_defaults
         return any(data['stroke_width']) and any(data['stroke_rgba'][:, 3])
 
     def has_fill(self) -> bool:
-        data = self.data if len(self.data) > 0 else self._data_defaults
+        data = self._data if len(self._data) > 0 else self._data_defaults
         return any(data['fill_rgba'][:, 3])
 
     def get_opacity(self) -> float:
@@ -488,23 +586,51 @@ class VMobject(Mobject):
         Add cubic bezier curve to the path.
         """
         self.throw_error_if_no_points()
-        last = self.get_last_point()
-        # Note, this assumes all points are on the xy-plane
-        v1 = handle1 - last
-        v2 = anchor - handle2
-        angle = angle_between_vectors(v1, v2)
-        if self.use_simple_quadratic_approx and angle < 45 * DEG:
-            quad_approx = [last, find_intersection(last, v1, anchor, -v2), anchor]
-        else:
-            quad_approx = get_quadratic_approximation_of_cubic(
-                last, handle1, handle2, anchor
-            )
-        if self.consider_points_equal(quad_approx[1], last):
-            # This is to prevent subpaths from accidentally being marked closed
-            quad_approx[1] = midpoint(*quad_approx[1:3])
-        self.append_points(quad_approx[1:])
+        self.append_points(self.get_quadratic_approximation_of_cubics(
+            [self.get_last_point()], [handle1], [handle2], [anchor]
+        )[0])
         return self
 
+    def get_quadratic_approximation_of_cubics(
+        self,
+        anchors1: Vect3Array,
+        handles1: Vect3Array,
+        handles2: Vect3Array,
+        anchors2: Vect3Array,
+    ) -> list[Vect3Array]:
+        """
+        For each cubic bezier curve, given by the four arrays of control points,
+        returns the points which would follow its first anchor to approximate
+        it with quadratic bezier curves
+        """
+        a0, h0, h1, a1 = (
+            np.array(arr, dtype=float, ndmin=2)
+            for arr in (anchors1, handles1, handles2, anchors2)
+        )
+        quad_approx = get_quadratic_approximation_of_cubic(a0, h0, h1, a1).reshape((-1, 5, 3))
+        is_simple = np.zeros(len(a0), dtype=bool)
+        if self.use_simple_quadratic_approx:
+            # Note, this assumes all points are on the xy-plane
+            v1 = h0 - a0
+            v2 = a1 - h1
+            norms = np.sqrt((v1 * v1).sum(1)) * np.sqrt((v2 * v2).sum(1))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                angles = np.arccos(np.clip((v1 * v2).sum(1) / norms, -1, 1))
+            angles[norms == 0] = 0
+            is_simple = angles < 45 * DEG
+            if is_simple.any():
+                quad_approx[is_simple, 1] = find_intersection(
+                    a0[is_simple], v1[is_simple], a1[is_simple], -v2[is_simple]
+                )
+                quad_approx[is_simple, 2] = a1[is_simple]
+        # This is to prevent subpaths from accidentally being marked closed
+        is_null = (abs(quad_approx[:, 1] - a0) < self.tolerance_for_point_equality).all(1)
+        quad_approx[is_null, 1] = (quad_approx[is_null, 1] + quad_approx[is_null, 2]) / 2
+        return [
+            quads[1:3] if simple else quads[1:]
+            for quads, simple in zip(quad_approx, is_simple)
+        ]
+
     def add_quadratic_bezier_curve_to(self, handle: Vect3, anchor: Vect3, allow_null_curve=True) -> Self:
         self.throw_error_if_no_points()
         last_point = self.get_last_point()
@@ -525,6 +651,94 @@ class VMobject(Mobject):
         self.append_points(outer_interpolate(last_point, point, alphas[1:]))
         return self
 
+    def add_path_segments(
+        self,
+        commands: Sequence[str],
+        points: Vect3Array,
+        allow_null_curves: bool = True,
+    ) -> Self:
+        """
+        Builds onto the path from a sequence of commands, writing all the new
+        points at once.  The commands "M", "L", "Q", "C" and "Z" act like
+        start_new_path, add_line_to, add_quadratic_bezier_curve_to,
+        add_cubic_bezier_curve_to and close_path respectively, and take 1, 1,
+        2, 3 and 0 of the given points in turn.  If allow_null_curves is False,
+        lines and quadratic curves ending where they start are skipped.
+        """
+        if len(commands) == 0:
+            return self
+        coords = np.array(points, dtype=float).reshape((-1, 3)).tolist()
+        line_alphas = np.linspace(0, 1, 5 if self.long_lines else 3)[1:].tolist()
+        tol = self.tolerance_for_point_equality
+
+        def equal(p0, p1):
+            return all(abs(x1 - x0) < tol for x0, x1 in zip(p0, p1))
+
+        def line(p0, p1):
+            return [[(1 - a) * x0 + a * x1 for x0, x1 in zip(p0, p1)] for a in line_alphas]
+
+        if self.has_points():
+            last = self.get_last_point().tolist()
+            path_start = self._read_points()[self.get_path_topology().start_indices[-1]].tolist()
+        else:
+            last = path_start = None
+
+        # Each chunk is a list of new points, or the index of a cubic curve
+        # whose quadratic approximation is found after the loop
+        chunks = []
+        cubics = []
+        coord_iter = iter(coords)
+        for command in commands:
+            if last is None and command != "M":
+                self.throw_error_if_no_points()
+            if command == "M":
+                point = next(coord_iter)
+                if last is None:
+                    chunks.append([point])
+                    path_start = point
+                else:
+                    chunks.append([last, point])
+                    # See get_subpath_end_indices_from_points
+                    if any(abs(x1 - x0) > 1e-4 for x0, x1 in zip(last, point)):
+                        path_start = point
+                last = point
+            elif command == "L":
+                point = next(coord_iter)
+                if allow_null_curves or not equal(last, point):
+                    chunks.append(line(last, point))
+                    last = point
+            elif command == "Q":
+                handle, anchor = next(coord_iter), next(coord_iter)
+                if allow_null_curves or not equal(last, anchor):
+                    if equal(handle, last):
+                        # This is to prevent subpaths from accidentally being marked closed
+                        handle = [(x0 + x1) / 2 for x0, x1 in zip(handle, anchor)]
+                    chunks.append([handle, anchor])
+                    last = anchor
+            elif command == "C":
+                cubics.append([last, next(coord_iter), next(coord_iter), next(coord_iter)])
+                chunks.append(len(cubics) - 1)
+                last = cubics[-1][3]
+            elif command == "Z":
+                if not equal(path_start, last):
+                    chunks.append(line(last, path_start))
+                    last = path_start
+            else:
+                raise ValueError(f"Invalid path command {command}")
+
+        if cubics:
+            quad_approxs = self.get_quadratic_approximation_of_cubics(*np.array(cubics).transpose((1, 0, 2)))
+        new_points = np.array([
+            point
+            for chunk in chunks
+            for point in (quad_approxs[chunk] if isinstance(chunk, int) else chunk)
+        ], dtype=float)
+        if self.has_points():
+            self.append_points(new_points)
+        else:
+            self.set_points(new_points)
+        return self
+
     def add_smooth_curve_to(self, point: Vect3) -> Self:
         if self.has_new_path_started():
             self.add_line_to(point)
@@ -564,7 +778,7 @@ class VMobject(Mobject):
         return self
 
     def has_new_path_started(self) -> bool:
-        points = self.get_points()
+        points = self._read_points()
         if len(points) == 0:
             return False
         elif len(points) == 1:
@@ -572,17 +786,16 @@ class VMobject(Mobject):
         return self.consider_points_equal(points[-3], points[-2])
 
     def get_last_point(self) -> Vect3:
-        return self.get_points()[-1]
+        return self._read_points()[-1].copy()
 
     def get_reflection_of_last_handle(self) -> Vect3:
-        points = self.get_points()
+        points = self._read_points()
         return 2 * points[-1] - points[-2]
 
     def close_path(self, smooth: bool = False) -> Self:
         if self.is_closed():
             return self
-        ends = self.get_subpath_end_indices()
-        last_path_start = self.get_points()[0 if len(ends) == 1 else ends[-2] + 2]
+        last_path_start = self._read_points()[self.get_path_topology().start_indices[-1]]
         if smooth:
             self.add_smooth_curve_to(last_path_start)
         else:
@@ -590,9 +803,8 @@ class VMobject(Mobject):
         return self
 
     def is_closed(self) -> bool:
-        points = self.get_points()
-        ends = self.get_subpath_end_indices()
-        last_path_start = points[0 if len(ends) == 1 else ends[-2] + 2]
+        points = self._read_points()
+        last_path_start = points[self.get_path_topology().start_indices[-1]]
         return self.consider_points_equal(last_path_start, points[-1])
 
     def subdivide_curves_by_condition(
@@ -603,18 +815,11 @@ class VMobject(Mobject):
         for vmob in self.get_family(recurse):
             if not vmob.has_points():
                 continue
-            new_points = [vmob.get_points()[0]]
-            for tup in vmob.get_bezier_tuples():
-                n_divisions = tuple_to_subdivisions(*tup)
-                if n_divisions > 0:
-                    alphas = np.linspace(0, 1, n_divisions + 2)
-                    new_points.extend([
-                        partial_quadratic_bezier_points(tup, a1, a2)[1:]
-                        for a1, a2 in zip(alphas, alphas[1:])
-                    ])
-                else:
-                    new_points.append(tup[1:])
-            vmob.set_points(np.vstack(new_points))
+            n_subdivisions = [
+                max(tuple_to_subdivisions(*tup), 0)
+                for tup in vmob.get_bezier_tuples_from_points(vmob._read_points())
+            ]
+            vmob.set_points(subdivide_quadratic_bezier_points(vmob._read_points(), n_subdivisions))
         return self
 
     def subdivide_sharp_curves(
@@ -630,7 +835,7 @@ class VMobject(Mobject):
         return self
 
     def subdivide_intersections(self, recurse: bool = True, n_subdivisions: int = 1) -> Self:
-        path = self.get_anchors()
+        path = self._read_points()[::2]
         def tuple_to_subdivisions(b0, b1, b2):
             if line_intersects_path(b0, b1, path):
                 return n_subdivisions
@@ -717,13 +922,13 @@ class VMobject(Mobject):
         if not self.has_points():
             self.set_points(points)
             return self
-        if not self.consider_points_equal(points[0], self.get_points()[-1]):
+        if not self.consider_points_equal(points[0], self._read_points()[-1]):
             self.start_new_path(points[0])
         self.append_points(points[1:])
         return self
 
     def append_vectorized_mobject(self, vmobject: VMobject) -> Self:
-        self.add_subpath(vmobject.get_points())
+        self.add_subpath(vmobject._read_points())
         n = vmobject.get_num_points()
         self.data[-n:] = vmobject.data
         return self
@@ -740,39 +945,37 @@ class VMobject(Mobject):
     def get_bezier_tuples(self) -> Iterable[Vect3Array]:
         return self.get_bezier_tuples_from_points(self.get_points())
 
+    def get_path_topology_from_points(self, points: Vect3Array) -> PathTopology:
+        return PathTopology(points)
+
+    def get_path_topology(self) -> PathTopology:
+        """
+        Where the subpaths of this path start and end.  This is kept until
+        the points are next changed by a method wrapped with triggers_refresh.
+        """
+        if self._path_topology is None:
+            self._path_topology = self.get_path_topology_from_points(self._read_points())
+        return self._path_topology
+
     def get_subpath_end_indices_from_points(self, points: Vect3Array) -> np.ndarray:
-        atol = 1e-4  # TODO, this is too unsystematic
-        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
-        # An anchor point is considered the end of a path
-        # if its following handle is sitting on top of it.
-        # To disambiguate this from cases with many null
-        # curves in a row, we also check that the following
-        # anchor is genuinely distinct
-        is_end = (a0 == h).all(1) & (abs(h - a1) > atol).any(1)
-        end_indices = (2 * n for n, end in enumerate(is_end) if end)
-        return np.array([*end_indices, len(points) - 1])
+        return self.get_path_topology_from_points(points).end_indices
 
     def get_subpath_end_indices(self) -> np.ndarray:
-        if self.subpath_end_indices is None:
-            self.subpath_end_indices = self.get_subpath_end_indices_from_points(self.get_points())
-        return self.subpath_end_indices
+        return self.get_path_topology().end_indices
 
     def get_subpaths_from_points(self, points: Vect3Array) -> list[Vect3Array]:
-        if len(points) == 0:
-            return []
-        end_indices = self.get_subpath_end_indices_from_points(points)
-        start_indices = [0, *(end_indices[:-1] + 2)]
-        return [points[i1:i2 + 1] for i1, i2 in zip(start_indices, end_indices)]
+        return self.get_path_topology_from_points(points).get_subpaths(points)
 
     def get_subpaths(self) -> list[Vect3Array]:
-        return self.get_subpaths_from_points(self.get_points())
+        return self.get_path_topology().get_subpaths(self.get_points())
 
     def get_nth_curve_points(self, n: int) -> Vect3Array:
         assert n < self.get_num_curves()
         return self.get_points()[2 * n:2 * n + 3]
 
     def get_nth_curve_function(self, n: int) -> Callable[[float], Vect3]:
-        return bezier(self.get_nth_curve_points(n))
+        assert n < self.get_num_curves()
+        return bezier(self._read_points()[2 * n:2 * n + 3].copy())
 
     def get_num_curves(self) -> int:
         return self.get_num_points() // 2
@@ -794,23 +997,12 @@ class VMobject(Mobject):
         """
         if alpha == 0:
             return (0, 0.0)
-        partials: list[float] = [0]
-        for tup in self.get_bezier_tuples():
-            if self.consider_points_equal(tup[0], tup[1]):
-                # Don't consider null curves
-                arclen = 0
-            else:
-                # Approximate length with straight line from start to end
-                arclen = get_norm(tup[2] - tup[0])
-            partials.append(partials[-1] + arclen)
+        partials = self.get_partial_curve_lengths()
         full = partials[-1]
         if full == 0:
             return len(partials), 1.0
-        # First index where the partial length is more than alpha times the full length
-        index = next(
-            (i for i, x in enumerate(partials) if x >= full * alpha),
-            len(partials) - 1  # Default
-        )
+        # First index where the partial length is at least alpha times the full length
+        index = min(int(np.searchsorted(partials, full * alpha)), len(partials) - 1)
         residue = float(inverse_interpolate(
             partials[index - 1] / full, partials[index] / full, alpha
         ))
@@ -826,6 +1018,54 @@ class VMobject(Mobject):
         index, residue = self.curve_and_prop_of_partial_point(alpha)
         return self.get_nth_curve_function(index)(residue)
 
+    def curves_and_props_of_partial_points(
+        self,
+        alphas: Iterable[float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized version of curve_and_prop_of_partial_point, returning
+        an array of curve indices and an array of proportions along them
+        """
+        alphas = np.clip(np.array(alphas, dtype=float), 0, 1)
+        partials = self.get_partial_curve_lengths()
+        full = partials[-1]
+        if full == 0:
+            return np.zeros(len(alphas), dtype=int), np.zeros(len(alphas))
+        targets = full * alphas
+        indices = np.searchsorted(partials, targets).clip(1, len(partials) - 1)
+        lows = partials[indices - 1]
+        spans = partials[indices] - lows
+        residues = np.divide(targets - lows, spans, out=np.zeros_like(targets), where=(spans > 0))
+        return indices - 1, residues.clip(0, 1)
+
+    def points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Equivalent to calling point_from_proportion for each alpha,
+        but with all of them evaluated at once
+        """
+        alphas = np.array(alphas, dtype=float)
+        if self.get_num_curves() == 0:
+            point = self.get_start() if self.has_points() else self.get_center()
+            return np.repeat([point], len(alphas), axis=0)
+        indices, residues = self.curves_and_props_of_partial_points(alphas)
+        points = self._read_points()
+        anchors1, handles, anchors2 = (points[2 * indices + k] for k in range(3))
+        t = residues[:, np.newaxis]
+        return (1 - t)**2 * anchors1 + 2 * (1 - t) * t * handles + t**2 * anchors2
+
+    def tangents_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Unit tangent vectors to the path at each proportion alpha along it
+        """
+        alphas = np.array(alphas, dtype=float)
+        if self.get_num_curves() == 0:
+            return np.zeros((len(alphas), 3))
+        indices, residues = self.curves_and_props_of_partial_points(alphas)
+        points = self._read_points()
+        anchors1, handles, anchors2 = (points[2 * indices + k] for k in range(3))
+        t = residues[:, np.newaxis]
+        return normalize_along_axis((1 - t) * (handles - anchors1) + t * (anchors2 - handles), 1)
+
     def get_anchors_and_handles(self) -> list[Vect3]:
         """
         returns anchors1, handles, anchors2,
@@ -846,12 +1086,38 @@ class VMobject(Mobject):
         return self.get_points()[::2]
 
     def get_points_without_null_curves(self, atol: float = 1e-9) -> Vect3Array:
-        new_points = [self.get_points()[0]]
-        for tup in self.get_bezier_tuples():
+        points = self._read_points()
+        new_points = [points[0]]
+        for tup in self.get_bezier_tuples_from_points(points):
             if get_norm(tup[1] - tup[0]) > atol or get_norm(tup[2] - tup[0]) > atol:
                 new_points.append(tup[1:])
         return np.vstack(new_points)
 
+    def get_curve_lengths(self) -> np.ndarray:
+        """
+        Arc length of each curve.  Null curves, marking the ends
+        of subpaths, are taken to have length zero.
+        """
+        return np.diff(self.get_partial_curve_lengths())
+
+    def get_partial_curve_lengths(self) -> np.ndarray:
+        """
+        Cumulative arc lengths of the curves, starting at 0, so that entry n
+        is the length of the path up to the start of its nth curve.  This is
+        cached until the data next changes, and should not be written to.
+        """
+        # Reading the points first folds in any model matrix, which changes the version
+        points = self._read_points()
+        if self._partial_curve_lengths is None or self._partial_curve_lengths[0] != self._data_version:
+            anchors1, handles, anchors2 = points[0:-1:2], points[1::2], points[2::2]
+            lengths = quadratic_bezier_lengths(anchors1, handles, anchors2)
+            is_null = (np.abs(handles - anchors1) < self.tolerance_for_point_equality).all(1)
+            lengths[is_null] = 0
+            partials = np.hstack([0, np.cumsum(lengths)])
+            partials.flags.writeable = False
+            self._partial_curve_lengths = (self._data_version, partials)
+        return self._partial_curve_lengths[1]
+
     def get_arc_length(self, n_sample_points: int | None = None) -> float:
         if n_sample_points is not None:
             points = np.array([
@@ -859,7 +1125,7 @@ class VMobject(Mobject):
                 for a in np.linspace(0, 1, n_sample_points)
             ])
             return poly_line_length(points)
-        points = self.get_points()
+        points = self._read_points()
         inner_len = poly_line_length(points[::2])
         outer_len = poly_line_length(points)
         return interpolate(inner_len, outer_len, 1 / 3)
@@ -872,7 +1138,7 @@ class VMobject(Mobject):
         if not self.has_points():
             return np.zeros(3)
 
-        p0 = self.get_anchors()
+        p0 = self._read_points()[::2]
         p1 = np.vstack([p0[1:], p0[0]])
 
         # Each term goes through all edges [(x0, y0, z0), (x1, y1, z1)]
@@ -887,25 +1153,35 @@ class VMobject(Mobject):
     def get_unit_normal(self, refresh: bool = False) -> Vect3:
         if self.get_num_points() < 3:
             return OUT
+        if self._has_model_transform:
+            self.fold_model_matrix()
 
         if not self.needs_new_unit_normal and not refresh:
-            return self.data["base_normal"][1, :]
+            return self._data["base_normal"][1, :]
 
         area_vect = self.get_area_vector()
         area = get_norm(area_vect)
         if area > 0:
             normal = area_vect / area
         else:
-            p = self.get_points()
+            p = self._read_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
-        self.data["base_normal"][1::2] = normal
+        self._write_data_if_changed("base_normal", normal, slice(1, None, 2))
         self.needs_new_unit_normal = False
         return normal
 
     def refresh_unit_normal(self) -> Self:
         self.needs_new_unit_normal = True
+        self._note_data_written()
         return self
 
+    def _fold_matrix_into_data(self, matrix: np.ndarray):
+        super()._fold_matrix_into_data(matrix)
+        # The model matrix is a similarity, so normals only need its rotation
+        linear_map = matrix[:3, :3]
+        normals = self.data["base_normal"][1::2]
+        normals[:] = np.dot(normals, linear_map.T) / get_norm(linear_map[:, 0])
+
     def rotate(
         self,
         angle: float,
@@ -915,7 +1191,8 @@ class VMobject(Mobject):
     ) -> Self:
         super().rotate(angle, axis, about_point, **kwargs)
         for mob in self.get_family():
-            mob.refresh_unit_normal()
+            if not mob._has_model_transform:
+                mob.refresh_unit_normal()
         return self
 
     def ensure_positive_orientation(self, recurse=True) -> Self:
@@ -926,7 +1203,7 @@ class VMobject(Mobject):
 
     # Alignment
     def align_points(self, vmobject: VMobject) -> Self:
-        if self.get_num_points() == len(vmobject.get_points()):
+        if self.get_num_points() == vmobject.get_num_points():
             for mob in [self, vmobject]:
                 mob.get_joint_angles()
             return self
@@ -937,45 +1214,68 @@ class VMobject(Mobject):
             if not mob.has_points():
                 mob.start_new_path(mob.get_center())
 
+        # The same pairs of shapes are often aligned many times, as with
+        # transforms back and forth, so the results are remembered
+        key = (self.get_points_digest(), vmobject.get_points_digest(), self.tolerance_for_point_equality)
+        aligned = ALIGNED_POINTS.get(key)
+        if aligned is None:
+            aligned = tuple(
+                points.astype(np.float32)
+                for points in self.get_aligned_points(vmobject)
+            )
+            for points in aligned:
+                points.flags.writeable = False
+            ALIGNED_POINTS.add(key, aligned)
+
+        for mob, new_points in zip([self, vmobject], aligned):
+            mob.resize_points(len(new_points), resize_func=resize_preserving_order)
+            mob.set_points(new_points)
+            mob.get_joint_angles()
+        return self
+
+    def get_points_digest(self) -> bytes:
+        points = np.ascontiguousarray(self._read_points())
+        return hashlib.blake2b(points, digest_size=16).digest()
+
+    def get_aligned_points(self, vmobject: VMobject) -> tuple[Vect3Array, Vect3Array]:
+        """
+        Points for self and vmobject with the same number of curves and
+        subpaths, pairing off their subpaths from longest to shortest
+        """
         # Figure out what the subpaths are, and align
-        subpaths1 = self.get_subpaths()
-        subpaths2 = vmobject.get_subpaths()
-        for subpaths in [subpaths1, subpaths2]:
-            subpaths.sort(key=lambda sp: -sum(
-                get_norm(p2 - p1)
-                for p1, p2 in zip(sp, sp[1:])
-            ))
+        subpaths1, subpaths2 = [
+            [subpaths[i] for i in np.argsort(-mob.get_subpath_polygon_lengths(), kind="stable")]
+            for mob, subpaths in [(self, self.get_subpaths()), (vmobject, vmobject.get_subpaths())]
+        ]
         n_subpaths = max(len(subpaths1), len(subpaths2))
 
-        # Start building new ones
-        new_subpaths1 = []
-        new_subpaths2 = []
-
         def get_nth_subpath(path_list, n):
             if n >= len(path_list):
                 return np.vstack([path_list[0][:-1], path_list[0][::-1]])
             return path_list[n]
 
-        for n in range(n_subpaths):
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // 2)
-            diff2 = max(0, (len(sp1) - len(sp2)) // 2)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            if n > 0:
-                # Add intermediate anchor to mark path end
-                new_subpaths1.append(new_subpaths1[-1][-1])
-                new_subpaths2.append(new_subpaths2[-1][-1])
-            new_subpaths1.append(sp1)
-            new_subpaths2.append(sp2)
-
-        for mob, paths in [(self, new_subpaths1), (vmobject, new_subpaths2)]:
-            new_points = np.vstack(paths)
-            mob.resize_points(len(new_points), resize_func=resize_preserving_order)
-            mob.set_points(new_points)
-            mob.get_joint_angles()
-        return self
+        pairs = [
+            (get_nth_subpath(subpaths1, n), get_nth_subpath(subpaths2, n))
+            for n in range(n_subpaths)
+        ]
+        return tuple(
+            self.insert_n_curves_to_subpaths(
+                [max(0, (len(sp2) - len(sp1)) // 2) for sp1, sp2 in sps],
+                [sp1 for sp1, sp2 in sps],
+            )
+            for sps in (pairs, [(sp2, sp1) for sp1, sp2 in pairs])
+        )
+
+    def get_subpath_polygon_lengths(self) -> np.ndarray:
+        """
+        Total distance between consecutive points, anchors and handles
+        alike, along each subpath
+        """
+        points = self._read_points()
+        topology = self.get_path_topology()
+        distances = np.sqrt(((points[1:] - points[:-1])**2).sum(1))
+        partials = np.hstack([0, np.cumsum(distances, dtype=float)])
+        return partials[topology.end_indices] - partials[topology.start_indices]
 
     def insert_n_curves(self, n: int, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
@@ -985,36 +1285,46 @@ class VMobject(Mobject):
         return self
 
     def insert_n_curves_to_point_list(self, n: int, points: Vect3Array) -> Vect3Array:
-        if len(points) == 1:
-            return np.repeat(points, 2 * n + 1, 0)
+        return self.insert_n_curves_to_subpaths([n], [points])
 
-        bezier_tuples = list(self.get_bezier_tuples_from_points(points))
-        atol = self.tolerance_for_point_equality
-        norms = [
-            0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
+    def insert_n_curves_to_subpaths(
+        self,
+        ns: Sequence[int],
+        subpaths: Sequence[Vect3Array],
+    ) -> Vect3Array:
+        """
+        Inserts ns[i] curves into subpaths[i] for each i, all at once, and
+        returns the results joined into one path, each subpath followed by a
+        copy of its last point to mark its end
+        """
+        # Subpaths of a single point just have it repeated
+        ns, subpaths = zip(*(
+            (0, np.repeat(sp, 2 * n + 1, 0)) if len(sp) == 1 else (n, sp)
+            for n, sp in zip(ns, subpaths)
+        ))
+        points = np.vstack([part for sp in subpaths for part in (sp, sp[-1:])][:-1])
 
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
-        return np.vstack(new_points)
+        # Curves are split among the subpaths and the null curves joining them,
+        # with insertions going to whichever curves are longest at the time
+        atol = self.tolerance_for_point_equality
+        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+        norms = np.sqrt(((a1 - a0)**2).sum(1))
+        norms[np.sqrt(((h - a0)**2).sum(1)) < atol] = 0
+        group_sizes = [1] * (2 * len(subpaths) - 1)
+        group_sizes[0::2] = [len(sp) // 2 for sp in subpaths]
+        group_ns = [0] * (2 * len(subpaths) - 1)
+        group_ns[0::2] = ns
+        ipc = distribute_subdivisions(norms, group_sizes, group_ns)
+
+        # What was once a single quadratic curve defined
+        # by a bezier tuple will now be broken into n_inserts + 1
+        # smaller quadratic curves
+        return subdivide_quadratic_bezier_points(points, ipc)
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
-        vm_points = vmobject.get_points()
-        self.data["joint_angle"] = vmobject.data["joint_angle"]
+        vm_points = vmobject._read_points()
+        self.data["joint_angle"] = vmobject._data["joint_angle"]
         if a <= 0 and b >= 1:
             self.set_points(vm_points, refresh=False)
             return self
@@ -1054,6 +1364,160 @@ class VMobject(Mobject):
         self.set_points(new_points, refresh=False)
         return self
 
+    def set_partial_bounds(self, a: float, b: float) -> Self:
+        """
+        Analog to pointwise_become_partial which leaves the points alone, with
+        the shaders only drawing the portion of the path between proportions
+        a and b.  This only affects self, not its submobjects.
+
+        Fill is drawn relative to the first point of the full path, so for
+        filled paths this only matches pointwise_become_partial when a is 0.
+        """
+        self.uniforms["partial_start"] = float(a)
+        self.uniforms["partial_end"] = float(b)
+        return self
+
+    @Mobject.affects_family_data
+    def set_dashes(
+        self,
+        num_dashes: int = 15,
+        positive_space_ratio: float = 0.5,
+        phase: float = 0.0,
+        recurse: bool = True
+    ) -> Self:
+        """
+        Have the shaders draw the stroke as num_dashes evenly spaced dashes,
+        spread by arc length so that the last dash ends at the end of the path
+        """
+        if num_dashes > 0:
+            period = 1.0 / (num_dashes - 1 + positive_space_ratio)
+            dash_length = positive_space_ratio * period
+        else:
+            dash_length = 0.0
+        self.set_uniform(
+            recurse,
+            dash_length=dash_length,
+            dash_ratio=positive_space_ratio,
+            dash_phase=float(phase),
+        )
+        return self
+
+    def clear_dashes(self, recurse: bool = True) -> Self:
+        self.set_uniform(recurse, dash_length=0.0, dash_phase=0.0)
+        return self
+
+    def is_dashed(self) -> bool:
+        return self.uniforms["dash_length"] > 0
+
+    def get_dash_phase(self) -> float:
+        return self.uniforms["dash_phase"]
+
+    def set_dash_phase(self, phase: float, recurse: bool = True) -> Self:
+        """
+        Phase is measured in full dash periods.  Only the uniform changes, so
+        this can be animated, e.g. for marching ants, without any data being
+        re-uploaded.
+        """
+        for mob in self.get_family(recurse):
+            mob.uniforms["dash_phase"] = float(phase)
+        return self
+
+    def get_dash_bounds(self) -> list[tuple[float, float]]:
+        """
+        Start and end of each dash drawn by the shaders, as proportions
+        of the arc length, like the alpha of point_from_proportion
+        """
+        length, ratio, phase = (
+            self.uniforms[key]
+            for key in ["dash_length", "dash_ratio", "dash_phase"]
+        )
+        if length <= 0:
+            return [(0.0, 1.0)]
+        if ratio <= 0:
+            return []
+        period = length / ratio
+        indices = np.arange(np.floor(-phase - ratio), np.ceil(1.0 / period - phase) + 1)
+        starts = np.clip((indices + phase) * period, 0, 1)
+        ends = np.clip((indices + phase + ratio) * period, 0, 1)
+        return [(a, b) for a, b in zip(starts, ends) if b > a]
+
+    def get_dashes(self) -> list[Self]:
+        """
+        One solid copy of this mobject's own path for each dash
+        which the shaders draw along it, without submobjects
+        """
+        template = self.copy()
+        template.set_submobjects([])
+        template.clear_dashes()
+        if template.get_num_curves() == 0:
+            return []
+        # The shaders place dashes by arc length, treating each curve as having
+        # constant speed, so this converts bounds on the arc length into the
+        # proportions of curves which pointwise_become_partial works with
+        bounds = np.array(self.get_dash_bounds()).reshape(-1)
+        indices, residues = template.curves_and_props_of_partial_points(bounds)
+        alphas = (indices + residues) / template.get_num_curves()
+        return [
+            template.copy().pointwise_become_partial(template, a, b)
+            for a, b in alphas.reshape(-1, 2)
+        ]
+
+    def break_into_dashes(self) -> Self:
+        """
+        Replace the dashes which the shaders draw along this mobject's own path
+        by submobjects, one per dash, placed before any existing submobjects
+        """
+        if not self.is_dashed() or not self.has_points():
+            return self
+        dashes = self.get_dashes()
+        self.clear_points()
+        self.clear_dashes(recurse=False)
+        self.set_submobjects([*dashes, *self.submobjects])
+        return self
+
+    def interpolate(
+        self,
+        mobject1: Mobject,
+        mobject2: Mobject,
+        alpha: float,
+        path_func: Callable[[np.ndarray, np.ndarray, float], np.ndarray] = straight_path
+    ) -> Self:
+        was_dashed = self.is_dashed()
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if isinstance(mobject1, VMobject) and isinstance(mobject2, VMobject):
+            if mobject1.is_dashed() != mobject2.is_dashed():
+                self.interpolate_dashes_with_solid(mobject1, mobject2, alpha)
+        if self.is_dashed() and not was_dashed:
+            # Arc proportions are only refreshed for dashed mobjects,
+            # see refresh_shader_data
+            self.note_changed_data()
+        return self
+
+    def interpolate_dashes_with_solid(
+        self,
+        mobject1: VMobject,
+        mobject2: VMobject,
+        alpha: float
+    ) -> None:
+        """
+        A solid stroke looks the same as dashes of any length which fill their
+        whole period.  So rather than having the dashes grow from a length of 0,
+        this gives the solid side the dash length and phase of the dashed side,
+        with the gaps opening up as the ratio goes from 1 to that of the dashes.
+        """
+        dashed, solid = (mobject1, mobject2) if mobject1.is_dashed() else (mobject2, mobject1)
+        ratio1, ratio2 = (
+            mob.uniforms["dash_ratio"] if mob is dashed else 1.0
+            for mob in (mobject1, mobject2)
+        )
+        ratio = interpolate(ratio1, ratio2, alpha)
+        keys = ["dash_length", "dash_ratio", "dash_phase"]
+        if ratio < 1:
+            self.uniforms.update({key: dashed.uniforms[key] for key in keys})
+            self.uniforms["dash_ratio"] = ratio
+        else:
+            self.uniforms.update({key: solid.uniforms[key] for key in keys})
+
     def get_subcurve(self, a: float, b: float) -> Self:
         vmob = self.copy()
         vmob.pointwise_become_partial(self, a, b)
@@ -1075,7 +1539,7 @@ class VMobject(Mobject):
         # Figure out how to triangulate the interior to know
         # how to send the points as to the vertex shader.
         # First triangles come directly from the points
-        points = self.get_points()
+        points = self._read_points()
 
         if len(points) <= 1:
             return np.zeros(0, dtype='i4')
@@ -1123,6 +1587,7 @@ class VMobject(Mobject):
     def refresh_joint_angles(self) -> Self:
         for mob in self.get_family():
             mob.needs_new_joint_angles = True
+            mob._note_data_written()
         return self
 
     def get_joint_angles(self, refresh: bool = False) -> np.ndarray:
@@ -1131,19 +1596,98 @@ class VMobject(Mobject):
         product between tangent vectors at a joint
         """
         if not self.needs_new_joint_angles and not refresh:
-            return self.data["joint_angle"][:, 0]
+            return self._data["joint_angle"][:, 0]
 
         if "joint_angle" in self.locked_data_keys:
-            return self.data["joint_angle"][:, 0]
+            return self._data["joint_angle"][:, 0]
 
         self.needs_new_joint_angles = False
         self._data_has_changed = True
 
-        # Rotate points such that positive z direction is the normal
-        points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
-
+        points = self._read_points()
         if len(points) < 3:
-            return self.data["joint_angle"][:, 0]
+            return self._data["joint_angle"][:, 0]
+
+        normal = self.get_unit_normal()
+        topology = self.get_path_topology()
+        start_indices, end_indices = topology.start_indices, topology.end_indices
+
+        if self._joint_angle_cache is not None and (self._joint_angle_cache[0] == normal).all():
+            angles = self.update_joint_angles(points, normal, start_indices, end_indices)
+        else:
+            angles = self.get_joint_angles_from_points(points, normal, start_indices, end_indices)
+        self._joint_angle_cache = (normal.copy(), points.copy(), angles)
+        self._write_data_if_changed("joint_angle", angles, (slice(None), 0))
+        return self._data["joint_angle"][:, 0]
+
+    def update_joint_angles(
+        self,
+        points: Vect3Array,
+        normal: Vect3,
+        start_indices: np.ndarray,
+        end_indices: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Reuses the angles from the last time these were computed for all
+        joints before the first changed point, so that a path which only
+        grows at its end has just its new tail computed
+        """
+        old_points, old_angles = self._joint_angle_cache[1:]
+        n = min(len(old_points), len(points))
+        changes = np.flatnonzero((old_points[:n] != points[:n]).any(1))
+        first_change = changes[0] if len(changes) > 0 else n
+        if first_change == len(points) == len(old_points):
+            return old_angles.copy()
+
+        # Joints up to the anchor w only depend on unchanged points, save
+        # for the start of a subpath running past w, whose closure might change
+        w = 2 * ((first_change - 4) // 2)
+        if w < 2:
+            return self.get_joint_angles_from_points(points, normal, start_indices, end_indices)
+        index = np.searchsorted(start_indices, w, side="right") - 1
+        if w in (start_indices[index], end_indices[index]):
+            # Recompute from the subpath starting at or after w, along with
+            # the curve before it for the tangent into that start
+            new_start = w if w == start_indices[index] else w + 2
+            in_tail = start_indices >= new_start
+            angles = np.zeros(len(points))
+            angles[:new_start - 1] = old_angles[:new_start - 1]
+            angles[new_start - 1:] = self.get_joint_angles_from_points(
+                points[new_start - 2:], normal,
+                start_indices[in_tail] - new_start + 2,
+                end_indices[in_tail] - new_start + 2,
+            )[1:]
+            return angles
+        # Otherwise w is inside a subpath, so compute everything after it as
+        # part of a path which begins with that subpath's first curve
+        sub_start = start_indices[index]
+        later = start_indices > w
+        offset = w - 4
+        tail_angles = self.get_joint_angles_from_points(
+            np.vstack([points[sub_start:sub_start + 2], points[w - 2:]]), normal,
+            np.array([0, *(start_indices[later] - offset)]),
+            np.array([end_indices[index] - offset, *(end_indices[later] - offset)]),
+        )
+        angles = np.zeros(len(points))
+        angles[:w] = old_angles[:w]
+        angles[sub_start] = tail_angles[0]
+        angles[w:] = tail_angles[4:]
+        return angles
+
+    def get_joint_angles_from_points(
+        self,
+        points: Vect3Array,
+        normal: Vect3,
+        start_indices: np.ndarray,
+        end_indices: np.ndarray,
+    ) -> np.ndarray:
+        non_trivial = start_indices != end_indices
+        starts = start_indices[non_trivial]
+        ends = end_indices[non_trivial]
+        is_closed = (points[starts] == points[ends]).all(1)
+
+        # Rotate points such that positive z direction is the normal
+        points = points @ rotation_between_vectors(OUT, normal)
 
         # Find all the unit tangent vectors at each joint
         a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
@@ -1161,17 +1705,12 @@ class VMobject(Mobject):
         v_out[1::2] = h_to_a1
 
         # Joint up closed loops, or mark unclosed paths as such
-        ends = self.get_subpath_end_indices()
-        starts = [0, *(e + 2 for e in ends[:-1])]
-        for start, end in zip(starts, ends):
-            if start == end:
-                continue
-            if (points[start] == points[end]).all():
-                v_in[start] = v_out[end - 1]
-                v_out[end] = v_in[start + 1]
-            else:
-                v_in[start] = v_out[start]
-                v_out[end] = v_in[end]
+        closed_starts, closed_ends = starts[is_closed], ends[is_closed]
+        open_starts, open_ends = starts[~is_closed], ends[~is_closed]
+        v_in[closed_starts] = v_out[closed_ends - 1]
+        v_out[closed_ends] = v_in[closed_starts + 1]
+        v_in[open_starts] = v_out[open_starts]
+        v_out[open_ends] = v_in[open_ends]
 
         # Find the angles between vectors into each vertex, and out of it
         angles_in = np.arctan2(v_in[:, 1], v_in[:, 0])
@@ -1179,8 +1718,7 @@ class VMobject(Mobject):
         angle_diffs = angles_out - angles_in
         angle_diffs[angle_diffs < -PI] += TAU
         angle_diffs[angle_diffs > PI] -= TAU
-        self.data["joint_angle"][:, 0] = angle_diffs
-        return self.data["joint_angle"][:, 0]
+        return angle_diffs
 
     def lock_matching_data(self, vmobject1: VMobject, vmobject2: VMobject) -> Self:
         for mob in [self, vmobject1, vmobject2]:
@@ -1193,7 +1731,7 @@ class VMobject(Mobject):
         def wrapper(self, *args, refresh=True, **kwargs):
             func(self, *args, **kwargs)
             if refresh:
-                self.subpath_end_indices = None
+                self._path_topology = None
                 self.refresh_joint_angles()
                 self.refresh_unit_normal()
             return self
@@ -1218,7 +1756,7 @@ class VMobject(Mobject):
             inner_ends = mob.get_subpath_end_indices()[:-1]
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
-            self.subpath_end_indices = None
+            mob._path_topology = None
         return super().reverse_points()
 
     @triggers_refresh
@@ -1257,10 +1795,19 @@ class VMobject(Mobject):
         self.apply_points_function(
             lambda points: np.dot(points, rot_matrix_T),
             about_point,
+            affine_matrix=get_affine_matrix(rot_matrix_T.T),
             **kwargs
         )
+        arena = self.get_family_arena()
+        if arena is not None:
+            # Rotate all normals at once, rather than recomputing them for
+            # each submobject. Base points are reset before rendering anyway.
+            arena["base_normal"][:] = np.dot(arena["base_normal"], rot_matrix_T)
+            return self
         for mob in self.get_family():
-            mob.get_unit_normal(refresh=True)
+            # Normals of mobjects deferring to a model matrix are rotated in the shader
+            if not mob._has_model_transform:
+                mob.get_unit_normal(refresh=True)
         return self
 
     def set_animating_status(self, is_animating: bool, recurse: bool = True):
@@ -1274,7 +1821,7 @@ class VMobject(Mobject):
     def init_shader_wrapper(self, ctx: Context):
         self.shader_wrapper = VShaderWrapper(
             ctx=ctx,
-            vert_data=self.data,
+            vert_data=np.zeros(0, dtype=self.get_shader_dtype()),
             mobject_uniforms=self.uniforms,
             code_replacements=self.shader_code_replacements,
             stroke_behind=self.stroke_behind,
@@ -1288,11 +1835,23 @@ class VMobject(Mobject):
         super().refresh_shader_wrapper_id()
         return self
 
-    def get_shader_data(self) -> np.ndarray:
+    def refresh_shader_data(self) -> None:
         # Do we want this elsewhere? Say whenever points are refreshed or something?
         self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
-        return super().get_shader_data()
+        if self.has_points():
+            self._write_data_if_changed("base_normal", self._data["point"][0], slice(0, None, 2))
+        self._write_data_if_changed("proportion", np.linspace(0, 1, len(self._data)), (slice(None), 0))
+        if self.is_dashed() and self.has_points():
+            self.refresh_arc_proportions()
+
+    def refresh_arc_proportions(self) -> None:
+        partials = self.get_partial_curve_lengths().copy()
+        if partials[-1] > 0:
+            partials /= partials[-1]
+        arc_proportions = np.zeros(len(self._data))
+        arc_proportions[0::2] = partials
+        arc_proportions[1::2] = 0.5 * (partials[:-1] + partials[1:])
+        self._write_data_if_changed("arc_proportion", arc_proportions, (slice(None), 0))
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return self.get_outer_vert_indices()
@@ -1339,7 +1898,7 @@ class VectorizedPoint(Point, VMobject):
 class CurvesAsSubmobjects(VGroup):
     def __init__(self, vmobject: VMobject, **kwargs):
         super().__init__(**kwargs)
-        for tup in vmobject.get_bezier_tuples():
+        for tup in vmobject.get_bezier_tuples_from_points(vmobject._read_points()):
             part = VMobject()
             part.set_points(tup)
             part.match_style(vmobject)
@@ -1347,6 +1906,17 @@ class CurvesAsSubmobjects(VGroup):
 
 
 class DashedVMobject(VMobject):
+    """
+    A copy of the path of vmobject, with its stroke drawn in dashes by the
+    shaders (see VMobject.set_dashes), and likewise for its submobjects
+
+    Indexing or iterating over a DashedVMobject treats it as a group of
+    dashes, as when each dash was its own submobject.  The first time that
+    happens, the dashes are broken out into submobjects, after which they
+    can be styled or moved individually.  Its len only counts dashes once
+    they're broken out, so that aligning families for a transform leaves
+    them drawn by the shaders.
+    """
     def __init__(
         self,
         vmobject: VMobject,
@@ -1355,26 +1925,20 @@ class DashedVMobject(VMobject):
         **kwargs
     ):
         super().__init__(**kwargs)
+        self.set_points(vmobject.get_points())
+        self.add(*(
+            DashedVMobject(sm, num_dashes, positive_space_ratio)
+            for sm in vmobject.submobjects
+        ))
+        self.match_style(vmobject, recurse=False)
+        self.set_dashes(num_dashes, positive_space_ratio, recurse=False)
 
-        if num_dashes > 0:
-            # End points of the unit interval for division
-            alphas = np.linspace(0, 1, num_dashes + 1)
-
-            # This determines the length of each "dash"
-            full_d_alpha = (1.0 / num_dashes)
-            partial_d_alpha = full_d_alpha * positive_space_ratio
-
-            # Rescale so that the last point of vmobject will
-            # be the end of the last dash
-            alphas /= (1 - full_d_alpha + partial_d_alpha)
+    def split(self) -> list[VMobject]:
+        self.break_into_dashes()
+        return super().split()
 
-            self.add(*[
-                vmobject.get_subcurve(alpha, alpha + partial_d_alpha)
-                for alpha in alphas[:-1]
-            ])
-        # Family is already taken care of by get_subcurve
-        # implementation
-        self.match_style(vmobject, recurse=False)
+    def __len__(self) -> int:
+        return len(self.submobjects)
 
 
 class VHighlight(VGroup):
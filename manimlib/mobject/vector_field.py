@@ -426,7 +426,7 @@ class StreamLines(VGroup):
             for line in self.submobjects:
                 norms = [
                     get_norm(self.func(cs.p2c(point)))
-                    for point in line.get_points()
+                    for point in line._read_points()
                 ]
                 rgbs = values_to_rgbs(norms)
                 rgbas = np.zeros((len(rgbs), 4))
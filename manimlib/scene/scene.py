@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+import io
+import itertools as it
+import os
+import pickle
 import platform
 import random
+import tempfile
 import time
+import weakref
+import zlib
 from functools import wraps
 from contextlib import contextmanager
 from contextlib import ExitStack
@@ -28,11 +35,13 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.shader_wrapper import get_vertex_buffer_pool
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
 from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.sounds import play_sound
+from manimlib.utils import serialization
 from manimlib.utils.color import color_to_rgba
 from manimlib.window import Window
 
@@ -55,6 +64,12 @@ class Scene(object):
     scroll_sensitivity: float = 20
     drag_to_pan: bool = True
     max_num_saved_states: int = 50
+    # Memory, in bytes, which saved states may take up before the oldest are
+    # packed (compressed) and then, if need be, dropped.  None means no limit
+    state_memory_limit: int | None = None
+    # If set, packed states are written to files in this directory
+    # rather than being kept in memory
+    state_spill_directory: str | None = None
     default_camera_config: dict = dict()
     default_file_writer_config: dict = dict()
     samples = 0
@@ -179,6 +194,7 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        get_vertex_buffer_pool(self.camera.ctx).release_free_buffers()
         if self.window:
             self.window.destroy()
             self.window = None
@@ -259,6 +275,19 @@ class Scene(object):
         if not self.skip_animations:
             self.file_writer.write_frame(self.camera)
 
+    def get_vertex_buffer_stats(self) -> dict[str, int]:
+        """
+        Statistics on the pool of vertex buffers, where orphaned buffers are those
+        held by shader wrappers this scene no longer renders, e.g. those of mobjects
+        which were removed from the scene but are still referenced elsewhere
+        """
+        active_wrappers = [
+            wrapper
+            for group in self.render_groups
+            for wrapper in getattr(group, "shader_wrappers", [])
+        ]
+        return get_vertex_buffer_pool(self.camera.ctx).get_stats(active_wrappers)
+
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
@@ -671,6 +700,37 @@ class Scene(object):
         self.undo_stack.append(state)
         if len(self.undo_stack) > self.max_num_saved_states:
             self.undo_stack.pop(0)
+        self.limit_state_memory(self.undo_stack)
+
+    def limit_state_memory(self, states: list[SceneState], allow_dropping: bool = True) -> None:
+        """
+        Keeps the memory taken by a list of states, ordered from oldest to
+        newest, within state_memory_limit.  States sharing copies of unchanged
+        mobjects are only counted once, and the newest state is left alone.
+        """
+        limit = self.state_memory_limit
+        if limit is None or len(states) < 2:
+            return
+        counted = set()
+        usage = states[-1].get_memory_usage(counted)
+        all_packed = True
+        for state in reversed(states[:-1]):
+            usage += state.get_memory_usage(counted)
+            if usage > limit and not state.is_packed():
+                all_packed = state.pack(self.state_spill_directory) and all_packed
+        if not allow_dropping:
+            return
+        if not all_packed:
+            # Rather than dropping states to make up for those which couldn't
+            # be packed (with a warning from SceneState.pack), keep them all
+            return
+
+        def get_total_usage():
+            counted = set()
+            return sum(state.get_memory_usage(counted) for state in states)
+
+        while len(states) > 1 and get_total_usage() > limit:
+            states.pop(0)
 
     def undo(self):
         if self.undo_stack:
@@ -879,10 +939,77 @@ class Scene(object):
         ))
 
 
+class PackedMobjectData():
+    """
+    Data of the mobjects held by packed SceneStates, keeping each buffer
+    once, compressed or written to a file, however many states refer to it.
+    Since copies share their data until written, a run of states tends to
+    refer to the same buffers for the mobjects which didn't change.
+    """
+    def __init__(self):
+        # Key -> [payload, dtype, shape, number of states referring to it]
+        self.entries: dict[int, list] = dict()
+        # Id of each array still in memory -> weak reference to it, and its key
+        self.keys_by_id: dict[int, tuple[weakref.ref, int]] = dict()
+        self.new_keys = it.count()
+
+    def add(self, array: np.ndarray, directory: str | None = None) -> int:
+        ref, key = self.keys_by_id.get(id(array), (None, None))
+        if ref is not None and ref() is array and key in self.entries:
+            self.entries[key][3] += 1
+            return key
+        key = next(self.new_keys)
+        if directory is None:
+            payload = zlib.compress(np.ascontiguousarray(array).tobytes())
+        else:
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, payload = tempfile.mkstemp(suffix=".data", dir=directory)
+            os.close(file_descriptor)
+            serialization.dump(np.ascontiguousarray(array), payload)
+        self.entries[key] = [payload, array.dtype, array.shape, 1]
+        array_id = id(array)
+        self.keys_by_id[array_id] = (
+            weakref.ref(array, lambda ref: self.forget_id(array_id, ref)),
+            key,
+        )
+        return key
+
+    def forget_id(self, array_id: int, ref: weakref.ref) -> None:
+        if self.keys_by_id.get(array_id, (None, None))[0] is ref:
+            self.keys_by_id.pop(array_id)
+
+    def get(self, key: int) -> np.ndarray:
+        payload, dtype, shape = self.entries[key][:3]
+        if isinstance(payload, str):
+            # Memory mapped, so only read from disk as it's accessed
+            return serialization.load(payload)
+        return np.frombuffer(zlib.decompress(payload), dtype=dtype).reshape(shape)
+
+    def get_memory_usage(self, key: int) -> int:
+        # Those written to files take no memory
+        payload = self.entries[key][0]
+        return len(payload) if isinstance(payload, bytes) else 0
+
+    def release(self, keys: Iterable[int]) -> None:
+        for key in keys:
+            entry = self.entries[key]
+            entry[3] -= 1
+            if entry[3] == 0:
+                self.entries.pop(key)
+                if isinstance(entry[0], str):
+                    os.remove(entry[0])
+
+
+PACKED_MOBJECT_DATA = PackedMobjectData()
+
+
 class SceneState():
     def __init__(self, scene: Scene, ignore: list[Mobject] | None = None):
         self.time = scene.time
         self.num_plays = scene.num_plays
+        self._packed_copies: bytes | None = None
+        self._packed_keys: list[int] = []
+        self._could_pack = True
         self.mobjects_to_copies = OrderedDict.fromkeys(scene.mobjects)
         if ignore:
             for mob in ignore:
@@ -897,6 +1024,115 @@ class SceneState():
             else:
                 self.mobjects_to_copies[mob] = mob.copy()
 
+    @property
+    def mobjects_to_copies(self) -> OrderedDict[Mobject, Mobject]:
+        if self._packed_copies is not None:
+            self.unpack()
+        return self._mobjects_to_copies
+
+    @mobjects_to_copies.setter
+    def mobjects_to_copies(self, value: OrderedDict[Mobject, Mobject]):
+        self._mobjects_to_copies = value
+
+    def get_memory_usage(self, counted: set | None = None) -> int:
+        """
+        Bytes of mobject data held by this state, skipping any arrays whose
+        ids, or packed buffers whose keys, are in counted, which is updated
+        as a side effect.
+        """
+        if counted is None:
+            counted = set()
+        if self._packed_copies is not None:
+            usage = len(self._packed_copies)
+            for key in self._packed_keys:
+                if ("packed", key) not in counted:
+                    counted.add(("packed", key))
+                    usage += PACKED_MOBJECT_DATA.get_memory_usage(key)
+            return usage
+        usage = 0
+        for mob_copy in self._mobjects_to_copies.values():
+            for sm in mob_copy.get_family():
+                if id(sm._data) not in counted:
+                    counted.add(id(sm._data))
+                    usage += sm._data.nbytes
+        return usage
+
+    def is_packed(self) -> bool:
+        return self._packed_copies is not None
+
+    def pack(self, directory: str | None = None) -> bool:
+        """
+        Replaces the copies held by this state with a compressed pickle of
+        them, whose larger data arrays are instead kept in PACKED_MOBJECT_DATA,
+        once for all states sharing them.  If a directory is given, those are
+        written to files there, and memory mapped back in.  The copies are
+        unpacked again whenever mobjects_to_copies is next accessed.  Returns
+        whether this state is now packed.
+        """
+        if self.is_packed():
+            return True
+        if not self._could_pack:
+            return False
+        copies = list(self._mobjects_to_copies.values())
+        arrays = {
+            id(sm._data): sm._data
+            for mob_copy in copies
+            for sm in mob_copy.get_family()
+            if sm._data.nbytes >= serialization.MIN_OUT_OF_BAND_SIZE
+        }
+        keys = dict()
+
+        def persistent_id(obj):
+            if id(obj) not in arrays:
+                return None
+            if id(obj) not in keys:
+                keys[id(obj)] = PACKED_MOBJECT_DATA.add(obj, directory)
+            return keys[id(obj)]
+
+        stream = io.BytesIO()
+        pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = persistent_id
+        try:
+            pickler.dump(copies)
+        except Exception as err:
+            # E.g. mobjects with updaters which can't be pickled
+            PACKED_MOBJECT_DATA.release(keys.values())
+            self._could_pack = False
+            log.warning(f"Could not pack scene state, so it may exceed state_memory_limit: {err}")
+            return False
+        self._packed_copies = zlib.compress(stream.getvalue())
+        self._packed_keys = list(keys.values())
+        # Let go of the data once it's been read back in, or this state is gone
+        self._release_packed_data = weakref.finalize(
+            self, PACKED_MOBJECT_DATA.release, self._packed_keys
+        )
+        self._mobjects_to_copies = OrderedDict.fromkeys(self._mobjects_to_copies)
+        return True
+
+    def unpack(self) -> None:
+        payload = self._packed_copies
+        if payload is None:
+            return
+        loaded = dict()
+
+        def persistent_load(key):
+            if key not in loaded:
+                loaded[key] = PACKED_MOBJECT_DATA.get(key)
+            return loaded[key]
+
+        unpickler = pickle.Unpickler(io.BytesIO(zlib.decompress(payload)))
+        unpickler.persistent_load = persistent_load
+        copies = unpickler.load()
+        self._release_packed_data()
+        for mob_copy in copies:
+            for sm in mob_copy.get_family():
+                # Data still shared between these copies must stay read-only
+                if sm._data_refs[0] > 1:
+                    sm._data.flags.writeable = False
+        self._mobjects_to_copies = OrderedDict(zip(self._mobjects_to_copies, copies))
+        self._packed_copies = None
+        self._packed_keys = []
+
     def __eq__(self, state: SceneState):
         return all((
             self.time == state.time,
@@ -231,6 +231,8 @@ class CheckpointManager:
                 self.checkpoint_states.pop(later_key)
         else:
             self.checkpoint_states[key] = scene.get_state()
+            # Older checkpoints may be packed away, but never dropped
+            scene.limit_state_memory(list(self.checkpoint_states.values()), allow_dropping=False)
 
     def clear_checkpoints(self):
         self.checkpoint_states = dict()
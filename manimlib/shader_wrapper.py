@@ -3,6 +3,8 @@ from __future__ import annotations
 import copy
 import os
 import re
+import weakref
+from collections import defaultdict
 
 import OpenGL.GL as gl
 import moderngl
@@ -11,8 +13,10 @@ from functools import lru_cache
 
 from manimlib.config import parse_cli
 from manimlib.config import manim_config
+from manimlib.utils.shaders import concatenate_records
 from manimlib.utils.shaders import get_shader_code_from_file
 from manimlib.utils.shaders import get_shader_program
+from manimlib.utils.shaders import get_vertex_format
 from manimlib.utils.shaders import image_path_to_texture
 from manimlib.utils.shaders import set_program_uniform
 
@@ -24,6 +28,110 @@ if TYPE_CHECKING:
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
 
+class VertexBufferPool(object):
+    """
+    Hands out vertex buffers by power-of-two capacity class, so that shader
+    wrappers whose data changes length from frame to frame, e.g. during
+    ShowCreation, can keep writing into the same buffer, and so that buffers
+    released by one wrapper can be reused by another.
+
+    Once the free buffers take up more than max_free_bytes, any more which
+    are released go back to the driver, so that the memory used for a peak
+    frame is not held onto for good.
+    """
+    min_capacity: int = 1024
+    max_free_bytes: int = 2**26
+
+    def __init__(self, ctx: moderngl.context.Context):
+        self.ctx = ctx
+        self.free_buffers: dict[int, list[moderngl.Buffer]] = defaultdict(list)
+        self.free_bytes = 0
+        # Maps ids of buffers in use to (buffer, weak reference to owner)
+        self.used_buffers: dict[int, tuple[moderngl.Buffer, weakref.ref]] = dict()
+        self.n_allocations = 0
+        self.n_reuses = 0
+        self.n_reclaimed = 0
+        self.n_discarded = 0
+
+    def get_capacity(self, size: int) -> int:
+        return max(self.min_capacity, 1 << (max(size, 1) - 1).bit_length())
+
+    def acquire(self, size: int, owner: object) -> moderngl.Buffer:
+        capacity = self.get_capacity(size)
+        if self.free_buffers[capacity]:
+            buff = self.free_buffers[capacity].pop()
+            self.free_bytes -= capacity
+            self.n_reuses += 1
+        else:
+            buff = self.ctx.buffer(reserve=capacity)
+            self.n_allocations += 1
+        # If the owner is garbage collected without releasing
+        # the buffer, it gets returned to the pool
+        key = id(buff)
+        owner_ref = weakref.ref(owner, lambda ref: self.reclaim(key, ref))
+        self.used_buffers[key] = (buff, owner_ref)
+        return buff
+
+    def release(self, buff: moderngl.Buffer) -> None:
+        buff, owner_ref = self.used_buffers.pop(id(buff))
+        if self.free_bytes + buff.size > self.max_free_bytes:
+            buff.release()
+            self.n_discarded += 1
+            return
+        self.free_buffers[buff.size].append(buff)
+        self.free_bytes += buff.size
+
+    def release_free_buffers(self) -> None:
+        """
+        Hands every buffer not in use back to the driver, e.g. once a scene is done
+        """
+        for buffs in self.free_buffers.values():
+            for buff in buffs:
+                buff.release()
+        self.free_buffers.clear()
+        self.free_bytes = 0
+
+    def reclaim(self, key: int, owner_ref: weakref.ref) -> None:
+        if key in self.used_buffers and self.used_buffers[key][1] is owner_ref:
+            self.release(self.used_buffers[key][0])
+            self.n_reclaimed += 1
+
+    def get_stats(self, active_owners: Optional[Iterable[object]] = None) -> dict[str, int]:
+        """
+        If active_owners is passed, e.g. as the shader wrappers currently rendered
+        in a scene, buffers held by any other owner are counted as orphaned.
+        """
+        used = [buff for buff, ref in self.used_buffers.values()]
+        free = [buff for buffs in self.free_buffers.values() for buff in buffs]
+        stats = dict(
+            used_buffers=len(used),
+            used_bytes=sum(buff.size for buff in used),
+            free_buffers=len(free),
+            free_bytes=self.free_bytes,
+            allocations=self.n_allocations,
+            reuses=self.n_reuses,
+            reclaimed=self.n_reclaimed,
+            discarded=self.n_discarded,
+        )
+        if active_owners is not None:
+            active_ids = set(map(id, active_owners))
+            stats["orphaned_buffers"] = sum(
+                id(ref()) not in active_ids
+                for buff, ref in self.used_buffers.values()
+            )
+        return stats
+
+
+def get_vertex_buffer_pool(ctx: moderngl.context.Context) -> VertexBufferPool:
+    # The pool is kept on the context itself, rather than in a cache keyed by
+    # the context, so that the two are freed together
+    if ctx.extra is None:
+        ctx.extra = dict()
+    if "VERTEX_BUFFER_POOL" not in ctx.extra:
+        ctx.extra["VERTEX_BUFFER_POOL"] = VertexBufferPool(ctx)
+    return ctx.extra["VERTEX_BUFFER_POOL"]
+
+
 # Mobjects that should be rendered with
 # the same shader will be organized and
 # clumped together based on keeping track
@@ -32,6 +140,12 @@ if TYPE_CHECKING:
 
 
 class ShaderWrapper(object):
+    # Uniforms which may differ between the mobjects rendered together in one
+    # batch, e.g. during a lagged fade.  Rather than splitting up the batch,
+    # these are passed to the shaders as vertex attributes, from a buffer of
+    # their own which is rewritten whenever their values change
+    member_uniform_names: tuple[str, ...] = ("opacity_multiplier", "tint")
+
     def __init__(
         self,
         ctx: moderngl.context.Context,
@@ -53,6 +167,7 @@ class ShaderWrapper(object):
 
         self.program_uniform_mirror: UniformDict = dict()
         self.bind_to_mobject_uniforms(mobject_uniforms or dict())
+        self.bind_to_member_uniforms([self.mobject_uniforms], [0])
 
         self.init_program_code()
         for old, new in code_replacements.items():
@@ -87,7 +202,7 @@ class ShaderWrapper(object):
             self.programs = []
             return
         self.program = get_shader_program(self.ctx, **self.program_code)
-        self.vert_format = moderngl.detect_format(self.program, self.vert_attributes)
+        self.vert_format = get_vertex_format(self.vert_data.dtype, self.vert_attributes)
         self.programs = [self.program]
 
     def init_textures(self):
@@ -98,7 +213,12 @@ class ShaderWrapper(object):
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.member_vbo = None
+        self.member_values = None
+        self.member_per_vertex = False
         self.vaos = []
+        self.data_lengths = []
+        self.num_vertices = 0
 
     def add_texture(self, name: str, texture: moderngl.Texture):
         max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
@@ -111,16 +231,33 @@ class ShaderWrapper(object):
     def bind_to_mobject_uniforms(self, mobject_uniforms: UniformDict):
         self.mobject_uniforms = mobject_uniforms
 
+    def bind_to_member_uniforms(self, member_uniforms: list[UniformDict], vert_counts: list[int]):
+        """
+        Takes the uniforms of each mobject in the batch whose data was last
+        read in, along with how many of the vertices belong to each
+        """
+        self.member_uniforms = member_uniforms
+        self.member_vert_counts = vert_counts
+        self.member_values = None
+
     def get_id(self) -> int:
         return self.id
 
     def refresh_id(self) -> None:
+        # Model matrices are left out, as mobjects are separately batched
+        # according to which model root they sit under, and so are the
+        # uniforms passed in per member of a batch
+        uniforms = {
+            k: v for k, v in self.mobject_uniforms.items()
+            if k != "model_matrix" and k not in self.member_uniform_names
+        }
         self.id = hash("".join(map(str, [
             "".join(map(str, self.program_code.values())),
-            self.mobject_uniforms,
+            uniforms,
             self.depth_test,
             self.render_primitive,
             self.texture_paths,
+            self.vert_data.dtype,
         ])))
 
     def replace_code(self, old: str, new: str) -> None:
@@ -150,35 +287,142 @@ class ShaderWrapper(object):
 
     # Adding data
 
-    def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
+    def read_in(self, data_list: list[np.ndarray | None]):
+        """
+        Entries of data_list may be None where that data is unchanged since
+        the last call, with data_list then being as long as it was for that call
+        """
+        if any(data is None for data in data_list):
+            lengths = [
+                old_len if data is None else len(data)
+                for data, old_len in zip(data_list, self.data_lengths)
+            ]
+            if lengths == self.data_lengths:
+                self.rewrite_vert_data(data_list)
+                return
+            # Sizes have changed, so everything is read in again
+            ends = np.cumsum(self.data_lengths)
+            data_list = [
+                self.vert_data[end - old_len:end].copy() if data is None else data
+                for data, old_len, end in zip(data_list, self.data_lengths, ends)
+            ]
+
+        self.data_lengths = list(map(len, data_list))
+        total_len = sum(self.data_lengths)
         if total_len == 0:
-            if self.vbo is not None:
-                self.vbo.clear()
+            self.set_num_vertices(0)
             return
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
-            self.vert_data = np.concatenate(data_list)
+        if len(data_list) == 1:
+            # Nothing to concatenate, so write the data as is
+            vert_data = np.ascontiguousarray(data_list[0])
         else:
-            np.concatenate(data_list, out=self.vert_data)
-
-        # Either create new vbo, or read data into it
-        total_size = self.vert_data.itemsize * total_len
-        if self.vbo is not None and self.vbo.size != total_size:
+            # If possible, read concatenated data into existing list
+            if len(self.vert_data) != total_len or self.vert_data.dtype != data_list[0].dtype:
+                self.vert_data = np.empty(total_len, dtype=data_list[0].dtype)
+            concatenate_records(data_list, out=self.vert_data)
+            vert_data = self.vert_data
+
+        # Only swap out the vbo, and with it the vaos, when the
+        # data outgrows its capacity class, or shrinks below it
+        pool = get_vertex_buffer_pool(self.ctx)
+        total_size = vert_data.itemsize * total_len
+        if self.vbo is not None and self.vbo.size != pool.get_capacity(total_size):
             self.release()  # This sets vbo to be None
         if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
+            self.vbo = pool.acquire(total_size, owner=self)
             self.generate_vaos()
-        else:
-            self.vbo.write(self.vert_data)
+        self.vbo.write(vert_data)
+        self.set_num_vertices(total_len)
+
+    def rewrite_vert_data(self, data_list: list[np.ndarray | None]):
+        # Only write the entries which have changed, both into
+        # vert_data and into the corresponding ranges of the vbo
+        ends = np.cumsum(self.data_lengths)
+        itemsize = self.vert_data.itemsize
+        run_start = None
+        for data, end, length in zip([*data_list, None], [*ends, 0], [*self.data_lengths, 0]):
+            if data is not None:
+                self.vert_data[end - length:end] = data
+                if run_start is None:
+                    run_start = end - length
+                run_end = end
+            elif run_start is not None:
+                self.vbo.write(self.vert_data[run_start:run_end], offset=int(run_start * itemsize))
+                run_start = None
+
+    def set_num_vertices(self, num_verts: int):
+        # The vbo may have more capacity than is filled with data
+        self.num_vertices = num_verts
+        for vao in self.vaos:
+            vao.vertices = num_verts
+
+    def get_member_values(self) -> np.ndarray:
+        return np.array([
+            np.hstack([uniforms[name] for name in self.member_uniform_names])
+            for uniforms in self.member_uniforms
+        ], dtype=np.float32)
+
+    def write_member_data(self) -> None:
+        """
+        Writes the values of member uniforms into member_vbo.  When they're the
+        same for every member of the batch, only one row is written, which
+        every vertex reads as instance data, and otherwise there is one row
+        per vertex.
+        """
+        if self.vbo is None:
+            return
+        values = self.get_member_values()
+        if self.member_values is not None and np.array_equal(values, self.member_values):
+            return
+        per_vertex = bool((values != values[0]).any())
+        data = np.repeat(values, self.member_vert_counts, axis=0) if per_vertex else values[:1]
+
+        pool = get_vertex_buffer_pool(self.ctx)
+        capacity = pool.get_capacity(data.nbytes)
+        if self.member_vbo is None or self.member_vbo.size != capacity or per_vertex != self.member_per_vertex:
+            if self.member_vbo is not None:
+                pool.release(self.member_vbo)
+            self.member_vbo = pool.acquire(data.nbytes, owner=self)
+            self.member_per_vertex = per_vertex
+            self.release_vaos()
+            self.generate_vaos()
+            self.set_num_vertices(self.num_vertices)
+        self.member_vbo.write(data)
+        self.member_values = values
+
+    def get_member_content(self, program: moderngl.Program) -> list[tuple]:
+        """
+        Entry for the member_vbo in the content of a vertex array for the given
+        program, with any member uniforms the program doesn't use skipped over
+        """
+        if self.member_vbo is None:
+            return []
+        sizes = [np.size(self.member_uniforms[0][name]) for name in self.member_uniform_names]
+        active = [
+            isinstance(program.get(name, None), moderngl.Attribute)
+            for name in self.member_uniform_names
+        ]
+        if not any(active):
+            return []
+        fmt = " ".join(
+            f"{size}f" if is_active else f"{4 * size}x"
+            for size, is_active in zip(sizes, active)
+        )
+        if not self.member_per_vertex:
+            fmt += "/i"
+        names = [name for name, is_active in zip(self.member_uniform_names, active) if is_active]
+        return [(self.member_vbo, fmt, *names)]
 
     def generate_vaos(self):
         # Vertex array object
         self.vaos = [
             self.ctx.vertex_array(
                 program=program,
-                content=[(self.vbo, self.vert_format, *self.vert_attributes)],
+                content=[
+                    (self.vbo, self.vert_format, *self.vert_attributes),
+                    *self.get_member_content(program),
+                ],
                 mode=self.render_primitive,
             )
             for program in self.programs
@@ -186,6 +430,7 @@ class ShaderWrapper(object):
 
     # Related to data and rendering
     def pre_render(self):
+        self.write_member_data()
         self.set_ctx_depth_test(self.depth_test)
         self.set_ctx_clip_plane(self.use_clip_plane())
         for tid, texture in enumerate(self.textures):
@@ -201,12 +446,21 @@ class ShaderWrapper(object):
                 continue
             for uniforms in [self.mobject_uniforms, camera_uniforms, self.texture_names_to_ids]:
                 for name, value in uniforms.items():
-                    set_program_uniform(program, name, value)
+                    if name not in self.member_uniform_names:
+                        set_program_uniform(program, name, value)
+
+    def release_vaos(self):
+        for vao in self.vaos:
+            if vao is not None:
+                vao.release()
+        self.vaos = []
 
     def release(self):
-        for obj in (self.vbo, *self.vaos):
-            if obj is not None:
-                obj.release()
+        self.release_vaos()
+        pool = get_vertex_buffer_pool(self.ctx)
+        for buff in (self.vbo, self.member_vbo):
+            if buff is not None:
+                pool.release(buff)
         self.init_vertex_objects()
 
     def release_textures(self):
@@ -218,6 +472,15 @@ class ShaderWrapper(object):
 
 
 class VShaderWrapper(ShaderWrapper):
+    member_uniform_names: tuple[str, ...] = (
+        *ShaderWrapper.member_uniform_names,
+        "partial_start",
+        "partial_end",
+        "dash_length",
+        "dash_ratio",
+        "dash_phase",
+    )
+
     def __init__(
         self,
         ctx: moderngl.context.Context,
@@ -274,6 +537,10 @@ class VShaderWrapper(ShaderWrapper):
             fragment_shader=self.program_code["stroke_frag"].replace(
                 "// MODIFY FRAG COLOR",
                 "frag_color.a *= 0.95; frag_color.rgb *= frag_color.a;",
+            ).replace(
+                # Borders of the fill are never dashed
+                "flat in float dash_ratio;",
+                "const float dash_ratio = 1.0;",
             )
         )
         self.fill_depth_program = get_shader_program(
@@ -284,7 +551,8 @@ class VShaderWrapper(ShaderWrapper):
         )
         self.programs = [self.stroke_program, self.fill_program, self.fill_border_program, self.fill_depth_program]
 
-        # Full vert format looks like this (total of 4x23 = 92 bytes):
+        # Full vert data has these fields, with a total of 4x25 = 100 bytes
+        # in the unpacked layout:
         # point 3
         # stroke_rgba 4
         # stroke_width 1
@@ -292,44 +560,68 @@ class VShaderWrapper(ShaderWrapper):
         # fill_rgba 4
         # base_normal 3
         # fill_border_width 1
-        self.stroke_vert_format = '3f 4f 1f 1f 16x 3f 4x'
-        self.stroke_vert_attributes = ['point', 'stroke_rgba', 'stroke_width', 'joint_angle', 'unit_normal']
+        # proportion 1
+        # arc_proportion 1
+        # Each program reads some of these fields, possibly under a different attribute name
+        dtype = self.vert_data.dtype
+        self.stroke_vert_format = get_vertex_format(
+            dtype, ['point', 'stroke_rgba', 'stroke_width', 'joint_angle', 'base_normal', 'proportion', 'arc_proportion']
+        )
+        self.stroke_vert_attributes = ['point', 'stroke_rgba', 'stroke_width', 'joint_angle', 'unit_normal', 'proportion', 'arc_proportion']
 
-        self.fill_vert_format = '3f 24x 4f 3f 4x'
-        self.fill_vert_attributes = ['point', 'fill_rgba', 'base_normal']
+        self.fill_vert_format = get_vertex_format(
+            dtype, ['point', 'fill_rgba', 'base_normal', 'proportion']
+        )
+        self.fill_vert_attributes = ['point', 'fill_rgba', 'base_normal', 'proportion']
 
-        self.fill_border_vert_format = '3f 20x 1f 4f 3f 1f'
-        self.fill_border_vert_attributes = ['point', 'joint_angle', 'stroke_rgba', 'unit_normal', 'stroke_width']
+        self.fill_border_vert_format = get_vertex_format(
+            dtype, ['point', 'joint_angle', 'fill_rgba', 'base_normal', 'fill_border_width', 'proportion']
+        )
+        self.fill_border_vert_attributes = ['point', 'joint_angle', 'stroke_rgba', 'unit_normal', 'stroke_width', 'proportion']
 
-        self.fill_depth_vert_format = '3f 40x 3f 4x'
-        self.fill_depth_vert_attributes = ['point', 'base_normal']
+        self.fill_depth_vert_format = get_vertex_format(
+            dtype, ['point', 'base_normal', 'proportion']
+        )
+        self.fill_depth_vert_attributes = ['point', 'base_normal', 'proportion']
 
     def init_vertex_objects(self):
-        self.vbo = None
+        super().init_vertex_objects()
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
-        self.vaos = []
+        self.fill_depth_vao = None
 
     def generate_vaos(self):
         self.stroke_vao = self.ctx.vertex_array(
             program=self.stroke_program,
-            content=[(self.vbo, self.stroke_vert_format, *self.stroke_vert_attributes)],
+            content=[
+                (self.vbo, self.stroke_vert_format, *self.stroke_vert_attributes),
+                *self.get_member_content(self.stroke_program),
+            ],
             mode=self.render_primitive,
         )
         self.fill_vao = self.ctx.vertex_array(
             program=self.fill_program,
-            content=[(self.vbo, self.fill_vert_format, *self.fill_vert_attributes)],
+            content=[
+                (self.vbo, self.fill_vert_format, *self.fill_vert_attributes),
+                *self.get_member_content(self.fill_program),
+            ],
             mode=self.render_primitive,
         )
         self.fill_border_vao = self.ctx.vertex_array(
             program=self.fill_border_program,
-            content=[(self.vbo, self.fill_border_vert_format, *self.fill_border_vert_attributes)],
+            content=[
+                (self.vbo, self.fill_border_vert_format, *self.fill_border_vert_attributes),
+                *self.get_member_content(self.fill_border_program),
+            ],
             mode=self.render_primitive,
         )
         self.fill_depth_vao = self.ctx.vertex_array(
             program=self.fill_depth_program,
-            content=[(self.vbo, self.fill_depth_vert_format, *self.fill_depth_vert_attributes)],
+            content=[
+                (self.vbo, self.fill_depth_vert_format, *self.fill_depth_vert_attributes),
+                *self.get_member_content(self.fill_depth_program),
+            ],
             mode=self.render_primitive,
         )
         self.vaos = [self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao]
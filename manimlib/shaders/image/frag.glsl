@@ -4,10 +4,14 @@ uniform sampler2D Texture;
 
 in vec2 v_im_coords;
 in float v_opacity;
+in float v_opacity_multiplier;
+in vec4 v_tint;
 
 out vec4 frag_color;
 
+#INSERT apply_opacity_and_tint.glsl
+
 void main() {
-    frag_color = texture(Texture, v_im_coords);
+    frag_color = apply_opacity_and_tint(texture(Texture, v_im_coords), v_opacity_multiplier, v_tint);
     frag_color.a *= v_opacity;
 }
\ No newline at end of file
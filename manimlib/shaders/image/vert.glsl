@@ -5,15 +5,22 @@ uniform sampler2D Texture;
 in vec3 point;
 in vec2 im_coords;
 in float opacity;
+in float opacity_multiplier;
+in vec4 tint;
 
 out vec2 v_im_coords;
 out float v_opacity;
+out float v_opacity_multiplier;
+out vec4 v_tint;
 
 // Analog of import for manim only
 #INSERT emit_gl_Position.glsl
+#INSERT apply_model_matrix.glsl
 
 void main(){
     v_im_coords = im_coords;
     v_opacity = opacity;
-    emit_gl_Position(point);
+    v_opacity_multiplier = opacity_multiplier;
+    v_tint = tint;
+    emit_gl_Position(model_point(point));
 }
\ No newline at end of file
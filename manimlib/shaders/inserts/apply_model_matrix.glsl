@@ -0,0 +1,13 @@
+uniform mat4 model_matrix;
+
+// Mobjects can defer shifts, rotations and uniform rescalings
+// to this matrix rather than rewriting their point data
+vec3 model_point(vec3 point){
+    return (model_matrix * vec4(point, 1.0)).xyz;
+}
+
+vec3 model_normal(vec3 normal){
+    // The model matrix is always a similarity, so dividing out
+    // its scale factor leaves only the rotation
+    return mat3(model_matrix) * normal / length(model_matrix[0].xyz);
+}
@@ -0,0 +1,10 @@
+// Per-mobject adjustments, letting fades and tints be animated without
+// rewriting the color data of every vertex.  Shaders take opacity_multiplier
+// and tint in as vertex attributes, so that the mobjects rendered together
+// in one batch can each have their own.
+vec4 apply_opacity_and_tint(vec4 rgba, float opacity_multiplier, vec4 tint){
+    return vec4(
+        mix(rgba.rgb, tint.rgb, tint.a),
+        rgba.a * opacity_multiplier
+    );
+}
@@ -0,0 +1,33 @@
+// Paths can be drawn only between two proportions along their full length,
+// as in ShowCreation, given the proportion at each vertex.  The bounds come
+// in as vertex attributes partial_start and partial_end, so that mobjects
+// rendered in one batch can each have their own.  This finds the range of
+// the bezier parameter for one curve within those bounds, returning false
+// if no part of that curve is visible
+bool get_partial_range(vec2 bounds, float p0, float p2, out float t_start, out float t_end){
+    if (p2 <= bounds[0] || p0 >= bounds[1]) return false;
+    t_start = clamp((bounds[0] - p0) / (p2 - p0), 0.0, 1.0);
+    t_end = clamp((bounds[1] - p0) / (p2 - p0), 0.0, 1.0);
+    return true;
+}
+
+
+vec3 quadratic_bezier_point(vec3 controls[3], float t){
+    return mix(
+        mix(controls[0], controls[1], t),
+        mix(controls[1], controls[2], t),
+        t
+    );
+}
+
+
+// Control points for the portion of a quadratic bezier curve between two parameters
+vec3[3] partial_quadratic_bezier(vec3 controls[3], float t0, float t1){
+    vec3 start = quadratic_bezier_point(controls, t0);
+    vec3 half_tangent = mix(controls[1] - controls[0], controls[2] - controls[1], t0);
+    return vec3[3](
+        start,
+        start + (t1 - t0) * half_tangent,
+        quadratic_bezier_point(controls, t1)
+    );
+}
@@ -16,10 +16,13 @@ uniform vec3 color7;
 uniform vec3 color8;
 
 in vec3 xyz_coords;
+in float v_opacity_multiplier;
+in vec4 v_tint;
 
 out vec4 frag_color;
 
 #INSERT finalize_color.glsl
+#INSERT apply_opacity_and_tint.glsl
 #INSERT complex_functions.glsl
 
 const int MAX_DEGREE = 5;
@@ -60,7 +63,7 @@ void main() {
     }
 
     frag_color = finalize_color(
-        vec4(color, opacity),
+        apply_opacity_and_tint(vec4(color, opacity), v_opacity_multiplier, v_tint),
         xyz_coords,
         vec3(0.0, 0.0, 1.0)
     );
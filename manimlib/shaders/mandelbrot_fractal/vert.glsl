@@ -1,14 +1,23 @@
 #version 330
 
 in vec3 point;
+in float opacity_multiplier;
+in vec4 tint;
+
 out vec3 xyz_coords;
+out float v_opacity_multiplier;
+out vec4 v_tint;
 
 uniform float scale_factor;
 uniform vec3 offset;
 
 #INSERT emit_gl_Position.glsl
+#INSERT apply_model_matrix.glsl
 
 void main(){
-    xyz_coords = (point - offset) / scale_factor;
-    emit_gl_Position(point);
+    vec3 m_point = model_point(point);
+    xyz_coords = (m_point - offset) / scale_factor;
+    v_opacity_multiplier = opacity_multiplier;
+    v_tint = tint;
+    emit_gl_Position(m_point);
 }
\ No newline at end of file
@@ -27,10 +27,13 @@ uniform float black_for_cycles;
 uniform float is_parameter_space;
 
 in vec3 xyz_coords;
+in float v_opacity_multiplier;
+in vec4 v_tint;
 
 out vec4 frag_color;
 
 #INSERT finalize_color.glsl
+#INSERT apply_opacity_and_tint.glsl
 #INSERT complex_functions.glsl
 
 const int MAX_DEGREE = 5;
@@ -140,7 +143,7 @@ void main() {
     }
 
     frag_color = finalize_color(
-        color,
+        apply_opacity_and_tint(color, v_opacity_multiplier, v_tint),
         xyz_coords,
         vec3(0.0, 0.0, 1.0)
     );
@@ -5,10 +5,13 @@ layout (triangle_strip, max_vertices = 6) out;
 
 in vec3 verts[3];
 in vec3 v_base_point[3];
+in float v_proportion[3];
+in vec2 v_partial_bounds[3];
 
 out float depth;
 
 #INSERT emit_gl_Position.glsl
+#INSERT get_partial_curve.glsl
 
 
 void emit_triangle(vec3 points[3]){
@@ -25,8 +28,13 @@ void main(){
     // the first anchor is set equal to that anchor
     if (verts[0] == verts[1]) return;
 
+    float t_start;
+    float t_end;
+    if (!get_partial_range(v_partial_bounds[0], v_proportion[0], v_proportion[2], t_start, t_end)) return;
+    vec3 curve[3] = partial_quadratic_bezier(vec3[3](verts[0], verts[1], verts[2]), t_start, t_end);
+
     // Emit two triangles
-    emit_triangle(vec3[3](v_base_point[0], verts[0], verts[2]));
-    emit_triangle(vec3[3](verts[0], verts[1], verts[2]));
+    emit_triangle(vec3[3](v_base_point[0], curve[0], curve[2]));
+    emit_triangle(curve);
 }
 
@@ -2,11 +2,20 @@
 
 in vec3 point;
 in vec3 base_normal;
+in float proportion;
+in float partial_start;
+in float partial_end;
 
 out vec3 verts;
 out vec3 v_base_point;
+out float v_proportion;
+out vec2 v_partial_bounds;
+
+#INSERT apply_model_matrix.glsl
 
 void main(){
-    verts = point;
-    v_base_point = base_normal;
+    verts = model_point(point);
+    v_base_point = model_point(base_normal);
+    v_proportion = proportion;
+    v_partial_bounds = vec2(partial_start, partial_end);
 }
\ No newline at end of file
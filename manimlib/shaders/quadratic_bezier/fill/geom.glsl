@@ -6,6 +6,8 @@ layout (triangle_strip, max_vertices = 6) out;
 in vec3 verts[3];
 in vec4 v_color[3];
 in vec3 v_base_normal[3];
+in float v_proportion[3];
+in vec2 v_partial_bounds[3];
 
 out vec4 color;
 out float fill_all;
@@ -23,6 +25,8 @@ const vec2 SIMPLE_QUADRATIC[3] = vec2[3](
 // Analog of import for manim only
 #INSERT emit_gl_Position.glsl
 #INSERT finalize_color.glsl
+#INSERT apply_model_matrix.glsl
+#INSERT get_partial_curve.glsl
 
 
 void emit_triangle(vec3 points[3], vec4 v_color[3], vec3 unit_normal){
@@ -50,19 +54,25 @@ void main(){
     // Check zero fill
     if (vec3(v_color[0].a, v_color[1].a, v_color[2].a) == vec3(0.0, 0.0, 0.0)) return;
 
-    vec3 base_point = v_base_normal[0];
-    vec3 unit_normal = v_base_normal[1];
+    // Only fill in the visible portion of the curve
+    float t_start;
+    float t_end;
+    if (!get_partial_range(v_partial_bounds[0], v_proportion[0], v_proportion[2], t_start, t_end)) return;
+    vec3 curve[3] = partial_quadratic_bezier(vec3[3](verts[0], verts[1], verts[2]), t_start, t_end);
+
+    vec3 base_point = model_point(v_base_normal[0]);
+    vec3 unit_normal = model_normal(v_base_normal[1]);
     // Emit main triangle
     fill_all = 1.0;
     emit_triangle(
-        vec3[3](base_point, verts[0], verts[2]),
+        vec3[3](base_point, curve[0], curve[2]),
         vec4[3](v_color[1], v_color[0], v_color[2]),
         unit_normal
     );
     // Edge triangle
     fill_all = 0.0;
     emit_triangle(
-        vec3[3](verts[0], verts[1], verts[2]),
+        curve,
         vec4[3](v_color[0], v_color[1], v_color[2]),
         unit_normal
     );
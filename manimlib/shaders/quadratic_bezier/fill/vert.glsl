@@ -3,13 +3,25 @@
 in vec3 point;
 in vec4 fill_rgba;
 in vec3 base_normal;
+in float proportion;
+in float opacity_multiplier;
+in vec4 tint;
+in float partial_start;
+in float partial_end;
 
 out vec3 verts;  // Bezier control point
 out vec4 v_color;
 out vec3 v_base_normal;
+out float v_proportion;
+out vec2 v_partial_bounds;
+
+#INSERT apply_model_matrix.glsl
+#INSERT apply_opacity_and_tint.glsl
 
 void main(){
-    verts = point;
-    v_color = fill_rgba;
+    verts = model_point(point);
+    v_color = apply_opacity_and_tint(fill_rgba, opacity_multiplier, tint);
     v_base_normal = base_normal;
+    v_proportion = proportion;
+    v_partial_bounds = vec2(partial_start, partial_end);
 }
\ No newline at end of file
@@ -1,10 +1,16 @@
 #version 330
 
+uniform float anti_alias_width;
+
 // Distance to the curve, and half the curve width, both as
 // a ratio of the antialias width
 in float dist_to_aaw;
 in float half_width_to_aaw;
 in vec4 color;
+// Position along the path measured in dash periods, and the
+// proportion of each period which is filled
+in float dash_coord;
+flat in float dash_ratio;
 
 out vec4 frag_color;
 
@@ -13,6 +19,14 @@ void main() {
     // sdf for the region around the curve we wish to color.
     float signed_dist_to_region = abs(dist_to_aaw) - half_width_to_aaw;
     frag_color.a *= smoothstep(0.5, -0.5, signed_dist_to_region);
+    if (dash_ratio < 1.0){
+        // Likewise for the ends of dashes, with the distance to the nearest
+        // end converted from dash periods to a ratio of the antialias width
+        float x = fract(dash_coord);
+        float signed_dist_to_dash = (x < dash_ratio) ? -min(x, dash_ratio - x) : min(x - dash_ratio, 1.0 - x);
+        float aaw = max(anti_alias_width * fwidth(dash_coord), 1e-8);
+        frag_color.a *= smoothstep(0.5, -0.5, signed_dist_to_dash / aaw);
+    }
     // This line is replaced in VShaderWrapper
     // MODIFY FRAG COLOR
 }
\ No newline at end of file
@@ -15,10 +15,16 @@ in float v_joint_angle[3];
 in float v_stroke_width[3];
 in vec4 v_color[3];
 in vec3 v_unit_normal[3];
+in float v_proportion[3];
+in vec2 v_partial_bounds[3];
+in float v_dash_coord[3];
+in float v_dash_ratio[3];
 
 out vec4 color;
 out float dist_to_aaw;
 out float half_width_to_aaw;
+out float dash_coord;
+flat out float dash_ratio;
 
 // Codes for joint types
 const int NO_JOINT = 0;
@@ -37,6 +43,7 @@ const float MITER_COS_ANGLE_THRESHOLD = -0.8;
 
 #INSERT emit_gl_Position.glsl
 #INSERT finalize_color.glsl
+#INSERT get_partial_curve.glsl
 
 
 
@@ -165,6 +172,11 @@ void main() {
     if (vec3(v_stroke_width[0], v_stroke_width[1], v_stroke_width[2]) == vec3(0.0, 0.0, 0.0)) return;
     if (vec3(v_color[0].a, v_color[1].a, v_color[2].a) == vec3(0.0, 0.0, 0.0)) return;
 
+    // Only draw the visible portion of the curve
+    float t_start;
+    float t_end;
+    if (!get_partial_range(v_partial_bounds[0], v_proportion[0], v_proportion[2], t_start, t_end)) return;
+
     bool draw_flat = bool(flat_stroke) || bool(is_fixed_in_frame);
 
     // Coefficients such that the quadratic bezier is c0 + c1 * t  + c2 * t^2
@@ -181,12 +193,17 @@ void main() {
     // Emit vertex pairs aroudn subdivided points
     for (int i = 0; i < MAX_STEPS; i++){
         if (i >= n_steps) break;
-        float t = float(i) / (n_steps - 1);
+        float t = mix(t_start, t_end, float(i) / (n_steps - 1));
 
         // Point and tangent
         vec3 point = point_on_quadratic(t, c0, c1, c2);
         vec3 tangent = tangent_on_quadratic(t, c1, c2);
 
+        // Position in dash periods, see the vertex shader. This treats the
+        // curve as having constant speed, which is close for typical handles
+        dash_coord = mix(v_dash_coord[0], v_dash_coord[2], t);
+        dash_ratio = v_dash_ratio[0];
+
         // Style
         float stroke_width = mix(v_stroke_width[0], v_stroke_width[2], t);
         vec4 color = mix(v_color[0], v_color[2], t);
@@ -194,16 +211,17 @@ void main() {
         // This is sent along to prevent needless joint creation
         bool inside_curve = (i > 0 && i < n_steps - 1);
 
-        // Use middle joint product for inner points, flip sign for first one's cross product component
+        // Use middle joint product for inner points, flip sign for first one's cross product component.
+        // Ends where the curve is cut off by the partial range get no joint
         float joint_angle;
         if (i == 0){
-            joint_angle = -v_joint_angle[0];
+            joint_angle = (t_start > 0.0) ? 0.0 : -v_joint_angle[0];
         }
         else if (inside_curve){
             joint_angle = 0;
         }
         else {
-            joint_angle = v_joint_angle[2];
+            joint_angle = (t_end < 1.0) ? 0.0 : v_joint_angle[2];
         }
 
         emit_point_with_width(
@@ -9,6 +9,15 @@ in vec4 stroke_rgba;
 in float stroke_width;
 in float joint_angle;
 in vec3 unit_normal;
+in float proportion;
+in float arc_proportion;
+in float opacity_multiplier;
+in vec4 tint;
+in float partial_start;
+in float partial_end;
+in float dash_length;
+in float dash_ratio;
+in float dash_phase;
 
 // Bezier control point
 out vec3 verts;
@@ -17,13 +26,32 @@ out vec4 v_color;
 out float v_stroke_width;
 out float v_joint_angle;
 out vec3 v_unit_normal;
+out float v_proportion;
+out float v_dash_coord;
+out float v_dash_ratio;
+out vec2 v_partial_bounds;
 
 const float STROKE_WIDTH_CONVERSION = 0.01;
 
+#INSERT apply_model_matrix.glsl
+#INSERT apply_opacity_and_tint.glsl
+
 void main(){
-    verts = point;
-    v_color = stroke_rgba;
+    verts = model_point(point);
+    v_color = apply_opacity_and_tint(stroke_rgba, opacity_multiplier, tint);
     v_stroke_width = STROKE_WIDTH_CONVERSION * stroke_width * mix(frame_scale, 1, scale_stroke_with_zoom);
     v_joint_angle = joint_angle;
-    v_unit_normal = unit_normal;
+    v_unit_normal = model_normal(unit_normal);
+    v_proportion = proportion;
+    // Position along the path in dash periods, offset by the phase.  Dash length
+    // is a proportion of the path's arc length, and 0 means the stroke is solid,
+    // which is drawn as dashes filling their whole period
+    if (dash_length > 0.0){
+        v_dash_coord = arc_proportion * dash_ratio / dash_length - dash_phase;
+        v_dash_ratio = dash_ratio;
+    }else{
+        v_dash_coord = 0.0;
+        v_dash_ratio = 1.0;
+    }
+    v_partial_bounds = vec2(partial_start, partial_end);
 }
\ No newline at end of file
@@ -3,7 +3,8 @@
 in vec3 point;
 
 #INSERT emit_gl_Position.glsl
+#INSERT apply_model_matrix.glsl
 
 void main(){
-    emit_gl_Position(point);
+    emit_gl_Position(model_point(point));
 }
\ No newline at end of file
@@ -3,17 +3,22 @@
 in vec3 point;
 in vec3 d_normal_point;
 in vec4 rgba;
+in float opacity_multiplier;
+in vec4 tint;
 
 out vec4 v_color;
 
 #INSERT emit_gl_Position.glsl
 #INSERT get_unit_normal.glsl
 #INSERT finalize_color.glsl
+#INSERT apply_model_matrix.glsl
+#INSERT apply_opacity_and_tint.glsl
 
 const float EPSILON = 1e-10;
 
 void main(){
-    emit_gl_Position(point);
-    vec3 unit_normal = normalize(d_normal_point - point);
-    v_color = finalize_color(rgba, point, unit_normal);
+    vec3 m_point = model_point(point);
+    emit_gl_Position(m_point);
+    vec3 unit_normal = normalize(model_point(d_normal_point) - m_point);
+    v_color = finalize_color(apply_opacity_and_tint(rgba, opacity_multiplier, tint), m_point, unit_normal);
 }
\ No newline at end of file
@@ -8,10 +8,13 @@ in vec3 v_point;
 in vec3 v_unit_normal;
 in vec2 v_im_coords;
 in float v_opacity;
+in float v_opacity_multiplier;
+in vec4 v_tint;
 
 out vec4 frag_color;
 
 #INSERT finalize_color.glsl
+#INSERT apply_opacity_and_tint.glsl
 
 const float dark_shift = 0.2;
 
@@ -27,11 +30,12 @@ void main() {
         color = mix(dark_color, color, alpha);
     }
     if (color.a == 0) discard;
+    color = apply_opacity_and_tint(color, v_opacity_multiplier, v_tint);
 
     frag_color = finalize_color(
         color,
         v_point,
         v_unit_normal
     );
-    frag_color.a = v_opacity;
+    frag_color.a = v_opacity * v_opacity_multiplier;
 }
\ No newline at end of file
@@ -4,24 +4,31 @@ in vec3 point;
 in vec3 d_normal_point;
 in vec2 im_coords;
 in float opacity;
+in float opacity_multiplier;
+in vec4 tint;
 
 out vec3 v_point;
 out vec3 v_unit_normal;
 out vec2 v_im_coords;
 out float v_opacity;
+out float v_opacity_multiplier;
+out vec4 v_tint;
 
 uniform float is_sphere;
 uniform vec3 center;
 
 #INSERT emit_gl_Position.glsl
 #INSERT get_unit_normal.glsl
+#INSERT apply_model_matrix.glsl
 
 const float EPSILON = 1e-10;
 
 void main(){
-    v_point = point;
-    v_unit_normal = normalize(d_normal_point - point);;
+    v_point = model_point(point);
+    v_unit_normal = normalize(model_point(d_normal_point) - v_point);
     v_im_coords = im_coords;
     v_opacity = opacity;
-    emit_gl_Position(point);
+    v_opacity_multiplier = opacity_multiplier;
+    v_tint = tint;
+    emit_gl_Position(v_point);
 }
\ No newline at end of file
@@ -3,14 +3,18 @@
 in vec3 point;
 in float radius;
 in vec4 rgba;
+in float opacity_multiplier;
+in vec4 tint;
 
 out vec3 v_point;
 out float v_radius;
 out vec4 v_rgba;
 
+#INSERT apply_model_matrix.glsl
+#INSERT apply_opacity_and_tint.glsl
 
 void main(){
-    v_point = point;
+    v_point = model_point(point);
     v_radius = radius;
-    v_rgba = rgba;
+    v_rgba = apply_opacity_and_tint(rgba, opacity_multiplier, tint);
 }
\ No newline at end of file
@@ -91,12 +91,158 @@ def partial_quadratic_bezier_points(
     return [h0, h1, h2]
 
 
+def subdivide_quadratic_bezier_points(
+    points: VectNArray,
+    n_subdivisions: Sequence[int] | np.ndarray,
+) -> VectNArray:
+    """
+    Given the points of a path of quadratic bezier curves, each sharing an
+    anchor with the next, splits the nth curve into n_subdivisions[n] + 1
+    pieces of equal parameter range, with the same results as applying
+    partial_quadratic_bezier_points to each piece
+    """
+    points = np.asarray(points)
+    n_subdivisions = np.asarray(n_subdivisions, dtype=int)
+    n_pieces = n_subdivisions + 1
+    # For each piece, the index of its curve and its place along that curve
+    curve_indices = np.repeat(np.arange(len(n_pieces)), n_pieces)
+    piece_indices = np.arange(len(curve_indices)) - np.repeat(np.cumsum(n_pieces) - n_pieces, n_pieces)
+    steps = 1.0 / n_pieces[curve_indices]
+    a = (piece_indices * steps)[:, np.newaxis]
+    b = ((piece_indices + 1) * steps)[:, np.newaxis]
+    b[piece_indices + 1 == n_pieces[curve_indices]] = 1.0
+
+    p0 = points[0:-1:2][curve_indices]
+    p1 = points[1::2][curve_indices]
+    p2 = points[2::2][curve_indices]
+
+    def curve(t):
+        return p0 * (1 - t) * (1 - t) + 2 * p1 * t * (1 - t) + p2 * t * t
+
+    h0 = np.where(a > 0, curve(a), p0)
+    h2 = np.where(b < 1, curve(b), p2)
+    h1_prime = (1 - a) * p1 + a * p2
+    end_prop = (b - a) / (1. - a)
+    h1 = (1 - end_prop) * h0 + end_prop * h1_prime
+
+    result = np.empty((2 * len(curve_indices) + 1, points.shape[1]), dtype=h1.dtype)
+    result[0] = points[0]
+    result[1::2] = h1
+    result[2::2] = h2
+    return result
+
+
+def distribute_subdivisions(
+    lengths: FloatArray,
+    group_sizes: Sequence[int] | np.ndarray,
+    group_subdivisions: Sequence[int] | np.ndarray,
+) -> np.ndarray:
+    """
+    Splits lengths into consecutive groups of the given sizes, and hands out
+    the subdivisions for each group one at a time, each going to the entry
+    of that group with the largest length / (1 + subdivisions so far), the
+    first such on ties.  Returns the number of subdivisions for each entry.
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    group_sizes = np.asarray(group_sizes, dtype=int)
+    group_subdivisions = np.asarray(group_subdivisions, dtype=int)
+    groups = np.repeat(np.arange(len(group_sizes)), group_sizes)
+    group_starts = np.cumsum(group_sizes) - group_sizes
+    totals = np.bincount(groups, weights=lengths, minlength=len(group_sizes))
+
+    # The last subdivision handed out in a group of size m with n subdivisions
+    # goes to a value of at least total / (n + m), so no entry gets more than
+    # length * (n + m) / total, which bounds the candidates to consider
+    n = group_subdivisions[groups]
+    bound = np.zeros(len(lengths))
+    np.divide(lengths * (n + group_sizes[groups]), totals[groups], out=bound, where=totals[groups] > 0)
+    max_counts = np.minimum(np.floor(bound).astype(int) + 2, n)
+    max_counts[totals[groups] == 0] = 0
+    # When all lengths in a group are zero, the first entry gets everything
+    all_zero = (totals == 0) & (group_sizes > 0)
+    max_counts[group_starts[all_zero]] = group_subdivisions[all_zero]
+
+    # Value of each entry after each possible number of subdivisions,
+    # found the same way as scaling the length by k / (k + 1) repeatedly
+    entries = np.repeat(np.arange(len(lengths)), max_counts)
+    starts = np.cumsum(max_counts) - max_counts
+    counts = np.arange(len(entries)) - starts[entries]
+    values = np.empty(len(entries))
+    values[starts[max_counts > 0]] = lengths[max_counts > 0]
+    for k in range(1, max_counts.max(initial=0)):
+        indices = starts[max_counts > k] + k
+        values[indices] = values[indices - 1] * (k / (k + 1))
+
+    # Hand out subdivisions in order of value within each group
+    entry_groups = groups[entries]
+    order = np.lexsort((counts, entries, -values, entry_groups))
+    sorted_groups = entry_groups[order]
+    ranks = np.arange(len(order)) - np.searchsorted(sorted_groups, sorted_groups)
+    chosen = entries[order][ranks < group_subdivisions[sorted_groups]]
+    return np.bincount(chosen, minlength=len(lengths))
+
+
+def quadratic_bezier_lengths(
+    anchors1: VectNArray,
+    handles: VectNArray,
+    anchors2: VectNArray,
+) -> FloatArray:
+    """
+    Arc lengths of the quadratic bezier curves with the given control
+    points, computed in closed form.  The speed along such a curve is
+    2|a t + b|, for a = anchor1 - 2 handle + anchor2 and b = handle - anchor1
+    """
+    a = np.asarray(anchors1 - 2 * handles + anchors2, dtype=float)
+    b = np.asarray(handles - anchors1, dtype=float)
+    A = (a * a).sum(-1)
+    B = 2 * (a * b).sum(-1)
+    C = (b * b).sum(-1)
+    # Four times the squared norm of a cross b
+    disc = 4 * A * C - B * B
+
+    # Curves whose control points are all but collinear trace out a line,
+    # possibly doubling back at the point where the speed hits zero
+    flat = disc <= 1e-12 * (A * C + 1e-100)
+    t_turn = np.clip(-0.5 * B / np.where(A > 0, A, 1), 0, 1)[..., np.newaxis]
+    turn_point = (1 - t_turn)**2 * anchors1 + 2 * (1 - t_turn) * t_turn * handles + t_turn**2 * anchors2
+    result = np.linalg.norm(turn_point - anchors1, axis=-1) + np.linalg.norm(anchors2 - turn_point, axis=-1)
+
+    # Otherwise, use the antiderivative of sqrt(A t^2 + B t + C)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rA = np.sqrt(A)
+        q0 = np.sqrt(C)
+        q1 = np.sqrt(A + B + C)
+        log_term = np.log((2 * rA * q1 + 2 * A + B) / (2 * rA * q0 + B))
+        exact = ((2 * A + B) * q1 - B * q0) / (2 * A) + disc * log_term / (4 * A * rA)
+    return np.where(flat, result, exact)
+
+
 # Linear interpolation variants
 
 
-def interpolate(start: Scalable, end: Scalable, alpha: float | VectN) -> Scalable:
+def interpolate(
+    start: Scalable,
+    end: Scalable,
+    alpha: float | VectN,
+    out: FloatArray | None = None
+) -> Scalable:
+    """
+    If out is given, the result is written into it, without
+    allocating any temporary arrays where possible
+    """
     try:
-        return (1 - alpha) * start + alpha * end
+        if out is None:
+            return (1 - alpha) * start + alpha * end
+        if np.may_share_memory(out, start) or np.may_share_memory(out, end):
+            out[...] = (1 - alpha) * start + alpha * end
+        elif np.ndim(alpha) == 0 and alpha == 1:
+            np.copyto(out, end)
+        else:
+            # Computes start + alpha * (end - start) in place
+            np.subtract(end, start, out=out)
+            np.multiply(out, alpha, out=out)
+            np.add(out, start, out=out)
+        return out
     except TypeError:
         log.debug(f"`start` parameter with type `{type(start)}` and dtype `{start.dtype}`")
         log.debug(f"`end` parameter with type `{type(end)}` and dtype `{end.dtype}`")
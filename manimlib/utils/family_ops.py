@@ -15,8 +15,7 @@ def extract_mobject_family_members(
     return [
         sm
         for mob in mobject_list
-        for sm in mob.get_family()
-        if (not exclude_pointless) or sm.has_points()
+        for sm in (mob.family_members_with_points() if exclude_pointless else mob.get_family())
     ]
 
 
@@ -22,7 +22,8 @@ STRAIGHT_PATH_THRESHOLD = 0.01
 def straight_path(
     start_points: np.ndarray,
     end_points: np.ndarray,
-    alpha: float
+    alpha: float,
+    out: np.ndarray | None = None
 ) -> np.ndarray:
     """
     Same function as interpolate, but renamed to reflect
@@ -30,7 +31,11 @@ def straight_path(
     to another set.  For instance, it should be a specific case
     of path_along_arc
     """
-    return interpolate(start_points, end_points, alpha)
+    return interpolate(start_points, end_points, alpha, out=out)
+
+
+# Path functions with this attribute set accept an out array to write into
+straight_path.accepts_out = True
 
 
 def path_along_arc(
@@ -47,14 +52,30 @@ def path_along_arc(
         axis = OUT
     unit_axis = axis / get_norm(axis)
 
-    def path(start_points, end_points, alpha):
+    # For vects = end_points - start_points, the arc centers are
+    # start_points + vects @ center_matrix, so rotating start_points
+    # about them gives start_points + vects @ center_matrix @ (I - R)
+    center_matrix = 0.5 * np.identity(3)
+    if arc_angle != np.pi:
+        center_matrix += 0.5 * np.cross(unit_axis, np.identity(3)) / math.tan(arc_angle / 2)
+    last_transform = [None, None]
+
+    def path(start_points, end_points, alpha, out=None):
+        if last_transform[0] != alpha:
+            rot_matrix_T = rotation_matrix_transpose(alpha * arc_angle, unit_axis)
+            last_transform[:] = [alpha, center_matrix @ (np.identity(3) - rot_matrix_T)]
+        transform = last_transform[1]
         vects = end_points - start_points
-        centers = start_points + 0.5 * vects
-        if arc_angle != np.pi:
-            centers += np.cross(unit_axis, vects / 2.0) / math.tan(arc_angle / 2)
-        rot_matrix_T = rotation_matrix_transpose(alpha * arc_angle, unit_axis)
-        return centers + np.dot(start_points - centers, rot_matrix_T)
-
+        if out is None:
+            return start_points + vects @ transform
+        if out.shape != vects.shape:
+            out[...] = start_points + vects @ transform
+            return out
+        np.matmul(vects, transform, out=out)
+        np.add(out, start_points, out=out)
+        return out
+
+    path.accepts_out = True
     return path
 
 
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+# Layout: magic, buffer count and header length, a table of (offset, size)
+# for each buffer, the header, then the raw buffers, each starting on a
+# multiple of BUFFER_ALIGNMENT.  The header is a pickle (protocol 5) of the
+# object, holding its structure and class names, with numpy arrays larger
+# than MIN_OUT_OF_BAND_SIZE left out of band and stored as raw buffers.
+MAGIC = b"MANIMOB1"
+BUFFER_ALIGNMENT = 64
+MIN_OUT_OF_BAND_SIZE = 1024
+HEADER_DTYPE = np.dtype("<u8")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+
+def _to_parts(obj: Any) -> tuple[bytes, list[memoryview]]:
+    buffers = []
+
+    def buffer_callback(buff: pickle.PickleBuffer) -> bool:
+        # Returning True keeps the buffer in the header
+        if buff.raw().nbytes < MIN_OUT_OF_BAND_SIZE:
+            return True
+        buffers.append(buff.raw())
+        return False
+
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
+    return header, buffers
+
+
+def _get_buffer_table(header: bytes, buffers: list[memoryview]) -> np.ndarray:
+    prefix_size = len(MAGIC) + HEADER_DTYPE.itemsize * (2 + 2 * len(buffers))
+    table = np.zeros((len(buffers), 2), dtype=HEADER_DTYPE)
+    offset = prefix_size + len(header)
+    for row, buff in zip(table, buffers):
+        offset = _aligned(offset)
+        row[:] = (offset, buff.nbytes)
+        offset += buff.nbytes
+    return table
+
+
+def _iter_chunks(obj: Any):
+    header, buffers = _to_parts(obj)
+    table = _get_buffer_table(header, buffers)
+    yield MAGIC
+    yield np.array([len(buffers), len(header)], dtype=HEADER_DTYPE).tobytes()
+    yield table.tobytes()
+    yield header
+    position = len(MAGIC) + HEADER_DTYPE.itemsize * (2 + table.size) + len(header)
+    for (offset, size), buff in zip(table, buffers):
+        yield bytes(int(offset) - position)
+        yield buff
+        position = int(offset + size)
+
+
+def dumps(obj: Any) -> bytes:
+    return b"".join(_iter_chunks(obj))
+
+
+def dump(obj: Any, file_path: str) -> None:
+    with open(file_path, "wb") as fp:
+        for chunk in _iter_chunks(obj):
+            fp.write(chunk)
+
+
+def is_serialized(data: bytes | memoryview) -> bool:
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def _from_buffer(data: np.ndarray) -> Any:
+    # data is a uint8 array, either in memory or memory mapped
+    start = len(MAGIC)
+    n_buffers, header_len = data[start:start + 2 * HEADER_DTYPE.itemsize].view(HEADER_DTYPE)
+    start += 2 * HEADER_DTYPE.itemsize
+    table = data[start:start + 2 * n_buffers * HEADER_DTYPE.itemsize].view(HEADER_DTYPE).reshape(-1, 2)
+    start += table.nbytes
+    header = data[start:start + header_len].tobytes()
+    # Arrays are views into data, so nothing is copied
+    buffers = [data[offset:offset + size] for offset, size in table]
+    return pickle.loads(header, buffers=buffers)
+
+
+def loads(data: bytes | memoryview) -> Any:
+    if not is_serialized(data):
+        raise ValueError("Data not in the serialized mobject format")
+    return _from_buffer(np.frombuffer(data, dtype=np.uint8))
+
+
+def load(file_path: str, mode: str = "c") -> Any:
+    """
+    Reads an object written with dump, memory mapping its arrays, so that
+    their contents are only read from disk as they're accessed.  With the
+    default mode "c", those arrays may be written to without the changes
+    making it back to the file.
+    """
+    data = np.memmap(file_path, dtype=np.uint8, mode=mode)
+    if not is_serialized(data):
+        raise ValueError(f"{file_path} not in the serialized mobject format")
+    return _from_buffer(data)
@@ -76,6 +76,73 @@ def set_program_uniform(
     return True
 
 
+# Maps numpy scalar types to how moderngl should read them, where
+# uint8 values are normalized to floats in [0, 1] as they're read
+VERTEX_FORMAT_CODES: dict[np.dtype, str] = {
+    np.dtype(np.float32): "f",
+    np.dtype(np.float16): "f2",
+    np.dtype(np.uint8): "f1",
+}
+
+
+def get_vertex_format(dtype: np.dtype, fields: Sequence[str]) -> str:
+    """
+    Returns the moderngl format string reading the given fields
+    out of vertex data with this dtype, skipping over all others.
+    The fields must be listed in the same order as in the dtype.
+    """
+    parts = []
+    padding = 0
+    for name in dtype.names:
+        sub_dtype = dtype[name]
+        if name not in fields:
+            padding += sub_dtype.itemsize
+            continue
+        if padding > 0:
+            parts.append(f"{padding}x")
+            padding = 0
+        if sub_dtype.base not in VERTEX_FORMAT_CODES:
+            raise ValueError(f"Unsupported vertex data type {sub_dtype.base} for {name}")
+        if dtype.fields[name][1] % 4 != 0:
+            # Some drivers reject, or are slow with, unaligned vertex attributes
+            raise ValueError(f"Vertex data field {name} does not start on a 4-byte boundary")
+        size = int(np.prod(sub_dtype.shape))
+        parts.append(f"{size}{VERTEX_FORMAT_CODES[sub_dtype.base]}")
+    if padding > 0:
+        parts.append(f"{padding}x")
+    return " ".join(parts)
+
+
+def pack_vertex_data(data: np.ndarray, packed_dtype: np.dtype) -> np.ndarray:
+    """
+    Copies float vertex data into a more compact layout, where any
+    uint8 fields are taken to hold values normalized from [0, 1]
+    """
+    result = np.empty(len(data), dtype=packed_dtype)
+    for name in packed_dtype.names:
+        if packed_dtype[name].base == np.uint8:
+            result[name] = np.round(255 * np.clip(data[name], 0, 1))
+        else:
+            result[name] = data[name]
+    return result
+
+
+def concatenate_records(data_list: Sequence[np.ndarray], out: np.ndarray) -> np.ndarray:
+    """
+    Same as np.concatenate(data_list, out=out), but for contiguous arrays sharing
+    the dtype of out, the records are copied as raw bytes, which for structured
+    dtypes is several times faster
+    """
+    if out.flags.c_contiguous and all(
+        data.dtype == out.dtype and data.flags.c_contiguous
+        for data in data_list
+    ):
+        np.concatenate([data.view(np.uint8) for data in data_list], out=out.view(np.uint8))
+    else:
+        np.concatenate(data_list, out=out)
+    return out
+
+
 @lru_cache()
 def get_shader_code_from_file(filename: str) -> str | None:
     if not filename:
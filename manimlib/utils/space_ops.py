@@ -1,25 +1,25 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
-import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
 import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 from scipy.spatial.transform import Rotation
-from tqdm.auto import tqdm as ProgressDisplay
 
 from manimlib.constants import DOWN, OUT, RIGHT, UP
 from manimlib.constants import PI, TAU
-from manimlib.utils.iterables import adjacent_pairs
 from manimlib.utils.simple_functions import clip
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Sequence, List, Tuple
-    from manimlib.typing import Vect2, Vect3, Vect4, VectN, Matrix3x3, Vect3Array, Vect2Array
+    from manimlib.typing import Vect2, Vect3, Vect4, VectN, Matrix3x3, Vect3Array, Vect2Array, VectNArray
 
 
 def cross(
@@ -175,6 +175,22 @@ def rotation_between_vectors(v1: Vect3, v2: Vect3) -> Matrix3x3:
     )
 
 
+def get_affine_matrix(
+    linear_map: Matrix3x3 | None = None,
+    translation: Vect3 | None = None,
+) -> np.ndarray:
+    """
+    Returns the 4x4 matrix acting on homogeneous coordinates
+    by the map p -> linear_map(p) + translation
+    """
+    result = np.identity(4)
+    if linear_map is not None:
+        result[:3, :3] = linear_map
+    if translation is not None:
+        result[:3, 3] = translation
+    return result
+
+
 def z_to_vector(vector: Vect3) -> Matrix3x3:
     return rotation_between_vectors(OUT, vector)
 
@@ -369,12 +385,13 @@ def get_closest_point_on_line(a: VectN, b: VectN, p: VectN) -> VectN:
 
 
 def get_winding_number(points: Sequence[Vect2 | Vect3]) -> float:
-    total_angle = 0
-    for p1, p2 in adjacent_pairs(points):
-        d_angle = angle_of_vector(p2) - angle_of_vector(p1)
-        d_angle = ((d_angle + PI) % TAU) - PI
-        total_angle += d_angle
-    return total_angle / TAU
+    if len(points) == 0:
+        return 0.0
+    points = np.array(points, dtype=float)
+    angles = np.arctan2(points[:, 1], points[:, 0])
+    d_angles = np.roll(angles, -1) - angles
+    d_angles = ((d_angles + PI) % TAU) - PI
+    return float(d_angles.sum() / TAU)
 
 
 ##
@@ -419,6 +436,84 @@ def norm_squared(v: VectN | List[float]) -> float:
     return sum(x * x for x in v)
 
 
+def match_points_by_position(points1: VectNArray, points2: VectNArray) -> np.ndarray:
+    """
+    Returns indices such that pairing each of points1 with the corresponding
+    entry of points2[indices] keeps the total distance small, as with
+    linear_sum_assignment on the matrix of distances between them.
+
+    Points which are each other's nearest neighbor, with the next nearest
+    points on either side more than four times as far, are paired directly, and
+    the assignment problem is only solved within clusters of the rest.
+    """
+    points1 = np.asarray(points1, dtype=float)
+    points2 = np.asarray(points2, dtype=float)
+    n = len(points1)
+    if n != len(points2) or n < 3:
+        return linear_sum_assignment(cdist(points1, points2))[1]
+
+    dists12, nearest12 = cKDTree(points2).query(points1, k=2)
+    dists21, nearest21 = cKDTree(points1).query(points2, k=2)
+    nearest = nearest12[:, 0]
+    is_clear = np.all([
+        nearest21[nearest, 0] == np.arange(n),
+        4 * dists12[:, 0] < dists12[:, 1],
+        4 * dists12[:, 0] < dists21[nearest, 1],
+    ], axis=0)
+    result = nearest.copy()
+    rest1 = np.flatnonzero(~is_clear)
+    rest2 = np.setdiff1d(np.arange(n), nearest[is_clear])
+    n_rest = len(rest1)
+    if n_rest == 0:
+        return result
+
+    # Clusters link each remaining point to its nearest few on the other side
+    k = min(3, n_rest)
+    near12 = cKDTree(points2[rest2]).query(points1[rest1], k=k)[1].reshape(n_rest, k)
+    near21 = cKDTree(points1[rest1]).query(points2[rest2], k=k)[1].reshape(n_rest, k)
+    sources = np.repeat(np.arange(2 * n_rest), k)
+    targets = np.hstack([near12.ravel() + n_rest, near21.ravel()])
+    graph = coo_matrix((np.ones(len(sources)), (sources, targets)), shape=(2 * n_rest, 2 * n_rest))
+    n_clusters, labels = connected_components(graph, directed=False)
+    labels1, labels2 = labels[:n_rest], labels[n_rest:]
+    # Clusters with more points on one side than the other are solved together
+    is_balanced = np.bincount(labels1, minlength=n_clusters) == np.bincount(labels2, minlength=n_clusters)
+    labels1 = np.where(is_balanced[labels1], labels1, -1)
+    labels2 = np.where(is_balanced[labels2], labels2, -1)
+
+    order1 = np.argsort(labels1, kind="stable")
+    order2 = np.argsort(labels2, kind="stable")
+    splits = np.flatnonzero(np.diff(labels1[order1])) + 1
+    for group1, group2 in zip(np.split(rest1[order1], splits), np.split(rest2[order2], splits)):
+        cols = linear_sum_assignment(cdist(points1[group1], points2[group2]))[1]
+        result[group1] = group2[cols]
+    return result
+
+
+EARCUT_CACHE: dict[tuple[bytes, tuple[int, ...]], np.ndarray] = {}
+EARCUT_CACHE_SIZE = 1000
+
+
+def cached_earcut(verts: Vect2Array, ring_ends: list[int]) -> np.ndarray:
+    """
+    Runs earcut on a polygon, reusing the triangulation found for any
+    earlier polygon of the same shape up to translation and scale, as
+    with repeated glyphs of text.
+    """
+    verts = np.asarray(verts, dtype=np.float32)
+    shifted = verts - verts[0]
+    size = max(float(np.abs(shifted).max()), 1e-12)
+    key = (
+        np.round(shifted * (2**20 / size)).astype(np.int32).tobytes(),
+        tuple(ring_ends),
+    )
+    if key not in EARCUT_CACHE:
+        if len(EARCUT_CACHE) >= EARCUT_CACHE_SIZE:
+            EARCUT_CACHE.pop(next(iter(EARCUT_CACHE)))
+        EARCUT_CACHE[key] = earcut(verts, np.array(ring_ends, dtype=np.uint32))
+    return EARCUT_CACHE[key]
+
+
 # TODO, fails for polygons drawn over themselves
 def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> list[int]:
     """
@@ -438,14 +533,11 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
     epsilon = 1e-6
 
     def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
+        return abs(abs(get_winding_number(verts[rings[ring_id]] - point)) - 1) < epsilon
 
     def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
+        ring_verts = verts[rings[ring_id]]
+        return abs(cross2d(ring_verts[1:], ring_verts[:-1]).sum()) / 2
 
     # Points at the same position may cause problems
     for i in rings:
@@ -456,44 +548,61 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
 
     # First, we should know which rings are directly contained in it for each ring
 
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    n_rings = len(rings)
+    ring_starts = [ring[0] for ring in rings]
+    ring_verts = verts[:ring_ends[-1]]
+    right = np.maximum.reduceat(ring_verts[:, 0], ring_starts)
+    left = np.minimum.reduceat(ring_verts[:, 0], ring_starts)
+    top = np.maximum.reduceat(ring_verts[:, 1], ring_starts)
+    bottom = np.minimum.reduceat(ring_verts[:, 1], ring_starts)
+    area = [ring_area(i) for i in range(n_rings)]
 
     # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
+    rings_sorted = list(range(n_rings))
     rings_sorted.sort(key=lambda x: area[x], reverse=True)
 
+    # Any ring containing another has a bounding box covering the first point
+    # of that other ring, so rings are indexed by the cells of a grid which
+    # their bounding boxes overlap, and only those in the cell of that point
+    # need checking
+    grid_size = max(int(math.sqrt(n_rings)), 1)
+
+    def to_cells(values, low, high):
+        scale = grid_size / max(high - low, epsilon)
+        return np.clip(((values - low) * scale).astype(int), 0, grid_size - 1).tolist()
+
+    x_min, x_max = left.min(), right.max()
+    y_min, y_max = bottom.min(), top.max()
+    first_x = to_cells(verts[ring_starts, 0], x_min, x_max)
+    first_y = to_cells(verts[ring_starts, 1], y_min, y_max)
+    x0s, x1s = to_cells(left, x_min, x_max), to_cells(right, x_min, x_max)
+    y0s, y1s = to_cells(bottom, y_min, y_max), to_cells(top, y_min, y_max)
+    right, left, top, bottom = right.tolist(), left.tolist(), top.tolist(), bottom.tolist()
+
     def is_in_fast(ring_a, ring_b):
         # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
+        return (
+            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b]
+            and bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b]
+            and is_in(verts[rings[ring_a][0]], ring_b)
+        )
 
     chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
-        leave=False,
-        ascii=True if platform.system() == 'Windows' else None,
-        dynamic_ncols=True,
-        desc="SVG Triangulation",
-        delay=3,
-    )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
+    grid = [[[] for y in range(grid_size)] for x in range(grid_size)]
+    for i in rings_sorted:
+        # Cells list rings from largest to smallest, all larger than i
+        for j in reversed(grid[first_x[i]][first_y[i]]):
             if is_in_fast(i, j):
                 chilren[j].append(i)
                 break
+        for x in range(x0s[i], x1s[i] + 1):
+            for y in range(y0s[i], y1s[i] + 1):
+                grid[x][y].append(i)
 
     res = []
 
     # Then, we can use earcut for each part
-    used = [False] * len(rings)
+    used = [False] * n_rings
     for i in rings_sorted:
         if used[i]:
             continue
@@ -503,6 +612,6 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
             used[j] = True
             v += rings[j]
             ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
+        res += np.array(v)[cached_earcut(verts[v, :2], ring_ends)].tolist()
 
     return res